@@ -20,7 +20,8 @@ sys.path.append(os.path.abspath("../"))
 sys.path.append(os.path.abspath("./"))
 
 
-# Import tango
+# Import tango, with all the docstrings set at import time
+os.environ["PYTANGO_LAZY_DOC"] = "0"
 try:
     import tango
 except ImportError:
@@ -118,6 +118,7 @@ def set_device_proxy_implementations(module):
 def set_extract_as_implementation(module):
     attrs = {
         "__module__": module.__name__,
+        "Buffer": None,
         "ByteArray": None,
         "Bytes": None,
         "List": None,
@@ -0,0 +1,63 @@
+"""Compare the two ways asyncio DeviceProxy calls can be run:
+
+ * executor: each call blocks a thread of the executor (default)
+ * ami: each call is a native asynchronous request (set_asyncio_ami)
+
+by awaiting 10, 100 and 1000 concurrent attribute reads and commands:
+
+   $ python asyncio_ami_benchmark.py
+"""
+
+import time
+import asyncio
+import threading
+
+from tango import AttrWriteType
+from tango.asyncio import DeviceProxy
+from tango.server import Device, attribute, command
+from tango.test_context import DeviceTestContext
+
+CONCURRENCY = (10, 100, 1000)
+
+
+class BenchDevice(Device):
+    @attribute(dtype=float, access=AttrWriteType.READ)
+    def value(self):
+        return 1.0
+
+    @command(dtype_in=float, dtype_out=float)
+    def identity(self, arg):
+        return arg
+
+
+async def run(proxy, concurrency):
+    calls = []
+    for i in range(concurrency):
+        if i % 2:
+            calls.append(proxy.read_attribute("value"))
+        else:
+            calls.append(proxy.command_inout("identity", float(i)))
+    start = time.perf_counter()
+    await asyncio.gather(*calls)
+    return time.perf_counter() - start
+
+
+async def main(device_name):
+    print(f"{'mode':>10} {'requests':>10} {'time (ms)':>10} {'threads':>10}")
+    for ami in (False, True):
+        proxy = await DeviceProxy(device_name)
+        proxy.set_asyncio_ami(ami)
+        # warm up the connection and the interface caches
+        await run(proxy, 10)
+        for concurrency in CONCURRENCY:
+            duration = await run(proxy, concurrency) * 1000.0
+            mode = "ami" if ami else "executor"
+            threads = threading.active_count()
+            print(f"{mode:>10} {concurrency:>10} {duration:>10.1f} {threads:>10}")
+
+
+if __name__ == "__main__":
+    context = DeviceTestContext(BenchDevice, process=True)
+    with context:
+        loop = asyncio.get_event_loop()
+        loop.run_until_complete(main(context.get_device_access()))
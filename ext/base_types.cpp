@@ -262,6 +262,7 @@ void export_base_types()
         .value("List", PyTango::ExtractAsList)
         .value("String", PyTango::ExtractAsString)
         .value("Nothing", PyTango::ExtractAsNothing)
+        .value("Buffer", PyTango::ExtractAsBuffer)
     ;
 
     enum_<PyTango::GreenMode>("GreenMode")
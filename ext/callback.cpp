@@ -10,6 +10,8 @@
 ******************************************************************************/
 
 #include "precompiled_header.hpp"
+#include <algorithm>
+#include <chrono>
 #include "pytgutils.h"
 #include "callback.h"
 #include "device_attribute.h"
@@ -339,6 +341,228 @@ void PyCallBackPushEvent::fill_py_event(Tango::DevIntrChangeEventData* ev, objec
     _push_event(this, ev);
 }
 
+PyCallBackBatchPushEvent::State::State(std::size_t max_batch, double max_latency, bool coalesce)
+    : max_batch(max_batch > 0 ? max_batch : 1),
+      max_latency(max_latency > 0 ? max_latency : 0),
+      coalesce(coalesce),
+      flush(false),
+      stop(false),
+      received(0),
+      coalesced(0),
+      dispatched(0),
+      batches(0)
+{}
+
+PyCallBackBatchPushEvent::PyCallBackBatchPushEvent(std::size_t max_batch, double max_latency, bool coalesce)
+    : m_state(std::make_shared<State>(max_batch, max_latency, coalesce))
+{
+    m_thread = std::thread(&PyCallBackBatchPushEvent::run, m_state, this);
+}
+
+PyCallBackBatchPushEvent::~PyCallBackBatchPushEvent()
+{
+    stop();
+    std::lock_guard<std::mutex> lock(m_state->mutex);
+    for (auto ev : m_state->queue)
+        delete ev;
+    m_state->queue.clear();
+    m_state->index.clear();
+}
+
+void PyCallBackBatchPushEvent::stop()
+{
+    {
+        std::lock_guard<std::mutex> lock(m_state->mutex);
+        m_state->stop = true;
+    }
+    m_state->cond.notify_all();
+    if (!m_thread.joinable())
+        return;
+    if (m_thread.get_id() == std::this_thread::get_id())
+    {
+        // Deleted from its own push_events callback: the dispatcher only
+        // uses its own reference to the state from now on
+        m_thread.detach();
+        return;
+    }
+    // The dispatcher may be waiting for the GIL: release it while joining
+    if (Py_IsInitialized() && PyGILState_Check())
+    {
+        AutoPythonAllowThreads guard;
+        m_thread.join();
+    }
+    else
+    {
+        m_thread.join();
+    }
+}
+
+/*virtual*/ void PyCallBackBatchPushEvent::push_event(Tango::EventData *ev)
+{
+    // Make a copy of ev (the original will be deleted by TangoC++ on return).
+    // Nothing here needs the GIL.
+    State &state = *m_state;
+    Tango::EventData* ev_copy = new Tango::EventData(*ev);
+    Tango::EventData* old = 0;
+    {
+        std::lock_guard<std::mutex> lock(state.mutex);
+        if (state.stop)
+        {
+            delete ev_copy;
+            return;
+        }
+        ++state.received;
+        if (state.coalesce)
+        {
+            std::string key = ev->attr_name + "#" + ev->event;
+            auto it = state.index.find(key);
+            if (it != state.index.end())
+            {
+                // keep the position of the first event, the value of the last
+                old = state.queue[it->second];
+                state.queue[it->second] = ev_copy;
+                ++state.coalesced;
+            }
+            else
+            {
+                state.index[key] = state.queue.size();
+                state.queue.push_back(ev_copy);
+            }
+        }
+        else
+        {
+            state.queue.push_back(ev_copy);
+        }
+    }
+    delete old;
+    state.cond.notify_one();
+}
+
+void PyCallBackBatchPushEvent::flush()
+{
+    {
+        std::lock_guard<std::mutex> lock(m_state->mutex);
+        // Nothing to flush: do not shorten the latency of the next event
+        if (m_state->queue.empty())
+            return;
+        m_state->flush = true;
+    }
+    m_state->cond.notify_one();
+}
+
+boost::python::dict PyCallBackBatchPushEvent::get_statistics()
+{
+    std::lock_guard<std::mutex> lock(m_state->mutex);
+    boost::python::dict stats;
+    stats["received"] = m_state->received;
+    stats["coalesced"] = m_state->coalesced;
+    stats["dispatched"] = m_state->dispatched;
+    stats["batches"] = m_state->batches;
+    stats["queued"] = m_state->queue.size();
+    return stats;
+}
+
+/*static*/ void PyCallBackBatchPushEvent::run(std::shared_ptr<State> state, PyCallBackBatchPushEvent *self)
+{
+    // self is only used to dispatch, which returns as soon as the callback
+    // has been stopped
+    const auto latency = std::chrono::duration_cast<std::chrono::steady_clock::duration>(
+        std::chrono::duration<double>(state->max_latency));
+    std::unique_lock<std::mutex> lock(state->mutex);
+    while (true)
+    {
+        state->cond.wait(lock, [&state] { return state->stop || !state->queue.empty(); });
+        if (state->stop)
+            break;
+        // Wait for a full batch, a flush or the latency deadline
+        auto deadline = std::chrono::steady_clock::now() + latency;
+        state->cond.wait_until(lock, deadline, [&state] {
+            return state->stop || state->flush || state->queue.size() >= state->max_batch;
+        });
+        if (state->stop)
+            break;
+        std::vector<Tango::EventData*> batch;
+        batch.swap(state->queue);
+        state->index.clear();
+        state->flush = false;
+        lock.unlock();
+        try
+        {
+            self->dispatch(state, batch);
+        }
+        catch (...)
+        {
+            TANGO_LOG_DEBUG << "Unexpected error dispatching a batch of "
+                            << "Tango events" << std::endl;
+        }
+        for (auto ev : batch)
+            delete ev;
+        lock.lock();
+    }
+}
+
+void PyCallBackBatchPushEvent::dispatch(const std::shared_ptr<State> &state, std::vector<Tango::EventData*> &batch)
+{
+    // If the events are received after python dies but before the process
+    // finishes then discard them
+    if (!Py_IsInitialized())
+    {
+        TANGO_LOG_DEBUG << batch.size() << " Tango events received after "
+                        << "python shutdown. Events will be ignored" << std::endl;
+        return;
+    }
+
+    AutoPythonGIL gil;
+
+    // If possible, reuse the original DeviceProxy
+    object py_device;
+    if (m_weak_device) {
+        PyObject* py_c_device = PyWeakref_GET_OBJECT(m_weak_device);
+        if (py_c_device && py_c_device != Py_None) {
+           py_device = object(handle<>(borrowed(py_c_device)));
+        }
+    }
+
+    const std::size_t max_batch = state->max_batch;
+    for (std::size_t start = 0; start < batch.size(); start += max_batch)
+    {
+        std::size_t end = std::min(batch.size(), start + max_batch);
+        list py_events;
+        for (std::size_t i = start; i < end; ++i)
+        {
+            // python takes the ownership of the event
+            Tango::EventData* ev = batch[i];
+            batch[i] = 0;
+            object py_ev(handle<>(
+                to_python_indirect<
+                    Tango::EventData*, detail::make_owning_holder>()(ev)));
+            try
+            {
+                fill_py_event(ev, py_ev, py_device, m_extract_as);
+            }
+            SAFE_CATCH_REPORT("PyCallBackBatchPushEvent::fill_py_event")
+            py_events.append(py_ev);
+        }
+
+        {
+            std::lock_guard<std::mutex> lock(state->mutex);
+            state->dispatched += end - start;
+            ++state->batches;
+        }
+
+        try
+        {
+            get_override("push_events")(py_events);
+        }
+        SAFE_CATCH_INFORM("push_events")
+
+        // push_events may have deleted the callback: this must not be used
+        std::lock_guard<std::mutex> lock(state->mutex);
+        if (state->stop)
+            return;
+    }
+}
+
 void export_callback()
 {
     PyCallBackAutoDie::init();
@@ -408,4 +632,17 @@ void export_callback()
         .def("push_event", (void (PyCallBackAutoDie::*)(Tango::DevIntrChangeEventData*))&PyCallBackAutoDie::push_event,
             "This method is defined as being empty and must be overloaded by the user when events are used. This is the method which will be executed when the server send device interface change event(s) to the client. ")
     ;
+
+    class_<PyCallBackBatchPushEvent, bases<PyCallBackPushEvent>, boost::noncopyable> CallBackBatchPushEvent(
+        "__CallBackBatchPushEvent",
+        "INTERNAL CLASS - DO NOT USE IT",
+        init<std::size_t, double, bool>())
+    ;
+
+    CallBackBatchPushEvent
+        .def("flush", &PyCallBackBatchPushEvent::flush,
+            "Deliver the queued events without waiting for the batch to be full or the maximum latency to expire.")
+        .def("get_statistics", &PyCallBackBatchPushEvent::get_statistics,
+            "Return a dict with the number of events received, coalesced, dispatched, queued and the number of batches dispatched.")
+    ;
 }
@@ -12,6 +12,12 @@
 #pragma once
 
 #include <map>
+#include <memory>
+#include <mutex>
+#include <thread>
+#include <vector>
+#include <unordered_map>
+#include <condition_variable>
 #include "defs.h"
 
 /// Tango expects an object for callbacks derived from Tango::CallBack.
@@ -96,3 +102,54 @@ public:
     static void fill_py_event(Tango::PipeEventData* ev, boost::python::object & py_ev, boost::python::object py_device, PyTango::ExtractAs extract_as);
     static void fill_py_event(Tango::DevIntrChangeEventData* ev, boost::python::object & py_ev, boost::python::object py_device, PyTango::ExtractAs extract_as);
 };
+
+
+/// Event callback for the batched subscription mode. Tango::EventData
+/// received from the omniORB threads are copied into a native queue (without
+/// taking the GIL) and a dispatcher thread delivers them to the python
+/// push_events method as lists of at most max_batch events, at the latest
+/// max_latency seconds after the first queued event. When coalesce is
+/// set only the latest event of each attribute/event type is kept.
+class PyCallBackBatchPushEvent : public PyCallBackPushEvent
+{
+public:
+    PyCallBackBatchPushEvent(std::size_t max_batch, double max_latency, bool coalesce);
+    virtual ~PyCallBackBatchPushEvent();
+
+    using PyCallBackPushEvent::push_event;
+    virtual void push_event(Tango::EventData *ev);
+
+    void flush();
+    boost::python::dict get_statistics();
+
+private:
+    /// Shared with the dispatcher thread, which may outlive the callback
+    /// when it is deleted from its own push_events method
+    struct State
+    {
+        State(std::size_t max_batch, double max_latency, bool coalesce);
+
+        std::size_t max_batch;
+        double max_latency;
+        bool coalesce;
+
+        std::mutex mutex;
+        std::condition_variable cond;
+        std::vector<Tango::EventData*> queue;
+        std::unordered_map<std::string, std::size_t> index;
+        bool flush;
+        bool stop;
+
+        std::size_t received;
+        std::size_t coalesced;
+        std::size_t dispatched;
+        std::size_t batches;
+    };
+
+    static void run(std::shared_ptr<State> state, PyCallBackBatchPushEvent *self);
+    void dispatch(const std::shared_ptr<State> &state, std::vector<Tango::EventData*> &batch);
+    void stop();
+
+    std::shared_ptr<State> m_state;
+    std::thread m_thread;
+};
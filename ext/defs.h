@@ -30,7 +30,8 @@ namespace PyTango
         ExtractAsList,
         ExtractAsString,
         ExtractAsPyTango3,
-        ExtractAsNothing
+        ExtractAsNothing,
+        ExtractAsBuffer
     };
     
     enum ImageFormat {
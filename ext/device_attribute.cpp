@@ -274,6 +274,81 @@ namespace PyDeviceAttribute
 	assert(false);
     }
 
+    static void _dev_var_encoded_array_deleter(PyObject* obj)
+    {
+        void* ptr_ = PyCapsule_GetPointer(obj, NULL);
+        delete static_cast<Tango::DevVarEncodedArray*>(ptr_);
+    }
+
+    /// Return a numpy uint8 array using the encoded data as its buffer. The
+    /// array keeps a reference to guard, the capsule owning the data.
+    static bopy::object _encoded_data_as_numpy(Tango::DevEncoded &encoded, PyObject* guard)
+    {
+        Tango::DevVarCharArray& data = encoded.encoded_data;
+        npy_intp dims[1] = { static_cast<npy_intp>(data.length()) };
+        PyObject* array = PyArray_SimpleNewFromData(1, dims, NPY_UBYTE, data.get_buffer());
+        if (!array)
+            throw_error_already_set();
+        Py_INCREF(guard);
+        if (PyArray_SetBaseObject(reinterpret_cast<PyArrayObject*>(array), guard) < 0)
+        {
+            Py_DECREF(array);
+            throw_error_already_set();
+        }
+        return bopy::object(bopy::handle<>(array));
+    }
+
+    /// ExtractAsBuffer for DevEncoded: the value is a tuple (format, data)
+    /// where data is a numpy.uint8 array sharing the memory of the received
+    /// CORBA sequence, so big encoded images are not copied.
+    static inline void
+    _update_encoded_as_buffer(Tango::DeviceAttribute &self, bopy::object py_value)
+    {
+        Tango::DevVarEncodedArray* value_ptr = 0;
+        EXTRACT_VALUE(self, value_ptr)
+        if (value_ptr == 0) {
+            // Empty device attribute
+            py_value.attr(value_attr_name) = bopy::object();
+            py_value.attr(w_value_attr_name) = bopy::object();
+            return;
+        }
+
+        // Deletes value_ptr when the last array using it disappears
+        PyObject* guard = PyCapsule_New(
+                static_cast<void *>(value_ptr),
+                NULL,
+                _dev_var_encoded_array_deleter);
+        if (!guard) {
+            delete value_ptr;
+            throw_error_already_set();
+        }
+        bopy::object py_guard = bopy::object(bopy::handle<>(guard));
+
+        Tango::DevEncoded* buffer = value_ptr->get_buffer();
+        bopy::object r_value = bopy::make_tuple(
+            bopy::str(buffer[0].encoded_format),
+            _encoded_data_as_numpy(buffer[0], guard));
+        py_value.attr(value_attr_name) = r_value;
+
+        if (self.get_written_dim_x() > 0)
+        {
+            if (value_ptr->length() < 2)
+            {
+                py_value.attr(w_value_attr_name) = r_value;
+            }
+            else
+            {
+                py_value.attr(w_value_attr_name) = bopy::make_tuple(
+                    bopy::str(buffer[1].encoded_format),
+                    _encoded_data_as_numpy(buffer[1], guard));
+            }
+        }
+        else
+        {
+            py_value.attr(w_value_attr_name) = bopy::object();
+        }
+    }
+
     template<long tangoTypeConst> static inline void
     _update_scalar_values(Tango::DeviceAttribute &self, bopy::object py_value)
     {
@@ -553,6 +628,9 @@ namespace PyDeviceAttribute
                             TANGO_CALL_ON_ATTRIBUTE_DATA_TYPE_ID(data_type,
                                 _update_value_as_string, self, py_value);
                             break;
+                        case PyTango::ExtractAsBuffer:
+                            _update_encoded_as_buffer(self, py_value);
+                            break;
                         case PyTango::ExtractAsNothing:
                             break;
                     }
@@ -573,6 +651,8 @@ namespace PyDeviceAttribute
                 {
                     default:
                     case PyTango::ExtractAsNumpy:
+                    // numpy arrays already share the received buffer
+                    case PyTango::ExtractAsBuffer:
                         TANGO_CALL_ON_ATTRIBUTE_DATA_TYPE_ID(data_type,
                             _update_array_values, self, is_image, py_value);
                         break;
@@ -13,6 +13,7 @@
 #include "defs.h"
 #include "pytgutils.h"
 #include "attribute.h"
+#include "server/device_impl.h"
 #include "fast_from_py.h"
 
 using namespace boost::python;
@@ -241,6 +242,146 @@ namespace PyAttribute
 	PyBuffer_Release(&view);
     }
 
+    /// The zero copy state (see set_zero_copy) is kept by the python
+    /// device, so that it does not outlive it:
+    ///  - _zero_copy_attributes: lower case attribute name -> enabled
+    ///  - _zero_copy_arrays: (lower case attribute name, thread ident) ->
+    ///    the numpy array whose memory Tango uses as the attribute value.
+    ///    A reply is marshalled by the thread which set its value, after
+    ///    the device monitor is released, so an array is released when an
+    ///    event using it has been pushed (see release_zero_copy_array), or
+    ///    when the same thread starts its next request on the device (see
+    ///    BaseDevice in tango/server.py).
+    /// Devices which never used zero copy skip all of it: set_value then
+    /// costs no dynamic_cast nor dict lookup.
+    /// All of it is only called with the GIL held.
+    static bool __zero_copy_used = false;
+
+    /// Return the python device of the attribute if it has used zero copy,
+    /// or 0
+    static PyDeviceImplBase *__zero_copy_device(Tango::Attribute &att)
+    {
+        if (!__zero_copy_used)
+            return 0;
+        PyDeviceImplBase *dev =
+            dynamic_cast<PyDeviceImplBase *>(att.get_att_device());
+        if (dev == 0 || dev->the_self == 0 || !dev->zero_copy)
+            return 0;
+        return dev;
+    }
+
+    /// Returns the dict named key of the device (None if there is none and
+    /// create is false)
+    static bopy::object __zero_copy_dict(PyDeviceImplBase *dev, const char *key,
+                                         bool create)
+    {
+        bopy::object py_dev(bopy::handle<>(bopy::borrowed(dev->the_self)));
+        bopy::object dev_dict = py_dev.attr("__dict__");
+        if (create)
+            return dev_dict.attr("setdefault")(key, bopy::dict());
+        return dev_dict.attr("get")(key);
+    }
+
+    void set_zero_copy(Tango::Attribute &att, bool zero_copy)
+    {
+        PyDeviceImplBase *dev =
+            dynamic_cast<PyDeviceImplBase *>(att.get_att_device());
+        if (dev == 0 || dev->the_self == 0)
+        {
+            Tango::Except::throw_exception(
+                    "PyDs_ZeroCopyNotSupported",
+                    "Zero copy mode requires an attribute of a python device",
+                    "set_zero_copy()");
+        }
+        bopy::object attributes =
+            __zero_copy_dict(dev, "_zero_copy_attributes", true);
+        // the arrays in use are kept until they are released
+        attributes[att.get_name_lower()] = zero_copy;
+        if (zero_copy)
+        {
+            dev->zero_copy = true;
+            __zero_copy_used = true;
+        }
+    }
+
+    static bool __is_zero_copy(PyDeviceImplBase *dev, Tango::Attribute &att)
+    {
+        if (dev == 0)
+            return false;
+        bopy::object attributes =
+            __zero_copy_dict(dev, "_zero_copy_attributes", false);
+        if (attributes.is_none())
+            return false;
+        return bopy::extract<bool>(
+            attributes.attr("get")(att.get_name_lower(), false));
+    }
+
+    bool is_zero_copy(Tango::Attribute &att)
+    {
+        return __is_zero_copy(__zero_copy_device(att), att);
+    }
+
+    void release_zero_copy_array(Tango::Attribute &att)
+    {
+        PyDeviceImplBase *dev = __zero_copy_device(att);
+        if (dev == 0)
+            return;
+        bopy::object arrays = __zero_copy_dict(dev, "_zero_copy_arrays", false);
+        if (arrays.is_none())
+            return;
+        bopy::object key = bopy::make_tuple(
+            att.get_name_lower(), PyThread_get_thread_ident());
+        arrays.attr("pop")(key, bopy::object());
+    }
+
+    /// Return the data of the numpy array if tango can use it as it is (C
+    /// contiguous, aligned, of the attribute type and dimensions) or 0
+    template<long tangoTypeConst>
+    inline typename TANGO_const2type(tangoTypeConst)*
+        __zero_copy_buffer(PyObject* py_val, long* x, long* y, bool isImage,
+                           long& res_dim_x, long& res_dim_y)
+    {
+        typedef typename TANGO_const2type(tangoTypeConst) TangoScalarType;
+        static const int typenum = TANGO_const2numpy(tangoTypeConst);
+
+        if (!PyArray_Check(py_val))
+            return 0;
+        if (!PyArray_CHKFLAGS(py_val, NPY_C_CONTIGUOUS | NPY_ALIGNED)
+            || PyArray_TYPE(py_val) != typenum)
+            return 0;
+
+        int nd = PyArray_NDIM(py_val);
+        npy_intp* dims = PyArray_DIMS(py_val);
+        if (isImage) {
+            if (nd != 2 || (x && *x != dims[1]) || (y && *y != dims[0]))
+                return 0;
+            res_dim_x = static_cast<long>(dims[1]);
+            res_dim_y = static_cast<long>(dims[0]);
+        } else {
+            if (nd != 1 || (x && *x > dims[0]))
+                return 0;
+            res_dim_x = x ? *x : static_cast<long>(dims[0]);
+            res_dim_y = 0;
+        }
+        return reinterpret_cast<TangoScalarType*>(PyArray_DATA(py_val));
+    }
+
+    template<>
+    inline TANGO_const2type(Tango::DEV_STRING)*
+        __zero_copy_buffer<Tango::DEV_STRING>(PyObject* py_val, long* x, long* y,
+            bool isImage, long& res_dim_x, long& res_dim_y)
+    {
+        return 0;
+    }
+
+    template<>
+    inline TANGO_const2type(Tango::DEV_ENCODED)*
+        __zero_copy_buffer<Tango::DEV_ENCODED>(PyObject* py_val, long* x, long* y,
+            bool isImage, long& res_dim_x, long& res_dim_y)
+    {
+        return 0;
+    }
+
     template<long tangoTypeConst>
     void __set_value_date_quality_array(
             Tango::Attribute& att,
@@ -271,13 +412,21 @@ namespace PyAttribute
                     fname + "()");
         }
 
-        TangoScalarType* data_buffer;
+        TangoScalarType* data_buffer = 0;
 
         long res_dim_x=0, res_dim_y=0;
-        data_buffer = fast_python_to_tango_buffer<tangoTypeConst>(
-                 value.ptr(), x, y, fname, isImage, res_dim_x, res_dim_y);
+        PyDeviceImplBase *dev = __zero_copy_device(att);
+        if (__is_zero_copy(dev, att)) {
+            data_buffer = __zero_copy_buffer<tangoTypeConst>(
+                value.ptr(), x, y, isImage, res_dim_x, res_dim_y);
+        }
 
-        static const bool release = true;
+        // tango does not own (nor copy) the memory of a zero copy array
+        const bool release = (data_buffer == 0);
+        if (release) {
+            data_buffer = fast_python_to_tango_buffer<tangoTypeConst>(
+                     value.ptr(), x, y, fname, isImage, res_dim_x, res_dim_y);
+        }
 
         if (quality) {
             PYTG_NEW_TIME_FROM_DOUBLE(time, tv);
@@ -286,6 +435,19 @@ namespace PyAttribute
         } else {
             att.set_value(data_buffer, res_dim_x, res_dim_y, release);
         }
+
+        bopy::object arrays;
+        if (dev != 0)
+            arrays = __zero_copy_dict(dev, "_zero_copy_arrays", !release);
+        if (!arrays.is_none()) {
+            // the reply using the previous array of this thread has been sent
+            bopy::object key = bopy::make_tuple(
+                att.get_name_lower(), PyThread_get_thread_ident());
+            if (release)
+                arrays.attr("pop")(key, bopy::object());
+            else
+                arrays[key] = value;
+        }
     }
 
     inline void __set_value(const std::string & fname, Tango::Attribute &att, bopy::object &value, long* x, long *y, double t = 0.0, Tango::AttrQuality* quality = 0)
@@ -801,6 +963,8 @@ void export_attribute()
         .def("set_max_warning", &PyAttribute::set_max_warning)
         
         .def("get_value_flag", &Tango::Attribute::get_value_flag)
+        .def("set_zero_copy", &PyAttribute::set_zero_copy)
+        .def("is_zero_copy", &PyAttribute::is_zero_copy)
         .def("set_value_flag", &Tango::Attribute::set_value_flag)
 
         .def("get_disp_level", &Tango::Attribute::get_disp_level)
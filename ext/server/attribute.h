@@ -65,6 +65,8 @@ namespace PyAttribute
                           boost::python::object &);
 
     void set_properties_multi_attr_prop(Tango::Attribute &, boost::python::object &);
+
+    void release_zero_copy_array(Tango::Attribute &);
 };
 
 
@@ -126,6 +126,7 @@ static void log_to_stream(log4tango::LoggerStream& stream,
     SAFE_PUSH(dev, attr, attr_name) \
     PyAttribute::set_value(attr, data); \
     attr.fire_change_event(); \
+    PyAttribute::release_zero_copy_array(attr); \
 }
 
 #define SAFE_PUSH_CHANGE_EVENT_VARGS(dev, attr_name, data, ...) \
@@ -133,6 +134,7 @@ static void log_to_stream(log4tango::LoggerStream& stream,
     SAFE_PUSH(dev, attr, attr_name) \
     PyAttribute::set_value(attr, data, __VA_ARGS__); \
     attr.fire_change_event(); \
+    PyAttribute::release_zero_copy_array(attr); \
 }
 
 #define SAFE_PUSH_CHANGE_EVENT_DATE_QUALITY(dev, attr_name, data, date, quality) \
@@ -140,6 +142,7 @@ static void log_to_stream(log4tango::LoggerStream& stream,
     SAFE_PUSH(dev, attr, attr_name) \
     PyAttribute::set_value_date_quality(attr, data, date, quality); \
     attr.fire_change_event(); \
+    PyAttribute::release_zero_copy_array(attr); \
 }
 
 #define SAFE_PUSH_CHANGE_EVENT_DATE_QUALITY_VARGS(dev, attr_name, data, date, quality, ...) \
@@ -147,6 +150,7 @@ static void log_to_stream(log4tango::LoggerStream& stream,
     SAFE_PUSH(dev, attr, attr_name) \
     PyAttribute::set_value_date_quality(attr, data, date, quality, __VA_ARGS__); \
     attr.fire_change_event(); \
+    PyAttribute::release_zero_copy_array(attr); \
 }
 
 #define SAFE_PUSH_ARCHIVE_EVENT(dev, attr_name, data) \
@@ -154,6 +158,7 @@ static void log_to_stream(log4tango::LoggerStream& stream,
     SAFE_PUSH(dev, attr, attr_name) \
     PyAttribute::set_value(attr, data); \
     attr.fire_archive_event(); \
+    PyAttribute::release_zero_copy_array(attr); \
 }
 
 #define SAFE_PUSH_ARCHIVE_EVENT_VARGS(dev, attr_name, data, ...) \
@@ -161,6 +166,7 @@ static void log_to_stream(log4tango::LoggerStream& stream,
     SAFE_PUSH(dev, attr, attr_name) \
     PyAttribute::set_value(attr, data, __VA_ARGS__); \
     attr.fire_archive_event(); \
+    PyAttribute::release_zero_copy_array(attr); \
 }
 
 #define SAFE_PUSH_ARCHIVE_EVENT_DATE_QUALITY(dev, attr_name, data, date, quality) \
@@ -168,6 +174,7 @@ static void log_to_stream(log4tango::LoggerStream& stream,
     SAFE_PUSH(dev, attr, attr_name) \
     PyAttribute::set_value_date_quality(attr, data, date, quality); \
     attr.fire_archive_event(); \
+    PyAttribute::release_zero_copy_array(attr); \
 }
 
 #define SAFE_PUSH_ARCHIVE_EVENT_DATE_QUALITY_VARGS(dev, attr_name, data, date, quality, ...) \
@@ -175,6 +182,7 @@ static void log_to_stream(log4tango::LoggerStream& stream,
     SAFE_PUSH(dev, attr, attr_name) \
     PyAttribute::set_value_date_quality(attr, data, date, quality, __VA_ARGS__); \
     attr.fire_archive_event(); \
+    PyAttribute::release_zero_copy_array(attr); \
 }
 
 #define AUX_SAFE_PUSH_EVENT(dev, attr_name, filt_names, filt_vals) \
@@ -189,6 +197,7 @@ static void log_to_stream(log4tango::LoggerStream& stream,
     AUX_SAFE_PUSH_EVENT(dev, attr_name, filt_names, filt_vals) \
     PyAttribute::set_value(attr, data); \
     attr.fire_event(filt_names_, filt_vals_); \
+    PyAttribute::release_zero_copy_array(attr); \
 }
 
 #define SAFE_PUSH_EVENT_VARGS(dev, attr_name, filt_names, filt_vals, data, ...) \
@@ -196,6 +205,7 @@ static void log_to_stream(log4tango::LoggerStream& stream,
     AUX_SAFE_PUSH_EVENT(dev,attr_name, filt_names, filt_vals) \
     PyAttribute::set_value(attr, data, __VA_ARGS__); \
     attr.fire_event(filt_names_, filt_vals_); \
+    PyAttribute::release_zero_copy_array(attr); \
 }
 
 #define SAFE_PUSH_EVENT_DATE_QUALITY(dev, attr_name, filt_names, filt_vals, data, date, quality) \
@@ -203,6 +213,7 @@ static void log_to_stream(log4tango::LoggerStream& stream,
     AUX_SAFE_PUSH_EVENT(dev, attr_name, filt_names, filt_vals) \
     PyAttribute::set_value_date_quality(attr, data, date, quality); \
     attr.fire_event(filt_names_, filt_vals_); \
+    PyAttribute::release_zero_copy_array(attr); \
 }
 
 #define SAFE_PUSH_EVENT_DATE_QUALITY_VARGS(dev, attr_name, filt_names, filt_vals, data, date, quality, ...) \
@@ -210,6 +221,7 @@ static void log_to_stream(log4tango::LoggerStream& stream,
     AUX_SAFE_PUSH_EVENT(dev,attr_name, filt_names, filt_vals) \
     PyAttribute::set_value_date_quality(attr, data, date, quality, __VA_ARGS__); \
     attr.fire_event(filt_names_, filt_vals_); \
+    PyAttribute::release_zero_copy_array(attr); \
 }
 
 namespace PyDeviceImpl
@@ -934,7 +946,8 @@ void Device_2ImplWrap::init_device()
     this->get_override("init_device")();
 }
 
-PyDeviceImplBase::PyDeviceImplBase(PyObject *self):the_self(self)
+PyDeviceImplBase::PyDeviceImplBase(PyObject *self):
+    the_self(self), zero_copy(false)
 {
     Py_INCREF(the_self);
 }
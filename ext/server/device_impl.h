@@ -126,6 +126,10 @@ public:
 
     std::string the_status;
 
+    /** true once an attribute of the device is in zero copy mode (see
+        PyAttribute::set_zero_copy) */
+    bool zero_copy;
+
     PyDeviceImplBase(PyObject *self);
 
     virtual ~PyDeviceImplBase();
@@ -13,6 +13,7 @@
 #include <tango/tango.h>
 #include "tango_numpy.h"
 #include "device_attribute.h"
+#include "pytgutils.h"
 
 using namespace boost::python;
 
@@ -164,6 +165,11 @@ namespace PyEncodedAttribute
         self.encode_gray8(buffer, w, h);
     }
 
+    // The JPEG encoders (and the decoders below) only work on C buffers (a
+    // python bytes/array kept alive by the caller or our own copy), so they run
+    // without the GIL to let other python threads (e.g. encoding other frames)
+    // run meanwhile.
+
     void encode_jpeg_gray8(Tango::EncodedAttribute &self, object py_value, int w, int h, double quality)
     {
         PyObject *py_value_ptr = py_value.ptr();
@@ -171,7 +177,10 @@ namespace PyEncodedAttribute
         if (PyBytes_Check(py_value_ptr))
         {
             buffer = reinterpret_cast<unsigned char*>(PyBytes_AsString(py_value_ptr));
-            self.encode_jpeg_gray8(buffer, w, h, quality);
+            {
+                AutoPythonAllowThreads guard;
+                self.encode_jpeg_gray8(buffer, w, h, quality);
+            }
             return;
         }
         else if (PyArray_Check(py_value_ptr))
@@ -180,7 +189,10 @@ namespace PyEncodedAttribute
             h = static_cast<int>(PyArray_DIM(py_value_ptr, 0));
             
             buffer = (unsigned char*)(PyArray_DATA(py_value_ptr));
-            self.encode_jpeg_gray8(buffer, w, h, quality);
+            {
+                AutoPythonAllowThreads guard;
+                self.encode_jpeg_gray8(buffer, w, h, quality);
+            }
             return;
         }
         // It must be a py sequence
@@ -273,7 +285,10 @@ namespace PyEncodedAttribute
             }
             Py_DECREF(row);
         }
-        self.encode_jpeg_gray8(buffer, w, h, quality);
+        {
+            AutoPythonAllowThreads guard;
+            self.encode_jpeg_gray8(buffer, w, h, quality);
+        }
     }
     
     void encode_gray16(Tango::EncodedAttribute &self, object py_value, int w, int h)
@@ -506,13 +521,19 @@ namespace PyEncodedAttribute
         if (PyBytes_Check(py_value_ptr))
         {
             buffer = reinterpret_cast<unsigned char*>(PyBytes_AsString(py_value_ptr));
-            self.encode_jpeg_rgb24(buffer, w, h, quality);
+            {
+                AutoPythonAllowThreads guard;
+                self.encode_jpeg_rgb24(buffer, w, h, quality);
+            }
             return;
         }
         else if (PyArray_Check(py_value_ptr))
         {
             buffer = (unsigned char*)(PyArray_DATA(py_value_ptr));
-            self.encode_jpeg_rgb24(buffer, w, h, quality);
+            {
+                AutoPythonAllowThreads guard;
+                self.encode_jpeg_rgb24(buffer, w, h, quality);
+            }
             return;
         }
         // It must be a py sequence
@@ -608,7 +629,10 @@ namespace PyEncodedAttribute
             }
             Py_DECREF(row);
         }
-        self.encode_jpeg_rgb24(buffer, w, h, quality);
+        {
+            AutoPythonAllowThreads guard;
+            self.encode_jpeg_rgb24(buffer, w, h, quality);
+        }
     }
 
     void encode_jpeg_rgb32(Tango::EncodedAttribute &self, object py_value, int w, int h, double quality)
@@ -618,13 +642,19 @@ namespace PyEncodedAttribute
         if (PyBytes_Check(py_value_ptr))
         {
             buffer = reinterpret_cast<unsigned char*>(PyBytes_AsString(py_value_ptr));
-            self.encode_jpeg_rgb32(buffer, w, h, quality);
+            {
+                AutoPythonAllowThreads guard;
+                self.encode_jpeg_rgb32(buffer, w, h, quality);
+            }
             return;
         }
         else if (PyArray_Check(py_value_ptr))
         {
             buffer = (unsigned char*)(PyArray_DATA(py_value_ptr));
-            self.encode_jpeg_rgb32(buffer, w, h, quality);
+            {
+                AutoPythonAllowThreads guard;
+                self.encode_jpeg_rgb32(buffer, w, h, quality);
+            }
             return;
         }
         // It must be a py sequence
@@ -723,7 +753,10 @@ namespace PyEncodedAttribute
             }
             Py_DECREF(row);
         }
-        self.encode_jpeg_rgb32(buffer, w, h, quality);
+        {
+            AutoPythonAllowThreads guard;
+            self.encode_jpeg_rgb32(buffer, w, h, quality);
+        }
     }
 
     PyObject *decode_gray8(Tango::EncodedAttribute &self, Tango::DeviceAttribute *attr, PyTango::ExtractAs extract_as)
@@ -731,7 +764,10 @@ namespace PyEncodedAttribute
         unsigned char *buffer;
         int width, height;
 
-        self.decode_gray8(attr, &width, &height, &buffer);
+        {
+            AutoPythonAllowThreads guard;
+            self.decode_gray8(attr, &width, &height, &buffer);
+        }
         
         char *ch_ptr = reinterpret_cast<char *>(buffer);
         PyObject *ret = NULL;
@@ -864,7 +900,10 @@ namespace PyEncodedAttribute
         unsigned short *buffer;
         int width, height;
 
-        self.decode_gray16(attr, &width, &height, &buffer);
+        {
+            AutoPythonAllowThreads guard;
+            self.decode_gray16(attr, &width, &height, &buffer);
+        }
         
         unsigned short *ch_ptr = buffer;
         PyObject *ret = NULL;
@@ -1000,7 +1039,10 @@ namespace PyEncodedAttribute
         unsigned char *buffer;
         int width, height;
 
-        self.decode_rgb32(attr, &width, &height, &buffer);
+        {
+            AutoPythonAllowThreads guard;
+            self.decode_rgb32(attr, &width, &height, &buffer);
+        }
 
         unsigned char *ch_ptr = buffer;
         PyObject *ret = NULL;
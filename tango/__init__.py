@@ -236,6 +236,8 @@ __all__ = (
     "requires_pytango",
     "set_green_mode",
     "get_green_mode",
+    "set_executor_pool_size",
+    "get_executor_pool_size",
     "get_device_proxy",
     "is_scalar_type",
     "is_array_type",
@@ -259,7 +261,6 @@ from ._tango import (
     AsynCall,
     AsynReplyNotArrived,
     AttReqType,
-    Attr,
     AttrConfEventData,
     AttrDataFormat,
     AttrList,
@@ -269,7 +270,6 @@ from ._tango import (
     AttrSerialModel,
     AttrWriteType,
     AttrWrittenEvent,
-    Attribute,
     AttributeAlarmInfo,
     AttributeDimension,
     AttributeEventInfo,
@@ -280,7 +280,6 @@ from ._tango import (
     AttributeList,
     ChangeEventInfo,
     CmdArgType,
-    Pipe,
     PipeWriteType,
     DevIntrChangeEventData,
     CmdDoneEvent,
@@ -346,16 +345,10 @@ from ._tango import (
     DeviceDataList,
     DeviceDataHistory,
     DeviceDataHistoryList,
-    DeviceImpl,
     DeviceInfo,
     DeviceProxy,
     DeviceUnlocked,
-    Device_2Impl,
-    Device_3Impl,
-    Device_4Impl,
-    Device_5Impl,
     DispLevel,
-    EncodedAttribute,
     EnsureOmniThread,
     ErrSeverity,
     EventData,
@@ -366,14 +359,7 @@ from ._tango import (
     ExtractAs,
     GreenMode,
     FMT_UNKNOWN,
-    GroupAttrReply,
-    GroupAttrReplyList,
-    GroupCmdReply,
-    GroupCmdReplyList,
-    GroupReply,
-    GroupReplyList,
     IMAGE,
-    ImageAttr,
     KeepAliveCmdCode,
     Level,
     LockCmdCode,
@@ -381,11 +367,8 @@ from ._tango import (
     LockerLanguage,
     LogLevel,
     LogTarget,
-    Logger,
     Logging,
     MessBoxType,
-    MultiAttribute,
-    MultiClassAttribute,
     NamedDevFailed,
     NamedDevFailedList,
     NonDbDevice,
@@ -401,7 +384,6 @@ from ._tango import (
     SCALAR,
     SPECTRUM,
     SerialModel,
-    SpectrumAttr,
     StdDoubleVector,
     StdGroupAttrReplyVector,
     StdGroupCmdReplyVector,
@@ -411,9 +393,6 @@ from ._tango import (
     StdStringVector,
     SubDevDiag,
     TimeVal,
-    UserDefaultAttrProp,
-    UserDefaultPipeProp,
-    WAttribute,
     WRITE,
     WrongData,
     WrongNameSyntax,
@@ -423,8 +402,6 @@ from ._tango import (
     constants,
     raise_asynch_exception,
     Interceptors,
-    AutoTangoMonitor,
-    AutoTangoAllowThreads,
     is_omni_thread,
 )
 
@@ -449,47 +426,8 @@ __doc__ = Release.long_description
 
 # Pytango imports
 
-from .attr_data import AttrData
-
-from .log4tango import TangoStream, LogIt, DebugIt, InfoIt, WarnIt, ErrorIt, FatalIt
-
-from .device_server import (
-    ChangeEventProp,
-    PeriodicEventProp,
-    ArchiveEventProp,
-    AttributeAlarm,
-    EventProperties,
-    AttributeConfig,
-    AttributeConfig_2,
-    AttributeConfig_3,
-    MultiAttrProp,
-    LatestDeviceImpl,
-)
-
-from .pipe import PipeConfig
-
 from .attribute_proxy import AttributeProxy, get_attribute_proxy
 
-from .group import Group
-
-from .pyutil import Util
-
-from .device_class import DeviceClass
-
-from .globals import (
-    get_class,
-    get_classes,
-    get_cpp_class,
-    get_cpp_classes,
-    get_constructed_class,
-    get_constructed_classes,
-    class_factory,
-    delete_class_list,
-    class_list,
-    cpp_class_list,
-    constructed_class,
-)
-
 from .utils import (
     requires_pytango,
     requires_tango,
@@ -506,6 +444,7 @@ from .utils import (
 )
 
 from .green import set_green_mode, get_green_mode
+from .green import set_executor_pool_size, get_executor_pool_size
 
 from .device_proxy import get_device_proxy
 
@@ -513,6 +452,131 @@ from .device_proxy import get_device_proxy
 # Pytango initialization
 
 from .pytango_init import init as __init
+from .pytango_init import init_server as __init_server
+from .pytango_init import init_group as __init_group
+from .pytango_init import init_encoded_attribute as __init_encoded_attribute
 
 __init()
 requires_tango("9.4.1", software_name="PyTango")
+
+
+# The server API and the rarely used modules are imported (and initialized)
+# the first time one of their members is accessed. A client which only
+# uses DeviceProxy, Database, ... does not pay for them.
+
+__LAZY_MEMBERS = {}
+
+
+def __add_lazy_members(module, init, names):
+    for name in names:
+        __LAZY_MEMBERS[name] = module, init
+
+
+__add_lazy_members(
+    "._tango",
+    __init_server,
+    (
+        "Attr",
+        "Attribute",
+        "DeviceImpl",
+        "Device_2Impl",
+        "Device_3Impl",
+        "Device_4Impl",
+        "Device_5Impl",
+        "ImageAttr",
+        "Logger",
+        "MultiAttribute",
+        "MultiClassAttribute",
+        "Pipe",
+        "SpectrumAttr",
+        "UserDefaultAttrProp",
+        "UserDefaultPipeProp",
+        "WAttribute",
+        "AutoTangoMonitor",
+        "AutoTangoAllowThreads",
+    ),
+)
+__add_lazy_members(
+    "._tango",
+    __init_group,
+    (
+        "GroupAttrReply",
+        "GroupAttrReplyList",
+        "GroupCmdReply",
+        "GroupCmdReplyList",
+        "GroupReply",
+        "GroupReplyList",
+    ),
+)
+__add_lazy_members("._tango", __init_encoded_attribute, ("EncodedAttribute",))
+__add_lazy_members(".attr_data", __init_server, ("AttrData",))
+__add_lazy_members(
+    ".log4tango",
+    __init_server,
+    ("TangoStream", "LogIt", "DebugIt", "InfoIt", "WarnIt", "ErrorIt", "FatalIt"),
+)
+__add_lazy_members(
+    ".device_server",
+    __init_server,
+    (
+        "ChangeEventProp",
+        "PeriodicEventProp",
+        "ArchiveEventProp",
+        "AttributeAlarm",
+        "EventProperties",
+        "AttributeConfig",
+        "AttributeConfig_2",
+        "AttributeConfig_3",
+        "MultiAttrProp",
+        "LatestDeviceImpl",
+    ),
+)
+__add_lazy_members(".pipe", __init_server, ("PipeConfig",))
+__add_lazy_members(".group", __init_group, ("Group",))
+__add_lazy_members(".pyutil", __init_server, ("Util",))
+__add_lazy_members(".device_class", __init_server, ("DeviceClass",))
+__add_lazy_members(
+    ".globals",
+    __init_server,
+    (
+        "get_class",
+        "get_classes",
+        "get_cpp_class",
+        "get_cpp_classes",
+        "get_constructed_class",
+        "get_constructed_classes",
+        "class_factory",
+        "delete_class_list",
+        "class_list",
+        "cpp_class_list",
+        "constructed_class",
+    ),
+)
+
+__LAZY_SUBMODULES = (
+    "asyncio",
+    "databaseds",
+    "futures",
+    "gevent",
+    "server",
+    "test_context",
+    "test_utils",
+)
+
+
+def __getattr__(name):
+    import importlib
+
+    if name in __LAZY_MEMBERS:
+        module, init = __LAZY_MEMBERS[name]
+        init()
+        value = getattr(importlib.import_module(module, __name__), name)
+        globals()[name] = value
+        return value
+    if name in __LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__LAZY_MEMBERS))
@@ -26,8 +26,12 @@ try:
 except ImportError:
     from .asyncio_tools import coroutine
 
+# Concurrent imports
+from concurrent.futures import ThreadPoolExecutor
+
 # Tango imports
-from .green import AbstractExecutor
+from ._tango import GreenMode
+from .green import AbstractExecutor, ExecutorStatistics, get_executor_pool_size
 
 __all__ = ("AsyncioExecutor", "get_global_executor", "set_global_executor")
 
@@ -57,8 +61,9 @@ class AsyncioExecutor(AbstractExecutor):
 
     asynchronous = True
     default_wait = False
+    green_mode = GreenMode.Asyncio
 
-    def __init__(self, loop=None, subexecutor=None):
+    def __init__(self, loop=None, subexecutor=None, max_workers=None, max_queue=None):
         super().__init__()
         if loop is None:
             try:
@@ -66,12 +71,74 @@ class AsyncioExecutor(AbstractExecutor):
             except RuntimeError:
                 loop = asyncio.new_event_loop()
                 asyncio.set_event_loop(loop)
+        default_workers, default_queue = get_executor_pool_size()
+        if max_workers is None:
+            max_workers = default_workers
+        if max_queue is None:
+            max_queue = default_queue
         self.loop = loop
+        self.statistics = ExecutorStatistics()
+        # False if the thread pool is given: it is not resized
+        self.owns_subexecutor = subexecutor is None
         self.subexecutor = subexecutor
+        self._set_pool_size(max_workers, max_queue)
+
+    def _set_pool_size(self, max_workers, max_queue):
+        if self.owns_subexecutor:
+            # None: the default executor of the event loop
+            self.subexecutor = None
+            if max_workers is not None:
+                self.subexecutor = ThreadPoolExecutor(max_workers=max_workers)
+        # calls queued or run by the thread pool at the same time
+        self.max_pending = None
+        if max_queue is not None:
+            if max_workers is None:
+                max_workers = getattr(self.subexecutor, "_max_workers", None)
+            self.max_pending = (max_workers or 1) + max_queue
+        self._slots = None
+
+    def set_pool_size(self, max_workers=None, max_queue=None):
+        """Replace the thread pool by one of the given size (see
+        :func:`~tango.set_executor_pool_size`). The calls already
+        delegated end in the previous pool."""
+        previous = self.subexecutor if self.owns_subexecutor else None
+        self._set_pool_size(max_workers, max_queue)
+        if previous is not None:
+            previous.shutdown(wait=False)
+
+    def get_statistics(self):
+        """Return the counters of the calls delegated to the thread pool
+        (see :class:`~tango.green.ExecutorStatistics`)"""
+        return self.statistics.as_dict()
+
+    async def _delegate_bounded(self, callback):
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+        # the one acquired, even if the pool is resized meanwhile
+        slots = self._slots
+        if slots.locked():
+            # back-pressure: wait in the event loop, not in the pool queue
+            self.statistics.add_waiting(1)
+            try:
+                await slots.acquire()
+            finally:
+                self.statistics.add_waiting(-1)
+        else:
+            await slots.acquire()
+        try:
+            callback = self.statistics.wrap(callback)
+            return await self.loop.run_in_executor(self.subexecutor, callback)
+        finally:
+            slots.release()
 
     def delegate(self, fn, *args, **kwargs):
         """Return the given operation as an asyncio future."""
         callback = functools.partial(fn, *args, **kwargs)
+        if self.max_pending is not None:
+            return asyncio.ensure_future(
+                self._delegate_bounded(callback), loop=self.loop
+            )
+        callback = self.statistics.wrap(callback)
         coro = self.loop.run_in_executor(self.subexecutor, callback)
         return asyncio.ensure_future(coro)
 
@@ -22,7 +22,7 @@ import collections.abc
 from ._tango import StdStringVector, DbData, DbDatum, DeviceProxy
 from ._tango import __AttributeProxy as _AttributeProxy
 from .utils import seq_2_StdStringVector, seq_2_DbData, DbData_2_dict
-from .utils import is_pure_str, is_non_str_seq
+from .utils import is_pure_str, is_non_str_seq, document_lazily
 from .green import green, get_green_mode
 from .device_proxy import __init_device_proxy_internals as init_device_proxy
 
@@ -341,7 +341,7 @@ def _method_dev_and_name(dp_fn_name, doc=True):
             self.name(), *args, **kwds
         )
 
-    if doc:
+    def document():
         __new_fn.__doc__ = (
             "This method is a simple way to do:\n"
             + "\tself.get_device_proxy()."
@@ -352,6 +352,9 @@ def _method_dev_and_name(dp_fn_name, doc=True):
             + "(...):\n"
             + str(getattr(DeviceProxy, dp_fn_name).__doc__)
         )
+
+    if doc:
+        document_lazily(document, classes=(AttributeProxy,))
     __new_fn.__name__ = dp_fn_name
     return __new_fn
 
@@ -360,7 +363,7 @@ def _method_device(dp_fn_name, doc=True):
     def __new_fn(self, *args, **kwds):
         return getattr(self._AttributeProxy__dev_proxy, dp_fn_name)(*args, **kwds)
 
-    if doc:
+    def document():
         __new_fn.__doc__ = (
             "This method is a simple way to do:\n"
             + "\tself.get_device_proxy()."
@@ -371,6 +374,9 @@ def _method_device(dp_fn_name, doc=True):
             + "(...):\n"
             + str(getattr(DeviceProxy, dp_fn_name).__doc__)
         )
+
+    if doc:
+        document_lazily(document, classes=(AttributeProxy,))
     __new_fn.__name__ = dp_fn_name
     return __new_fn
 
@@ -379,8 +385,11 @@ def _method_attribute(dp_fn_name, doc=True):
     def __new_fn(self, *args, **kwds):
         return getattr(self._AttributeProxy__attr_proxy, dp_fn_name)(*args, **kwds)
 
-    if doc:
+    def document():
         __new_fn.__doc__ = getattr(_AttributeProxy, dp_fn_name).__doc__
+
+    if doc:
+        document_lazily(document, classes=(AttributeProxy,))
     __new_fn.__name__ = dp_fn_name
     return __new_fn
 
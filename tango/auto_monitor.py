@@ -18,6 +18,7 @@ __all__ = ("auto_monitor_init",)
 __docformat__ = "restructuredtext"
 
 from ._tango import AutoTangoMonitor, AutoTangoAllowThreads
+from .utils import document_lazily
 
 
 def __AutoTangoMonitor__enter__(self):
@@ -73,5 +74,5 @@ def auto_monitor_init(doc=True):
     __init_AutoTangoMonitor()
     __init_AutoTangoAllowThreads()
     if doc:
-        __doc_AutoTangoMonitor()
-        __doc_AutoTangoAllowThreads()
+        document_lazily(__doc_AutoTangoMonitor, classes=(AutoTangoMonitor,))
+        document_lazily(__doc_AutoTangoAllowThreads, classes=(AutoTangoAllowThreads,))
@@ -59,6 +59,7 @@ from ._tango import (
 from .utils import document_method, is_integer
 from .utils import document_enum as __document_enum
 from .utils import seq_2_StdStringVector, StdStringVector_2_seq
+from .utils import document_lazily
 
 
 def __StdVector__add(self, seq):
@@ -1057,4 +1058,4 @@ def __doc_base_types():
 def base_types_init(doc=True):
     __init_base_types()
     if doc:
-        __doc_base_types()
+        document_lazily(__doc_base_types)
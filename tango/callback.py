@@ -18,6 +18,7 @@ __all__ = ("callback_init",)
 __docformat__ = "restructuredtext"
 
 from ._tango import CmdDoneEvent, AttrReadEvent, AttrWrittenEvent
+from .utils import document_lazily
 
 
 def __init_Callback():
@@ -68,4 +69,6 @@ def __doc_Callback():
 def callback_init(doc=True):
     __init_Callback()
     if doc:
-        __doc_Callback()
+        document_lazily(
+            __doc_Callback, classes=(CmdDoneEvent, AttrReadEvent, AttrWrittenEvent)
+        )
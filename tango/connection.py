@@ -31,6 +31,7 @@ from ._tango import (
 )
 from .utils import document_method as __document_method
 from .utils import document_static_method as __document_static_method
+from .utils import document_lazily
 from .green import green
 
 
@@ -720,4 +721,4 @@ def __doc_Connection():
 def connection_init(doc=True):
     __init_Connection()
     if doc:
-        __doc_Connection()
+        document_lazily(__doc_Connection, classes=(Connection,))
@@ -15,18 +15,18 @@ CREATE TABLE IF NOT EXISTS access_device (
 ) ;
 
 CREATE TABLE IF NOT EXISTS attribute_alias (
-  alias varchar(255) NOT NULL default '',
-  name varchar(255) NOT NULL default '',
-  device varchar(255) NOT NULL default '',
-  attribute varchar(255) NOT NULL default '',
+  alias varchar(255) COLLATE NOCASE NOT NULL default '',
+  name varchar(255) COLLATE NOCASE NOT NULL default '',
+  device varchar(255) COLLATE NOCASE NOT NULL default '',
+  attribute varchar(255) COLLATE NOCASE NOT NULL default '',
   updated timestamp NOT NULL,
   accessed timestamp NOT NULL,
   comment text
 ) ;
 
 CREATE TABLE IF NOT EXISTS attribute_class (
-  class varchar(255) NOT NULL default '',
-  name varchar(255) NOT NULL default '',
+  class varchar(255) COLLATE NOCASE NOT NULL default '',
+  name varchar(255) COLLATE NOCASE NOT NULL default '',
   updated timestamp NOT NULL,
   accessed timestamp NOT NULL,
   comment text
@@ -34,17 +34,17 @@ CREATE TABLE IF NOT EXISTS attribute_class (
 
 
 CREATE TABLE IF NOT EXISTS device (
-  name varchar(255) NOT NULL default 'nada',
-  alias varchar(255) default NULL,
-  domain varchar(85) NOT NULL default 'nada',
-  family varchar(85) NOT NULL default 'nada',
-  member varchar(85) NOT NULL default 'nada',
+  name varchar(255) COLLATE NOCASE NOT NULL default 'nada',
+  alias varchar(255) COLLATE NOCASE default NULL,
+  domain varchar(85) COLLATE NOCASE NOT NULL default 'nada',
+  family varchar(85) COLLATE NOCASE NOT NULL default 'nada',
+  member varchar(85) COLLATE NOCASE NOT NULL default 'nada',
   exported int(11) default 0,
   ior text,
-  host varchar(255) NOT NULL default 'nada',
-  server varchar(255) NOT NULL default 'nada',
+  host varchar(255) COLLATE NOCASE NOT NULL default 'nada',
+  server varchar(255) COLLATE NOCASE NOT NULL default 'nada',
   pid int(11) default 0,
-  class varchar(255) NOT NULL default 'nada',
+  class varchar(255) COLLATE NOCASE NOT NULL default 'nada',
   version varchar(8) NOT NULL default 'nada',
   started datetime default 0,
   stopped datetime default 0,
@@ -56,11 +56,11 @@ CREATE TABLE IF NOT EXISTS device (
 #
 
 CREATE TABLE IF NOT EXISTS event (
-  name varchar(255) default NULL,
+  name varchar(255) COLLATE NOCASE default NULL,
   exported int(11) default NULL,
   ior text,
-  host varchar(255) default NULL,
-  server varchar(255) default NULL,
+  host varchar(255) COLLATE NOCASE default NULL,
+  server varchar(255) COLLATE NOCASE default NULL,
   pid int(11) default NULL,
   version varchar(8) default NULL,
   started datetime default NULL,
@@ -72,8 +72,8 @@ CREATE TABLE IF NOT EXISTS event (
 #
 
 CREATE TABLE IF NOT EXISTS property (
-  object varchar(255) default NULL,
-  name varchar(255) default NULL,
+  object varchar(255) COLLATE NOCASE default NULL,
+  name varchar(255) COLLATE NOCASE default NULL,
   count int(11) default NULL,
   value text default NULL,
   updated timestamp NOT NULL,
@@ -86,9 +86,9 @@ CREATE TABLE IF NOT EXISTS property (
 #
 
 CREATE TABLE IF NOT EXISTS property_attribute_class (
-  class varchar(255) NOT NULL default '',
-  attribute varchar(255) NOT NULL default '',
-  name varchar(255) NOT NULL default '',
+  class varchar(255) COLLATE NOCASE NOT NULL default '',
+  attribute varchar(255) COLLATE NOCASE NOT NULL default '',
+  name varchar(255) COLLATE NOCASE NOT NULL default '',
   count int(11) NOT NULL default '0',
   value text default NULL,
   updated timestamp NOT NULL,
@@ -101,9 +101,9 @@ CREATE TABLE IF NOT EXISTS property_attribute_class (
 #
 
 CREATE TABLE IF NOT EXISTS property_attribute_device (
-  device varchar(255) NOT NULL default '',
-  attribute varchar(255) NOT NULL default '',
-  name varchar(255) NOT NULL default '',
+  device varchar(255) COLLATE NOCASE NOT NULL default '',
+  attribute varchar(255) COLLATE NOCASE NOT NULL default '',
+  name varchar(255) COLLATE NOCASE NOT NULL default '',
   count int(11) NOT NULL default '0',
   value text default NULL,
   updated timestamp NOT NULL,
@@ -116,8 +116,8 @@ CREATE TABLE IF NOT EXISTS property_attribute_device (
 #
 
 CREATE TABLE IF NOT EXISTS property_class (
-  class varchar(255) NOT NULL default '',
-  name varchar(255) NOT NULL default '',
+  class varchar(255) COLLATE NOCASE NOT NULL default '',
+  name varchar(255) COLLATE NOCASE NOT NULL default '',
   count int(11) NOT NULL default '0',
   value text default NULL,
   updated timestamp NOT NULL,
@@ -130,11 +130,11 @@ CREATE TABLE IF NOT EXISTS property_class (
 #
 
 CREATE TABLE IF NOT EXISTS property_device (
-  device varchar(255) NOT NULL default '',
-  name varchar(255) NOT NULL default '',
-  domain varchar(255) NOT NULL default '',
-  family varchar(255) NOT NULL default '',
-  member varchar(255) NOT NULL default '',  
+  device varchar(255) COLLATE NOCASE NOT NULL default '',
+  name varchar(255) COLLATE NOCASE NOT NULL default '',
+  domain varchar(255) COLLATE NOCASE NOT NULL default '',
+  family varchar(255) COLLATE NOCASE NOT NULL default '',
+  member varchar(255) COLLATE NOCASE NOT NULL default '',  
   count int(11) NOT NULL default '0',
   value text default NULL,
   updated timestamp NOT NULL,
@@ -147,8 +147,8 @@ CREATE TABLE IF NOT EXISTS property_device (
 #
 
 CREATE TABLE IF NOT EXISTS server (
-  name varchar(255) NOT NULL default '',
-  host varchar(255) NOT NULL default '',
+  name varchar(255) COLLATE NOCASE NOT NULL default '',
+  host varchar(255) COLLATE NOCASE NOT NULL default '',
   mode int(11) default '0',
   level int(11) default '0'
 ) ;
@@ -184,8 +184,8 @@ CREATE TABLE IF NOT EXISTS object_history_id (
 CREATE TABLE IF NOT EXISTS property_hist (
   id int(10) NOT NULL default '0',
   date timestamp NOT NULL,
-  object varchar(255) NOT NULL default '',
-  name varchar(255) NOT NULL default '',
+  object varchar(255) COLLATE NOCASE NOT NULL default '',
+  name varchar(255) COLLATE NOCASE NOT NULL default '',
   count int(11) NOT NULL default '0',
   value text
 ) ;
@@ -193,8 +193,8 @@ CREATE TABLE IF NOT EXISTS property_hist (
 CREATE TABLE IF NOT EXISTS property_device_hist (
   id int(10) NOT NULL default '0',
   date timestamp NOT NULL,
-  device varchar(255) NOT NULL default '',
-  name varchar(255) NOT NULL default '',
+  device varchar(255) COLLATE NOCASE NOT NULL default '',
+  name varchar(255) COLLATE NOCASE NOT NULL default '',
   count int(11) NOT NULL default '0',
   value text
 ) ;
@@ -202,8 +202,8 @@ CREATE TABLE IF NOT EXISTS property_device_hist (
 CREATE TABLE IF NOT EXISTS property_class_hist (
   id int(10) NOT NULL default '0',
   date timestamp NOT NULL,
-  class varchar(255) NOT NULL default '',
-  name varchar(255) NOT NULL default '',
+  class varchar(255) COLLATE NOCASE NOT NULL default '',
+  name varchar(255) COLLATE NOCASE NOT NULL default '',
   count int(11) NOT NULL default '0',
   value text
 ) ;
@@ -211,9 +211,9 @@ CREATE TABLE IF NOT EXISTS property_class_hist (
 CREATE TABLE IF NOT EXISTS property_attribute_class_hist (
   id int(10) NOT NULL default '0',
   date timestamp NOT NULL,
-  class varchar(255) NOT NULL default '',
-  attribute varchar(255) NOT NULL default '',
-  name varchar(255) NOT NULL default '',
+  class varchar(255) COLLATE NOCASE NOT NULL default '',
+  attribute varchar(255) COLLATE NOCASE NOT NULL default '',
+  name varchar(255) COLLATE NOCASE NOT NULL default '',
   count int(11) NOT NULL default '0',
   value text
 ) ;
@@ -221,10 +221,34 @@ CREATE TABLE IF NOT EXISTS property_attribute_class_hist (
 CREATE TABLE IF NOT EXISTS property_attribute_device_hist (
   id int(10) NOT NULL default '0',
   date timestamp NOT NULL,
-  device varchar(255) NOT NULL default '',
-  attribute varchar(255) NOT NULL default '',
-  name varchar(255) NOT NULL default '',
+  device varchar(255) COLLATE NOCASE NOT NULL default '',
+  attribute varchar(255) COLLATE NOCASE NOT NULL default '',
+  name varchar(255) COLLATE NOCASE NOT NULL default '',
   count int(11) NOT NULL default '0',
   value text
 ) ;
 
+
+#
+# Indexes
+#
+
+CREATE INDEX IF NOT EXISTS device_name ON device (name);
+CREATE INDEX IF NOT EXISTS device_alias ON device (alias);
+CREATE INDEX IF NOT EXISTS device_server_class ON device (server, class);
+CREATE INDEX IF NOT EXISTS device_class ON device (class);
+CREATE INDEX IF NOT EXISTS device_host ON device (host);
+CREATE INDEX IF NOT EXISTS event_name ON event (name);
+CREATE INDEX IF NOT EXISTS server_name ON server (name);
+CREATE INDEX IF NOT EXISTS attribute_alias_alias ON attribute_alias (alias);
+CREATE INDEX IF NOT EXISTS attribute_alias_name ON attribute_alias (name);
+CREATE INDEX IF NOT EXISTS property_object_name ON property (object, name, count);
+CREATE INDEX IF NOT EXISTS property_device_device_name ON property_device (device, name, count);
+CREATE INDEX IF NOT EXISTS property_class_class_name ON property_class (class, name, count);
+CREATE INDEX IF NOT EXISTS property_attribute_device_device_attribute ON property_attribute_device (device, attribute, name, count);
+CREATE INDEX IF NOT EXISTS property_attribute_class_class_attribute ON property_attribute_class (class, attribute, name, count);
+CREATE INDEX IF NOT EXISTS property_hist_object_name ON property_hist (object, name);
+CREATE INDEX IF NOT EXISTS property_device_hist_device_name ON property_device_hist (device, name);
+CREATE INDEX IF NOT EXISTS property_class_hist_class_name ON property_class_hist (class, name);
+CREATE INDEX IF NOT EXISTS property_attribute_device_hist_device_attribute ON property_attribute_device_hist (device, attribute, name);
+CREATE INDEX IF NOT EXISTS property_attribute_class_hist_class_attribute ON property_attribute_class_hist (class, attribute, name);
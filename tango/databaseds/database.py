@@ -6,6 +6,8 @@ import sys
 import time
 import logging
 import functools
+import threading
+import collections
 
 try:
     import argparse
@@ -97,6 +99,66 @@ def replace_wildcard(text):
     return text
 
 
+class LatencyHistogram:
+    """HDR-like histogram of durations in nanoseconds.
+
+    Values below ``2**SUB_BITS`` get their own bucket; above that, every
+    power of two range is split into ``2**(SUB_BITS - 1)`` buckets, so that
+    recorded values are known within ``2**(1 - SUB_BITS)`` (~3%). Recording
+    is a couple of integer operations and an increment."""
+
+    SUB_BITS = 6
+    HALF = 1 << (SUB_BITS - 1)
+
+    def __init__(self):
+        self.counts = []
+        self.total = 0
+
+    def record(self, value):
+        n_bits = value.bit_length()
+        if n_bits <= self.SUB_BITS:
+            idx = value
+        else:
+            shift = n_bits - self.SUB_BITS
+            idx = shift * self.HALF + (value >> shift)
+        counts = self.counts
+        if idx >= len(counts):
+            counts.extend([0] * (idx + 1 - len(counts)))
+        counts[idx] += 1
+        self.total += 1
+
+    def bucket_upper_value(self, idx):
+        """Highest value recorded in bucket *idx*"""
+        if idx < 2 * self.HALF:
+            return idx
+        shift = idx // self.HALF - 1
+        return ((idx - shift * self.HALF + 1) << shift) - 1
+
+    def percentile(self, percent):
+        """Value below which *percent* % of the recorded values fall"""
+        if not self.total:
+            return 0
+        threshold = max(1, -(-self.total * percent // 100))
+        running = 0
+        for idx, count in enumerate(self.counts):
+            running += count
+            if running >= threshold:
+                return self.bucket_upper_value(idx)
+        return self.bucket_upper_value(len(self.counts) - 1)
+
+    def buckets(self):
+        """(bucket highest value, count) pairs of the non empty buckets"""
+        return [
+            (self.bucket_upper_value(idx), count)
+            for idx, count in enumerate(self.counts)
+            if count
+        ]
+
+    def reset(self):
+        self.counts = []
+        self.total = 0
+
+
 class TimeStructure:
     def __init__(self):
         self.average = 0
@@ -106,6 +168,7 @@ class TimeStructure:
         self.total_elapsed = 0
         self.calls = 0
         self.index = ""
+        self.histogram = LatencyHistogram()
 
 
 def stats(f):
@@ -113,19 +176,21 @@ def stats(f):
 
     @functools.wraps(f)
     def wrapper(self, *args, **kwargs):
-        start = time.time()
+        start = time.perf_counter_ns()
         try:
             return f(self, *args, **kwargs)
         finally:
-            end = time.time()
+            end = time.perf_counter_ns()
             update_timing_stats(self, start, end, fname)
 
     return wrapper
 
 
 def update_timing_stats(dev, time_before, time_after, cmd_name):
+    """Times are monotonic clock readings, in nanoseconds"""
     tmp_time = dev.timing_maps[cmd_name]
-    time_elapsed = (time_after - time_before) * 1000.0
+    tmp_time.histogram.record(time_after - time_before)
+    time_elapsed = (time_after - time_before) / 1e6
     tmp_time.total_elapsed = tmp_time.total_elapsed + time_elapsed
     if time_elapsed > tmp_time.maximum:
         tmp_time.maximum = time_elapsed
@@ -135,6 +200,131 @@ def update_timing_stats(dev, time_before, time_after, cmd_name):
     tmp_time.average = tmp_time.total_elapsed / tmp_time.calls
 
 
+class CacheStructure:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.index = ""
+
+
+class DbCache:
+    """LRU cache of command replies, with a time to live.
+
+    Replies are stored per command (the namespace) and indexed by the object
+    (device or class name) they belong to, so that the commands modifying
+    an object only invalidate the replies for that object."""
+
+    def __init__(self, max_size=10000, ttl=60.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data = collections.OrderedDict()
+        self._objects = {}
+        # incremented by each invalidation: the database is read while
+        # other commands run, a reply read before an invalidation is stale
+        self._generation = 0
+        self.stats = {}
+
+    def _stats(self, namespace):
+        try:
+            return self.stats[namespace]
+        except KeyError:
+            stats = self.stats[namespace] = CacheStructure()
+            stats.index = namespace
+            return stats
+
+    def get(self, namespace, obj, key, func):
+        """Return the cached reply for *key*, or call *func* and cache its
+        result"""
+        if self.max_size <= 0:
+            return func()
+        obj = obj.lower()
+        full_key = namespace, obj, key
+        with self._lock:
+            stats = self._stats(namespace)
+            entry = self._data.get(full_key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._data.move_to_end(full_key)
+                stats.hits += 1
+                return entry[1]
+            stats.misses += 1
+            generation = self._generation
+        value = func()
+        with self._lock:
+            if generation != self._generation:
+                return value
+            self._data[full_key] = time.monotonic() + self.ttl, value
+            self._data.move_to_end(full_key)
+            self._objects.setdefault((namespace, obj), set()).add(full_key)
+            while len(self._data) > self.max_size:
+                old_key, _ = self._data.popitem(last=False)
+                self._discard_index(old_key)
+        return value
+
+    def _discard_index(self, full_key):
+        keys = self._objects.get(full_key[:2])
+        if keys is not None:
+            keys.discard(full_key)
+            if not keys:
+                del self._objects[full_key[:2]]
+
+    def invalidate(self, namespace, obj=None):
+        """Drop the replies of *namespace* for *obj* (all of them if *obj*
+        is None)"""
+        with self._lock:
+            self._generation += 1
+            if obj is None:
+                full_keys = [k for k in self._data if k[0] == namespace]
+            else:
+                full_keys = self._objects.get((namespace, obj.lower()), ())
+            for full_key in list(full_keys):
+                self._data.pop(full_key, None)
+                self._discard_index(full_key)
+
+    def invalidate_device(self, namespace, dev_name):
+        """Drop the replies of *namespace* for *dev_name* and for all the
+        device aliases, since they may point to that device"""
+        with self._lock:
+            aliases = [
+                obj for ns, obj in self._objects if ns == namespace and "/" not in obj
+            ]
+        for obj in aliases + [dev_name]:
+            self.invalidate(namespace, obj)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+            self._objects.clear()
+
+    def reset_stats(self):
+        with self._lock:
+            for stats in self.stats.values():
+                stats.hits = 0
+                stats.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+
+def cached(f):
+    """Serve the command from the device cache. The first element of the
+    argument (or the argument itself for string commands) is the object
+    the reply belongs to"""
+    fname = f.__name__
+
+    @functools.wraps(f)
+    def wrapper(self, argin):
+        if isinstance(argin, str):
+            obj, key = argin, argin
+        else:
+            obj, key = argin[0], tuple(argin)
+        return self.cache.get(fname, obj, key, lambda: f(self, argin))
+
+    wrapper.__db_cached__ = True
+    return wrapper
+
+
 def get_plugin(name):
     fullname = f"{db_access.__package__}.{name}"
     return __import__(fullname, None, None, fullname)
@@ -161,11 +351,28 @@ class DataBase(Device):
 
     Timing_minimum = attribute(dtype=("float64",), max_dim_x=128, access=READ_ONLY)
 
+    Timing_p50 = attribute(dtype=("float64",), max_dim_x=128, access=READ_ONLY)
+
+    Timing_p90 = attribute(dtype=("float64",), max_dim_x=128, access=READ_ONLY)
+
+    Timing_p99 = attribute(dtype=("float64",), max_dim_x=128, access=READ_ONLY)
+
+    Timing_p999 = attribute(dtype=("float64",), max_dim_x=128, access=READ_ONLY)
+
+    Cache_index = attribute(dtype=("str",), max_dim_x=128, access=READ_ONLY)
+
+    Cache_hits = attribute(dtype=("float64",), max_dim_x=128, access=READ_ONLY)
+
+    Cache_misses = attribute(dtype=("float64",), max_dim_x=128, access=READ_ONLY)
+
+    Cache_size = attribute(dtype="int32", access=READ_ONLY)
+
     def init_device(self):
         self._log = logging.getLogger(self.get_name())
         self._log.debug("In init_device()")
         self.attr_StoredProcedureRelease_read = ""
         self.init_timing_stats()
+        self.init_cache()
         m = get_plugin(options.db_access)
         self.db = m.get_db(personal_name=options.argv[1])
         try:
@@ -182,6 +389,12 @@ class DataBase(Device):
                 self.timing_maps[cmd] = TimeStructure()
                 self.timing_maps[cmd].index = cmd
 
+    def init_cache(self):
+        self.cache = DbCache(max_size=options.cache_size, ttl=options.cache_ttl)
+        for cmd in dir(self):
+            if getattr(getattr(self, cmd), "__db_cached__", False):
+                self.cache._stats(cmd)
+
     # --- attribute methods --------------------------------
 
     def read_Timing_maximum(self):
@@ -231,6 +444,43 @@ class DataBase(Device):
         self._log.debug("In read_Timing_minimum()")
         return [x.minimum for x in self.timing_maps.values()]
 
+    def _read_timing_percentile(self, percent):
+        return [
+            x.histogram.percentile(percent) / 1e6 for x in self.timing_maps.values()
+        ]
+
+    def read_Timing_p50(self):
+        self._log.debug("In read_Timing_p50()")
+        return self._read_timing_percentile(50)
+
+    def read_Timing_p90(self):
+        self._log.debug("In read_Timing_p90()")
+        return self._read_timing_percentile(90)
+
+    def read_Timing_p99(self):
+        self._log.debug("In read_Timing_p99()")
+        return self._read_timing_percentile(99)
+
+    def read_Timing_p999(self):
+        self._log.debug("In read_Timing_p999()")
+        return self._read_timing_percentile(99.9)
+
+    def read_Cache_index(self):
+        self._log.debug("In read_Cache_index()")
+        return [x.index for x in self.cache.stats.values()]
+
+    def read_Cache_hits(self):
+        self._log.debug("In read_Cache_hits()")
+        return [x.hits for x in self.cache.stats.values()]
+
+    def read_Cache_misses(self):
+        self._log.debug("In read_Cache_misses()")
+        return [x.misses for x in self.cache.stats.values()]
+
+    def read_Cache_size(self):
+        self._log.debug("In read_Cache_size()")
+        return len(self.cache)
+
     # --- commands -----------------------------------------
 
     @stats
@@ -266,6 +516,7 @@ class DataBase(Device):
         :rtype: tango.DevVoid"""
         self._log.debug("In DbUnExportServer()")
         self.db.unexport_server(argin)
+        self.cache.invalidate("DbImportDevice")
 
     @command(
         dtype_in=("str",),
@@ -306,6 +557,7 @@ class DataBase(Device):
             )
 
         self.db.delete_all_device_attribute_property(dev_name, argin[1:])
+        self.cache.invalidate("DbGetDeviceAttributeProperty2", dev_name)
 
     @command(dtype_in="str", doc_in="Attriibute alias name.", doc_out="none")
     def DbDeleteAttributeAlias(self, argin):
@@ -373,6 +625,7 @@ class DataBase(Device):
         device_name = argin[0]
         nb_attributes = int(argin[1])
         self.db.put_device_attribute_property2(device_name, nb_attributes, argin[2:])
+        self.cache.invalidate("DbGetDeviceAttributeProperty2", device_name)
 
     @command(
         dtype_in="str",
@@ -522,6 +775,7 @@ class DataBase(Device):
 
         for prop_name in argin[2:]:
             self.db.delete_device_attribute_property(dev_name, attr_name, prop_name)
+        self.cache.invalidate("DbGetDeviceAttributeProperty2", dev_name)
 
     @stats
     @command(
@@ -830,6 +1084,7 @@ class DataBase(Device):
             )
 
         self.db.delete_device_attribute(dev_name, attr_name)
+        self.cache.invalidate("DbGetDeviceAttributeProperty2", dev_name)
 
     @stats
     @command(
@@ -892,6 +1147,7 @@ class DataBase(Device):
         device_name = argin[0]
         nb_attributes = int(argin[1])
         self.db.put_device_attribute_property(device_name, nb_attributes, argin[2:])
+        self.cache.invalidate("DbGetDeviceAttributeProperty2", device_name)
 
     @stats
     @command(
@@ -968,8 +1224,9 @@ class DataBase(Device):
         :return:
         :rtype: tango.DevVoid"""
         self._log.debug("In DbUnExportDevice()")
-        dev_name = argin[0].lower()
+        dev_name = argin.lower()
         self.db.unexport_device(dev_name)
+        self.cache.invalidate_device("DbImportDevice", dev_name)
 
     @command(
         dtype_in="str", doc_in="Alias name", dtype_out="str", doc_out="Device name"
@@ -1009,6 +1266,9 @@ class DataBase(Device):
                 "DataBase::DeleteDevice()",
             )
         self.db.delete_device(dev_name)
+        self.cache.invalidate_device("DbImportDevice", dev_name)
+        self.cache.invalidate("DbGetDeviceProperty", dev_name)
+        self.cache.invalidate("DbGetDeviceAttributeProperty2", dev_name)
 
     @command(
         dtype_in=("str",),
@@ -1089,6 +1349,9 @@ class DataBase(Device):
             )
 
         self.db.rename_server(old_name, new_name)
+        self.cache.invalidate("DbImportDevice")
+        self.cache.invalidate("DbGetDeviceProperty")
+        self.cache.invalidate("DbGetDeviceAttributeProperty2")
 
     @stats
     @command(
@@ -1149,6 +1412,7 @@ class DataBase(Device):
             )
 
         self.db.delete_server(argin)
+        self.cache.invalidate("DbImportDevice")
 
     @command(
         dtype_in="str",
@@ -1167,6 +1431,7 @@ class DataBase(Device):
         self._log.debug("In DbGetAttributeAlias()")
         return self.db.get_attribute_alias(argin)
 
+    @stats
     @command(
         dtype_in=("str",),
         doc_in="Elt[0] = DS name (exec_name/inst_name), Elt[1] = Host name",
@@ -1183,8 +1448,19 @@ class DataBase(Device):
         :return: All the data needed by the device server during its startup sequence. Precise list depend on the device server
         :rtype: tango.DevVarStringArray"""
         self._log.debug("In DbGetDataForServerCache()")
-        ##  TODO
-        return [""]
+
+        if len(argin) < 2:
+            self.warn_stream(
+                "DataBase::DbGetDataForServerCache(): insufficient number of arguments "
+            )
+            th_exc(
+                DB_IncorrectArguments,
+                "insufficient number of arguments (two required: server name and host name)",
+                "DataBase::DbGetDataForServerCache()",
+            )
+
+        ds_name, host = argin[:2]
+        return self.db.get_data_for_server_cache(ds_name, host)
 
     @command(
         dtype_in=("str",),
@@ -1254,6 +1530,7 @@ class DataBase(Device):
         device_name = argin[0]
         nb_properties = int(argin[1])
         self.db.put_device_property(device_name, nb_properties, argin[2:])
+        self.cache.invalidate("DbGetDeviceProperty", device_name)
 
     @command(doc_in="none", doc_out="none")
     def ResetTimingValues(self):
@@ -1264,12 +1541,52 @@ class DataBase(Device):
         :return:
         :rtype: tango.DevVoid"""
         self._log.debug("In ResetTimingValues()")
-        for tmp_timing in self.timing_maps.itervalues():
+        for tmp_timing in self.timing_maps.values():
             tmp_timing.average = 0.0
             tmp_timing.minimum = 0.0
             tmp_timing.maximum = 0.0
             tmp_timing.total_elapsed = 0.0
             tmp_timing.calls = 0.0
+            tmp_timing.histogram.reset()
+        self.cache.reset_stats()
+
+    @command(
+        doc_in="none",
+        dtype_out=("str",),
+        doc_out="One line per command: name, then bucket upper bound (ms):count pairs",
+    )
+    def DumpTimingHistograms(self):
+        """Dump the latency histograms of the commands called since the last
+        timing reset. Each line holds the command name followed by the non
+        empty buckets, as ``upper_bound_ms:count``.
+
+        :param :
+        :type: tango.DevVoid
+        :return: One line per command: name, then bucket upper bound (ms):count pairs
+        :rtype: tango.DevVarStringArray"""
+        self._log.debug("In DumpTimingHistograms()")
+        result = []
+        for tmp_name in sorted(self.timing_maps.keys()):
+            buckets = self.timing_maps[tmp_name].histogram.buckets()
+            if buckets:
+                result.append(
+                    tmp_name
+                    + "\t"
+                    + " ".join("%.6f:%d" % (value / 1e6, n) for value, n in buckets)
+                )
+        return result
+
+    @command(doc_in="none", doc_out="none")
+    def ResetCache(self):
+        """Drop all the replies kept in the command cache.
+        Use it after the database has been modified by another process.
+
+        :param :
+        :type: tango.DevVoid
+        :return:
+        :rtype: tango.DevVoid"""
+        self._log.debug("In ResetCache()")
+        self.cache.clear()
 
     @command(
         doc_in="none",
@@ -1309,8 +1626,10 @@ class DataBase(Device):
         class_name = argin[0]
         nb_properties = int(argin[1])
         self.db.put_class_property(class_name, nb_properties, argin[2:])
+        self.cache.invalidate("DbGetClassProperty", class_name)
 
     @stats
+    @cached
     @command(
         dtype_in="str",
         doc_in="Device name (or alias)",
@@ -1354,6 +1673,7 @@ class DataBase(Device):
         dev_name = argin[0]
         for prop_name in argin[1:]:
             self.db.delete_device_property(dev_name, prop_name)
+        self.cache.invalidate("DbGetDeviceProperty", dev_name)
 
     @command(
         dtype_in="str",
@@ -1440,6 +1760,7 @@ class DataBase(Device):
         device_name = argin[0]
         device_alias = argin[1]
         self.db.put_device_alias(device_name, device_alias)
+        self.cache.invalidate("DbImportDevice")
 
     @stats
     @command(
@@ -1482,6 +1803,7 @@ class DataBase(Device):
         argin = replace_wildcard(argin)
         return self.db.get_host_server_list(argin)
 
+    @cached
     @command(
         dtype_in=("str",),
         doc_in="Str[0] = Tango class\nStr[1] = Property name\nStr[2] = Property name",
@@ -1632,6 +1954,7 @@ class DataBase(Device):
                     "DataBase::AddServer()",
                 )
             self.db.add_device(server_name, (dev_name, dfm), klass_name)
+            self.cache.invalidate("DbImportDevice", dev_name)
 
     @stats
     @command(
@@ -1693,6 +2016,7 @@ class DataBase(Device):
         return self.db.get_server_name_list(argin)
 
     @stats
+    @cached
     @command(
         dtype_in=("str",),
         doc_in="Str[0] = Device name\nStr[1] = Attribute name\nStr[n] = Attribute name",
@@ -1741,7 +2065,8 @@ class DataBase(Device):
         self._log.debug("In DbDeleteClassProperty()")
         klass_name = argin[0]
         for prop_name in argin[1:]:
-            self.db.delete_class_property(prop_name)
+            self.db.delete_class_property(klass_name, prop_name)
+        self.cache.invalidate("DbGetClassProperty", klass_name)
 
     @command(
         dtype_in="str",
@@ -1876,6 +2201,7 @@ class DataBase(Device):
         :rtype: tango.DevVoid"""
         self._log.debug("In DbDeleteDeviceAlias()")
         self.db.delete_device_alias(argin)
+        self.cache.invalidate("DbImportDevice")
 
     @stats
     @command(
@@ -1911,6 +2237,7 @@ class DataBase(Device):
         self.db.export_event(event, IOR, host, pid, version)
 
     @stats
+    @cached
     @command(
         dtype_in=("str",),
         doc_in="Str[0] = Device name\nStr[1] = Property name\nStr[n] = Property name",
@@ -1939,6 +2266,48 @@ class DataBase(Device):
         device_name = argin[0]
         return self.db.get_device_property(device_name, argin[1:])
 
+    @stats
+    @command(
+        dtype_in=("str",),
+        doc_in="Str[0] = Device number\nStr[1] = Device name\nStr[n] = Device name\nStr[n + 1] = Property name\nStr[n + m] = Property name\n(all the device properties if no property name is given)",
+        dtype_out=("str",),
+        doc_out="For each device, in the order given:\nStr[0] = Device name\nStr[1] = Property number\nStr[2] = Property name\nStr[3] = Property value number (array case)\nStr[4] = Property value 1\nStr[n] = Property value n (array case)",
+    )
+    def DbGetDevicePropertyBulk(self, argin):
+        """Get properties of several devices in a single call
+
+        :param argin: Str[0] = Device number
+        Str[1] = Device name
+        Str[n] = Device name
+        Str[n + 1] = Property name
+        Str[n + m] = Property name
+        (all the device properties if no property name is given)
+        :type: tango.DevVarStringArray
+        :return: For each device, in the order given:
+        Str[0] = Device name
+        Str[1] = Property number
+        Str[2] = Property name
+        Str[3] = Property value number (array case)
+        Str[4] = Property value 1
+        Str[n] = Property value n (array case)
+        :rtype: tango.DevVarStringArray"""
+        self._log.debug("In DbGetDevicePropertyBulk()")
+        try:
+            nb_dev = int(argin[0])
+        except (IndexError, ValueError):
+            nb_dev = -1
+        if nb_dev < 0 or len(argin) < nb_dev + 1:
+            self.warn_stream(
+                "DataBase::DbGetDevicePropertyBulk(): insufficient number of arguments "
+            )
+            th_exc(
+                DB_IncorrectArguments,
+                "insufficient number of arguments to get device properties",
+                "DataBase::DbGetDevicePropertyBulk()",
+            )
+        dev_names = argin[1 : nb_dev + 1]
+        return self.db.get_device_property_bulk(dev_names, argin[nb_dev + 1 :])
+
     @command(
         dtype_in="str",
         doc_in="Device name",
@@ -2124,6 +2493,11 @@ class DataBase(Device):
             )
         # Lock table
         self.db.add_device(server_name, (dev_name, dfm), klass_name, alias=alias)
+        if alias:
+            # the alias may have been cached for another device
+            self.cache.invalidate_device("DbImportDevice", dev_name)
+        else:
+            self.cache.invalidate("DbImportDevice", dev_name)
 
     @command(
         dtype_in=("str",),
@@ -2175,6 +2549,7 @@ def DbExportDevice(self, argin):
     if pid.lower() == "null":
         pid = "-1"
     self.db.export_device(dev_name, IOR, host, pid, version)
+    self.cache.invalidate_device("DbImportDevice", dev_name)
 
 
 def main(argv=None):
@@ -2199,6 +2574,20 @@ def main(argv=None):
         parser.add_argument(
             "--port", dest="port", default=None, type=int, help="database port"
         )
+        parser.add_argument(
+            "--cache_size",
+            dest="cache_size",
+            type=int,
+            default=10000,
+            help="maximum number of cached command replies (0 disables the cache)",
+        )
+        parser.add_argument(
+            "--cache_ttl",
+            dest="cache_ttl",
+            type=float,
+            default=60.0,
+            help="time to live of the cached command replies, in seconds",
+        )
         parser.add_argument("argv", nargs=argparse.REMAINDER)
         options = parser.parse_args(argv)
         options.argv = ["DataBaseds"] + options.argv
@@ -2220,6 +2609,20 @@ def main(argv=None):
         parser.add_option(
             "--port", dest="port", default=10000, type=int, help="database port"
         )
+        parser.add_option(
+            "--cache_size",
+            dest="cache_size",
+            type=int,
+            default=10000,
+            help="maximum number of cached command replies (0 disables the cache)",
+        )
+        parser.add_option(
+            "--cache_ttl",
+            dest="cache_ttl",
+            type=float,
+            default=60.0,
+            help="time to live of the cached command replies, in seconds",
+        )
         (options, args) = parser.parse_args(argv)
         options.argv = ["DataBaseds"] + args
 
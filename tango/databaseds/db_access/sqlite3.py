@@ -1,20 +1,30 @@
 import os
+import re
+import queue
 import logging
 import functools
+import threading
 
 from concurrent.futures import ThreadPoolExecutor
+from urllib.request import pathname2url
 
 import tango
+from tango import GreenMode
+from tango.device_server import get_worker
 from tango.databaseds.db_errors import *
 
 
 th_exc = tango.Except.throw_exception
+# single writer thread: it owns the writer connection
 Executor = ThreadPoolExecutor(1)
 
 
+SQL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
 def get_create_db_statements():
     statements = []
-    with open("create_db_tables.sql") as f:
+    with open(os.path.join(SQL_DIR, "create_db_tables.sql")) as f:
         lines = f.readlines()
     # strip comments
     lines = (line for line in lines if not line.startswith("#"))
@@ -24,7 +34,7 @@ def get_create_db_statements():
     lines = lines.replace("ENGINE=MyISAM", "")
     statements += lines.split(";")
 
-    with open("create_db.sql") as f:
+    with open(os.path.join(SQL_DIR, "create_db.sql")) as f:
         lines = f.readlines()
     # strip comments
     lines = (line for line in lines if not line.lower().startswith("#"))
@@ -51,24 +61,114 @@ def replace_wildcard(text):
     return text
 
 
+def _match(column, pattern):
+    """Return the SQL condition selecting the rows whose *column* matches
+    *pattern* (escaped as done by :func:`replace_wildcard`) and its parameter.
+
+    Patterns without any wildcard give an equality, which unlike LIKE
+    can use the indexes."""
+    if re.search(r"(?<!\\)[%_]", pattern):
+        return column + " LIKE ? ESCAPE '\\'", pattern
+    return column + " = ?", re.sub(r"\\(.)", r"\1", pattern)
+
+
+# number of bound parameters allowed by sqlite before 3.32
+MAX_PARAMETERS = 999
+
+
+def _chunks(values, size=500):
+    # keep the number of bound parameters below the sqlite limit
+    values = list(values)
+    for i in range(0, len(values), size):
+        yield values[i : i + size]
+
+
+def _fetch_in(cursor, stmt, values, *params):
+    """Execute *stmt* (which must contain a single ``IN ({})`` placeholder)
+    for all *values*, in as few queries as possible, and return all rows.
+    The other parameters *params* count in the bound parameter limit."""
+    size = MAX_PARAMETERS - len(params)
+    if size < 1:
+        raise ValueError("too many parameters for a single query")
+    rows = []
+    for chunk in _chunks(values, size):
+        placeholders = ",".join("?" * len(chunk))
+        cursor.execute(stmt.format(placeholders), tuple(chunk) + params)
+        rows.extend(cursor.fetchall())
+    return rows
+
+
+def _to_str(value):
+    return "" if value is None else str(value)
+
+
+def _format_properties(obj_name, props):
+    result = [obj_name, str(len(props))]
+    for name, values in props.items():
+        result.append(name)
+        result.append(str(len(values)))
+        result.extend(_to_str(value) for value in values)
+    return result
+
+
+def _format_attribute_properties(obj_name, attr_props):
+    result = [obj_name, str(len(attr_props))]
+    for attr_name, props in attr_props.items():
+        result.append(attr_name)
+        result.append(str(len(props)))
+        for name, values in props.items():
+            result.append(name)
+            result.append(str(len(values)))
+            result.extend(_to_str(value) for value in values)
+    return result
+
+
+def _run_blocking(fn, *args):
+    """Call a blocking function. From the gevent event loop (the DataBase
+    device server runs its commands in it), it is called in a thread of the
+    gevent thread pool: the event loop serves the other requests meanwhile,
+    the reads overlap each other and the write in progress"""
+    worker = get_worker()
+    if getattr(worker, "green_mode", None) == GreenMode.Gevent:
+        # delegated to the thread pool only from the event loop thread
+        return worker.run(fn, args, wait=True)
+    return fn(*args)
+
+
 def use_cursor(f):
+    """Run a method which modifies the database on the writer thread, with
+    a cursor on the single writer connection. The transaction is committed
+    when the method returns and rolled back if it raises.
+
+    Nested calls (or calls given an explicit ``cursor`` keyword argument)
+    reuse the current cursor and therefore the current transaction."""
+
     @functools.wraps(f)
-    def wrap(*args, **kwargs):
-        self = args[0]
-        has_cursor = "cursor" in kwargs
-        cursor = kwargs.pop("cursor", None)
-        if not has_cursor:
-            cursor = Executor.submit(self.get_cursor).result()
-        self.cursor = cursor
-        try:
-            ret = Executor.submit(f, *args, **kwargs).result()
-            if not has_cursor:
-                Executor.submit(cursor.connection.commit).result()
-            return ret
-        finally:
-            if not has_cursor:
-                Executor.submit(cursor.close).result()
-                del self.cursor
+    def wrap(self, *args, **kwargs):
+        cursor = kwargs.pop("cursor", None) or self._current_cursor()
+        if cursor is not None:
+            return self._call_with_cursor(f, cursor, args, kwargs)
+        future = Executor.submit(self._write, f, args, kwargs)
+        return _run_blocking(future.result)
+
+    return wrap
+
+
+def use_read_cursor(f):
+    """Run a read-only method with a cursor on one of the pooled read-only
+    connections, in the calling thread or, from the gevent event loop, in a
+    thread of the gevent thread pool (see :func:`_run_blocking`). No commit
+    is done.
+
+    Nested calls (or calls given an explicit ``cursor`` keyword argument)
+    reuse the current cursor."""
+
+    @functools.wraps(f)
+    def wrap(self, *args, **kwargs):
+        cursor = kwargs.pop("cursor", None) or self._current_cursor()
+        if cursor is not None:
+            return self._call_with_cursor(f, cursor, args, kwargs)
+        return _run_blocking(self._read, f, args, kwargs)
 
     return wrap
 
@@ -77,13 +177,22 @@ class SqlDatabase:
     DB_API_NAME = "sqlite3"  # Default implementation
 
     def __init__(
-        self, db_name="tango_database.db", history_depth=10, fire_to_starter=True
+        self,
+        db_name="tango_database.db",
+        history_depth=10,
+        fire_to_starter=True,
+        read_pool_size=4,
     ):
         self._db_api = None
         self._db_conn = None
+        self._local = threading.local()
+        self._readers = queue.LifoQueue()
+        self._readers_lock = threading.Lock()
+        self._readers_created = 0
         self.db_name = db_name
         self.history_depth = history_depth
         self.fire_to_starter = fire_to_starter
+        self.read_pool_size = read_pool_size
         self._logger = logging.getLogger(self.__class__.__name__)
         self._debug = self._logger.debug
         self._info = self._logger.info
@@ -93,10 +202,21 @@ class SqlDatabase:
         self.initialize()
 
     def close_db(self):
+        Executor.submit(self._close_writer).result()
+        while True:
+            try:
+                conn = self._readers.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+        with self._readers_lock:
+            self._readers_created = 0
+        self._db_api = None
+
+    def _close_writer(self):
         if self._db_conn is not None:
             self._db_conn.commit()
             self._db_conn.close()
-        self._db_api = None
         self._db_conn = None
 
     def get_db_api(self):
@@ -110,20 +230,87 @@ class SqlDatabase:
 
     @property
     def db_conn(self):
+        """The writer connection. Only use it from the writer thread"""
         if self._db_conn is None:
             self._db_conn = self.db_api.connect(self.db_name)
+            # WAL lets the readers run concurrently with the writer
+            self._db_conn.execute("PRAGMA journal_mode=WAL")
+            self._db_conn.execute("PRAGMA synchronous=NORMAL")
         return self._db_conn
 
     def get_cursor(self):
         return self.db_conn.cursor()
 
+    @property
+    def cursor(self):
+        return self._local.cursor
+
+    def _current_cursor(self):
+        return getattr(self._local, "cursor", None)
+
+    def _call_with_cursor(self, f, cursor, args, kwargs):
+        previous = self._current_cursor()
+        self._local.cursor = cursor
+        try:
+            return f(self, *args, **kwargs)
+        finally:
+            self._local.cursor = previous
+
+    def _write(self, f, args, kwargs):
+        cursor = self.get_cursor()
+        try:
+            ret = self._call_with_cursor(f, cursor, args, kwargs)
+            cursor.connection.commit()
+            return ret
+        except Exception:
+            cursor.connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def _connect_reader(self):
+        uri = "file:{}?mode=ro".format(pathname2url(os.path.abspath(self.db_name)))
+        return self.db_api.connect(uri, uri=True, check_same_thread=False)
+
+    def _acquire_reader(self):
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+        with self._readers_lock:
+            create = self._readers_created < self.read_pool_size
+            if create:
+                self._readers_created += 1
+        if not create:
+            # pool exhausted: wait for a connection to be released
+            return self._readers.get()
+        try:
+            return self._connect_reader()
+        except Exception:
+            with self._readers_lock:
+                self._readers_created -= 1
+            raise
+
+    def _release_reader(self, conn):
+        self._readers.put(conn)
+
+    def _read(self, f, args, kwargs):
+        conn = self._acquire_reader()
+        try:
+            cursor = conn.cursor()
+            try:
+                return self._call_with_cursor(f, cursor, args, kwargs)
+            finally:
+                cursor.close()
+        finally:
+            self._release_reader(conn)
+
     def initialize(self):
         self._info("Initializing database...")
         if not os.path.isfile(self.db_name):
             self.create_db()
         else:
-            # trigger connection
-            self.db_conn
+            self.upgrade_db()
 
     @use_cursor
     def create_db(self):
@@ -133,6 +320,43 @@ class SqlDatabase:
         for statement in statements:
             cursor.execute(statement)
 
+    @use_cursor
+    def upgrade_db(self):
+        """Bring a database created by an older version to the current
+        schema. The name columns of the older tables are compared case
+        sensitively: they are rebuilt with the COLLATE NOCASE the exact-match
+        queries rely on (and the indexes need to be used by them), then the
+        missing indexes are created."""
+        cursor = self.cursor
+        cursor.execute("SELECT name, sql FROM sqlite_master WHERE type = 'table'")
+        tables = dict(cursor.fetchall())
+        for statement in get_create_db_statements():
+            match = re.match(r"\s*CREATE TABLE IF NOT EXISTS (\w+)", statement)
+            if match is None or "COLLATE NOCASE" not in statement:
+                continue
+            table = match.group(1)
+            sql = tables.get(table)
+            if sql is None or "COLLATE NOCASE" in sql.upper():
+                continue
+            self._info("Upgrading table %s to case insensitive names", table)
+            if not cursor.connection.in_transaction:
+                # make the table rebuilds part of the transaction
+                cursor.execute("BEGIN")
+            # the old indexes go away with the old table
+            cursor.execute(f"ALTER TABLE {table} RENAME TO old_{table}")
+            cursor.execute(statement)
+            cursor.execute(f"INSERT INTO {table} SELECT * FROM old_{table}")
+            cursor.execute(f"DROP TABLE old_{table}")
+        self.create_indexes(cursor=cursor)
+
+    @use_cursor
+    def create_indexes(self):
+        statements = get_create_db_statements()
+        cursor = self.cursor
+        for statement in statements:
+            if statement.strip().upper().startswith("CREATE INDEX"):
+                cursor.execute(statement)
+
     @use_cursor
     def get_id(self, name):
         cursor = self.cursor
@@ -168,11 +392,10 @@ class SqlDatabase:
             for row in rows[:to_del]:
                 cursor.execute("DELETE FROM ? WHERE id=?", (table, row[0]))
 
-    @use_cursor
+    @use_read_cursor
     def get_device_host(self, name):
         cursor = self.cursor
-        name = replace_wildcard(name)
-        cursor.execute("SELECT host FROM device WHERE name LIKE ?", (name,))
+        cursor.execute("SELECT host FROM device WHERE name = ?", (name,))
         row = cursor.fetchone()
         if row is None:
             raise Exception("No host for device '" + name + "'")
@@ -205,7 +428,7 @@ class SqlDatabase:
         cursor = self.cursor
 
         # first delete the tuple (device,name) from the device table
-        cursor.execute("DELETE FROM device WHERE name LIKE ?", (dev_name,))
+        cursor.execute("DELETE FROM device WHERE name = ?", (dev_name,))
 
         # then insert the new value for this tuple
         cursor.execute(
@@ -217,7 +440,7 @@ class SqlDatabase:
 
         # Check if a DServer device entry for the process already exists
         cursor.execute(
-            'SELECT name FROM device WHERE server LIKE ? AND class LIKE "DServer"',
+            "SELECT name FROM device WHERE server = ? AND class = 'DServer'",
             (server_name,),
         )
         if cursor.fetchone() is None:
@@ -238,8 +461,7 @@ class SqlDatabase:
     @use_cursor
     def delete_class_attribute(self, klass_name, attr_name):
         self.cursor.execute(
-            "DELETE FROM property_attribute_class WHERE class LIKE ? AND "
-            "attribute LIKE ?",
+            "DELETE FROM property_attribute_class WHERE class = ? AND attribute = ?",
             (klass_name, attr_name),
         )
 
@@ -281,10 +503,10 @@ class SqlDatabase:
     def delete_class_property(self, klass_name, prop_name):
         cursor = self.cursor
 
-        prop_name = replace_wildcard(prop_name)
+        name_cond, prop_name = _match("name", replace_wildcard(prop_name))
         # Is there something to delete ?
         cursor.execute(
-            "SELECT DISTINCT name FROM property_class WHERE class=? AND name LIKE ?",
+            "SELECT DISTINCT name FROM property_class WHERE class=? AND " + name_cond,
             (klass_name, prop_name),
         )
         for row in cursor.fetchall():
@@ -309,17 +531,16 @@ class SqlDatabase:
     def delete_device(self, dev_name):
         self._info("delete_device(dev_name=%s)", dev_name)
         cursor = self.cursor
-        dev_name = replace_wildcard(dev_name)
 
         # delete the device from the device table
-        cursor.execute("DELETE FROM device WHERE name LIKE ?", (dev_name,))
+        cursor.execute("DELETE FROM device WHERE name = ?", (dev_name,))
 
         # delete device from the property_device table
-        cursor.execute("DELETE FROM property_device WHERE device LIKE ?", (dev_name,))
+        cursor.execute("DELETE FROM property_device WHERE device = ?", (dev_name,))
 
         # delete device from the property_attribute_device table
         cursor.execute(
-            "DELETE FROM property_attribute_device WHERE device LIKE ?", (dev_name,)
+            "DELETE FROM property_attribute_device WHERE device = ?", (dev_name,)
         )
 
     @use_cursor
@@ -329,10 +550,9 @@ class SqlDatabase:
 
     @use_cursor
     def delete_device_attribute(self, dev_name, attr_name):
-        dev_name = replace_wildcard(dev_name)
         self.cursor.execute(
-            "DELETE FROM property_attribute_device WHERE device LIKE ? AND "
-            "attribute LIKE ?",
+            "DELETE FROM property_attribute_device WHERE device = ? AND "
+            "attribute = ?",
             (dev_name, attr_name),
         )
 
@@ -372,19 +592,18 @@ class SqlDatabase:
     @use_cursor
     def delete_device_property(self, dev_name, prop_name):
         cursor = self.cursor
-        prop_name = replace_wildcard(prop_name)
+        name_cond, prop_name = _match("name", replace_wildcard(prop_name))
 
         # Is there something to delete ?
         cursor.execute(
-            "SELECT DISTINCT name FROM property_device WHERE device=? AND "
-            "name LIKE ?",
+            "SELECT DISTINCT name FROM property_device WHERE device=? AND " + name_cond,
             (dev_name, prop_name),
         )
         for row in cursor.fetchall():
             # delete the tuple (device,name,count) from the property table
             cursor.execute(
-                "DELETE FROM property_device WHERE device=? AND name LIKE ?",
-                (dev_name, prop_name),
+                "DELETE FROM property_device WHERE device=? AND name=?",
+                (dev_name, row[0]),
             )
             # Mark this property as deleted
             hist_id = self.get_id("device", cursor=cursor)
@@ -398,18 +617,18 @@ class SqlDatabase:
     @use_cursor
     def delete_property(self, obj_name, prop_name):
         cursor = self.cursor
-        prop_name = replace_wildcard(prop_name)
+        name_cond, prop_name = _match("name", replace_wildcard(prop_name))
 
         # Is there something to delete ?
         cursor.execute(
-            "SELECT DISTINCT name FROM property WHERE object=? AND name LIKE ?",
+            "SELECT DISTINCT name FROM property WHERE object=? AND " + name_cond,
             (obj_name, prop_name),
         )
         for row in cursor.fetchall():
             # delete the tuple (object,name,count) from the property table
             cursor.execute(
-                "DELETE FROM property_device WHERE device=? AND name LIKE ?",
-                (obj_name, prop_name),
+                "DELETE FROM property WHERE object=? AND name=?",
+                (obj_name, row[0]),
             )
             # Mark this property as deleted
             hist_id = self.get_id("object", cursor=cursor)
@@ -423,7 +642,6 @@ class SqlDatabase:
     @use_cursor
     def delete_server(self, server_instance):
         cursor = self.cursor
-        server_instance = replace_wildcard(server_instance)
 
         previous_host = None
         # get host where running
@@ -432,7 +650,7 @@ class SqlDatabase:
             previous_host = self.get_device_host(adm_dev_name)
 
         # then delete the device from the device table
-        cursor.execute("DELETE FROM device WHERE server LIKE ?", (server_instance,))
+        cursor.execute("DELETE FROM device WHERE server = ?", (server_instance,))
 
         # Update host's starter to update controlled servers list
         if self.fire_to_starter and previous_host:
@@ -467,7 +685,7 @@ class SqlDatabase:
                     do_fire = True
                     previous_host = self.get_device_host(dev_name)
 
-        cursor.execute("SELECT server FROM device WHERE name LIKE ?", (dev_name,))
+        cursor.execute("SELECT server FROM device WHERE name = ?", (dev_name,))
         row = cursor.fetchone()
         if row is None:
             th_exc(
@@ -480,12 +698,12 @@ class SqlDatabase:
         # update the new value for this tuple
         cursor.execute(
             "UPDATE device SET exported=1, ior=?, host=?, pid=?, version=?, "
-            'started=datetime("now") WHERE name LIKE ?',
+            'started=datetime("now") WHERE name = ?',
             (IOR, host, pid, version, dev_name),
         )
 
         # update host name in server table
-        cursor.execute("UPDATE server SET host=? WHERE name LIKE ?", (host, server))
+        cursor.execute("UPDATE server SET host=? WHERE name = ?", (host, server))
 
         if do_fire:
             hosts = []
@@ -507,10 +725,11 @@ class SqlDatabase:
             (event, IOR, host, event, pid, version),
         )
 
-    @use_cursor
+    @use_read_cursor
     def get_alias_device(self, dev_alias):
         cursor = self.cursor
-        cursor.execute("SELECT name FROM device WHERE alias LIKE ?", (dev_alias,))
+        alias_cond, dev_alias = _match("alias", dev_alias)
+        cursor.execute("SELECT name FROM device WHERE " + alias_cond, (dev_alias,))
         row = cursor.fetchone()
         if row is None:
             th_exc(
@@ -520,11 +739,11 @@ class SqlDatabase:
             )
         return row[0]
 
-    @use_cursor
+    @use_read_cursor
     def get_attribute_alias(self, attr_alias):
         cursor = self.cursor
         cursor.execute(
-            "SELECT name from attribute_alias WHERE alias LIKE ?", (attr_alias,)
+            "SELECT name from attribute_alias WHERE alias = ?", (attr_alias,)
         )
         row = cursor.fetchone()
         if row is None:
@@ -535,28 +754,33 @@ class SqlDatabase:
             )
         return row[0]
 
-    @use_cursor
+    @use_read_cursor
     def get_attribute_alias_list(self, attr_alias):
         cursor = self.cursor
+        alias_cond, attr_alias = _match("alias", attr_alias)
         cursor.execute(
-            "SELECT DISTINCT alias FROM attribute_alias WHERE alias LIKE ? ORDER BY attribute",
+            "SELECT DISTINCT alias FROM attribute_alias WHERE "
+            + alias_cond
+            + " ORDER BY attribute",
             (attr_alias,),
         )
         return [row[0] for row in cursor.fetchall()]
 
-    @use_cursor
+    @use_read_cursor
     def get_class_attribute_list(self, class_name, wildcard):
         cursor = self.cursor
+        attr_cond, wildcard = _match("attribute", wildcard)
         cursor.execute(
-            "SELECT DISTINCT attribute FROM property_attribute_class WHERE class=? and attribute like ?",
+            "SELECT DISTINCT attribute FROM property_attribute_class WHERE class=? AND "
+            + attr_cond,
             (class_name, wildcard),
         )
         return [row[0] for row in cursor.fetchall()]
 
-    @use_cursor
+    @use_read_cursor
     def get_class_attribute_property(self, class_name, attributes):
         cursor = self.cursor
-        stmt = "SELECT name,value FROM property_attribute_class WHERE class=? AND attribute LIKE ?"
+        stmt = "SELECT name,value FROM property_attribute_class WHERE class=? AND attribute=?"
         result = [class_name, str(len(attributes))]
         for attribute in attributes:
             cursor.execute(stmt, (class_name, attribute))
@@ -568,10 +792,10 @@ class SqlDatabase:
                 result.append(row[1])
         return result
 
-    @use_cursor
+    @use_read_cursor
     def get_class_attribute_property2(self, class_name, attributes):
         cursor = self.cursor
-        stmt = "SELECT name,value FROM property_attribute_class WHERE class=? AND attribute LIKE ? ORDER BY name,count"
+        stmt = "SELECT name,value FROM property_attribute_class WHERE class=? AND attribute=? ORDER BY name,count"
         result = [class_name, str(len(attributes))]
         for attribute in attributes:
             cursor.execute(stmt, (class_name, attribute))
@@ -604,23 +828,33 @@ class SqlDatabase:
                     prop_size = 1
                 else:
                     prop_size = prop_size + 1
+            if prop_size != 0:
+                prop_sizes.append(prop_size)
 
             result.append(str(nb_props))
             j = 0
             k = 0
             for name in prop_names:
                 result.append(name)
-                result.append(prop_sizes[j])
+                result.append(str(prop_sizes[j]))
                 for i in range(0, prop_sizes[j]):
                     result.append(prop_values[k])
                     k = k + 1
                 j = j + 1
         return result
 
-    @use_cursor
+    @use_read_cursor
     def get_class_attribute_property_hist(self, class_name, attribute, prop_name):
         cursor = self.cursor
-        stmt = "SELECT  DISTINCT id FROM property_attribute_class_hist WHERE class=? AND attribute LIKE ? AND name LIKE ? ORDER by date ASC"
+        attr_cond, attribute = _match("attribute", attribute)
+        name_cond, prop_name = _match("name", prop_name)
+        stmt = (
+            "SELECT  DISTINCT id FROM property_attribute_class_hist WHERE class=? AND "
+            + attr_cond
+            + " AND "
+            + name_cond
+            + " ORDER by date ASC"
+        )
 
         result = []
 
@@ -644,7 +878,7 @@ class SqlDatabase:
 
         return result
 
-    @use_cursor
+    @use_read_cursor
     def get_class_for_device(self, dev_name):
         cursor = self.cursor
         cursor.execute("SELECT DISTINCT class FROM device WHERE name=?", (dev_name,))
@@ -657,28 +891,30 @@ class SqlDatabase:
             )
         return row
 
-    @use_cursor
+    @use_read_cursor
     def get_class_inheritance_for_device(self, dev_name):
         cursor = self.cursor
         class_name = self.get_class_for_device(dev_name, cursor=cursor)
         props = self.get_class_property(class_name, "InheritedFrom", cursor=cursor)
         return [class_name] + props[4:]
 
-    @use_cursor
+    @use_read_cursor
     def get_class_list(self, server):
         cursor = self.cursor
+        class_cond, server = _match("class", server)
         cursor.execute(
-            "SELECT DISTINCT class FROM device WHERE class LIKE ? ORDER BY class",
+            "SELECT DISTINCT class FROM device WHERE " + class_cond + " ORDER BY class",
             (server,),
         )
         return [row[0] for row in cursor.fetchall()]
 
-    @use_cursor
+    @use_read_cursor
     def get_class_property(self, class_name, properties):
         cursor = self.cursor
-        stmt = "SELECT count,value FROM property_class WHERE class=? AND name LIKE ? ORDER BY count"
+        stmt = "SELECT count,value FROM property_class WHERE class=? AND name=? ORDER BY count"
+        result = []
         result.append(class_name)
-        result.append(len(properties))
+        result.append(str(len(properties)))
         for prop_name in properties:
             cursor.execute(stmt, (class_name, prop_name))
             rows = cursor.fetchall()
@@ -688,10 +924,15 @@ class SqlDatabase:
                 result.append(row[1])
         return result
 
-    @use_cursor
+    @use_read_cursor
     def get_class_property_hist(self, class_name, prop_name):
         cursor = self.cursor
-        stmt = "SELECT  DISTINCT id FROM property_class_hist WHERE class=? AND AND name LIKE ? ORDER by date ASC"
+        name_cond, prop_name = _match("name", prop_name)
+        stmt = (
+            "SELECT  DISTINCT id FROM property_class_hist WHERE class=? AND "
+            + name_cond
+            + " ORDER by date ASC"
+        )
 
         result = []
 
@@ -714,21 +955,188 @@ class SqlDatabase:
 
         return result
 
-    @use_cursor
+    @use_read_cursor
     def get_class_property_list(self, class_name):
         cursor = self.cursor
+        class_cond, class_name = _match("class", class_name)
         cursor.execute(
-            "SELECT DISTINCT name FROM property_class WHERE class LIKE ? order by NAME",
+            "SELECT DISTINCT name FROM property_class WHERE "
+            + class_cond
+            + " ORDER BY name",
             (class_name,),
         )
         return [row[0] for row in cursor.fetchall()]
 
-    @use_cursor
-    def get_device_alias(self, dev_name):
-        cursor = self.cursor
+    @use_read_cursor
+    def get_data_for_server_cache(self, ds_name, host):
+        """Return everything a device server needs during its startup
+        sequence, fetched with a fixed number of queries whatever the
+        number of classes and devices hosted by the server.
+
+        The result is a flat list of strings made of, in order:
+
+        - the admin device import info (name, IOR, version, server, host,
+          exported flag, PID, class)
+        - the notifd event factory import info (name, IOR, version, host,
+          exported flag, PID) or (name, ``"Not Found"``)
+        - the ``DServer`` class properties
+        - the ``Default`` free object properties
+        - the admin device properties
+        - the server name, the number of classes and the class names
+        - for each class: the class properties, the class attribute
+          properties, the class name followed by the number of devices
+          and their names, and for each device: the device properties
+          and the device attribute properties
+        - the ``CtrlSystem`` free object properties
+        - the access control device import info (same layout as the
+          admin device one) or (name, ``"Not Found"``)
+
+        This is the order expected by the ``DbServerCache`` of cppTango.
+        Property blocks use the same layout as the ``DbGet*Property`` and
+        ``DbGet*AttributeProperty2`` commands and missing values are sent
+        as empty strings."""
+        cursor = self.cursor
+        adm_dev_name = "dserver/" + ds_name
+        notifd_name = "notifd/factory/" + host
+
+        # all devices of the server (admin device included)
         cursor.execute(
-            "SELECT DISTINCT alias FROM device WHERE name LIKE ?", (dev_name,)
+            "SELECT name,ior,version,server,host,exported,pid,class FROM device "
+            "WHERE server = ? ORDER BY name",
+            (ds_name,),
         )
+        adm_row = None
+        class_devices = {}
+        for row in cursor.fetchall():
+            if row[0].lower() == adm_dev_name.lower():
+                adm_row = row
+            elif row[7] != "DServer":
+                class_devices.setdefault(row[7], []).append(row[0])
+        if adm_row is None:
+            th_exc(
+                DB_DeviceNotDefined,
+                "device " + adm_dev_name + " not defined in the database !",
+                "DataBase::GetDataForServerCache()",
+            )
+        adm_dev_name = adm_row[0]
+        classes = list(class_devices)
+        devices = [adm_dev_name]
+        for dev_names in class_devices.values():
+            devices.extend(dev_names)
+
+        # notifd event factory
+        cursor.execute(
+            "SELECT name,ior,version,host,exported,pid FROM event WHERE name = ?",
+            (notifd_name,),
+        )
+        event_row = cursor.fetchone()
+
+        # every property needed, one query per table
+        class_props = {}
+        for klass, name, value in _fetch_in(
+            cursor,
+            "SELECT class,name,value FROM property_class WHERE class IN ({}) "
+            "ORDER BY class,name,count",
+            ["DServer"] + classes,
+        ):
+            props = class_props.setdefault(klass.lower(), {})
+            props.setdefault(name, []).append(value)
+
+        class_attr_props = {}
+        for klass, attr_name, name, value in _fetch_in(
+            cursor,
+            "SELECT class,attribute,name,value FROM property_attribute_class "
+            "WHERE class IN ({}) ORDER BY class,attribute,name,count",
+            classes,
+        ):
+            attrs = class_attr_props.setdefault(klass.lower(), {})
+            props = attrs.setdefault(attr_name, {})
+            props.setdefault(name, []).append(value)
+
+        dev_props = {}
+        for dev_name, name, value in _fetch_in(
+            cursor,
+            "SELECT device,name,value FROM property_device WHERE device IN ({}) "
+            "ORDER BY device,name,count",
+            devices,
+        ):
+            props = dev_props.setdefault(dev_name.lower(), {})
+            props.setdefault(name, []).append(value)
+
+        dev_attr_props = {}
+        for dev_name, attr_name, name, value in _fetch_in(
+            cursor,
+            "SELECT device,attribute,name,value FROM property_attribute_device "
+            "WHERE device IN ({}) ORDER BY device,attribute,name,count",
+            devices,
+        ):
+            attrs = dev_attr_props.setdefault(dev_name.lower(), {})
+            props = attrs.setdefault(attr_name, {})
+            props.setdefault(name, []).append(value)
+
+        obj_props = {}
+        for obj_name, name, value in _fetch_in(
+            cursor,
+            "SELECT object,name,value FROM property WHERE object IN ({}) "
+            "ORDER BY object,name,count",
+            ["Default", "CtrlSystem"],
+        ):
+            props = obj_props.setdefault(obj_name.lower(), {})
+            props.setdefault(name, []).append(value)
+
+        # access control device, from the CtrlSystem Services property
+        tac_name = ""
+        for service in obj_props.get("ctrlsystem", {}).get("Services", []):
+            if service and service.lower().startswith("accesscontrol/tango:"):
+                tac_name = service.split(":", 1)[1]
+                break
+        tac_row = None
+        if tac_name:
+            cursor.execute(
+                "SELECT name,ior,version,server,host,exported,pid,class FROM device "
+                "WHERE name = ?",
+                (tac_name,),
+            )
+            tac_row = cursor.fetchone()
+
+        # build the reply
+        result = [_to_str(value) for value in adm_row]
+        if event_row is None:
+            result += [notifd_name, "Not Found"]
+        else:
+            event_row = list(event_row)
+            if event_row[4] is None:
+                event_row[4] = -1
+            result += [_to_str(value) for value in event_row]
+        result += _format_properties("DServer", class_props.get("dserver", {}))
+        result += _format_properties("Default", obj_props.get("default", {}))
+        adm_props = dev_props.get(adm_dev_name.lower(), {})
+        result += _format_properties(adm_dev_name, adm_props)
+        result += [ds_name, str(len(classes))] + classes
+        for klass in classes:
+            result += _format_properties(klass, class_props.get(klass.lower(), {}))
+            result += _format_attribute_properties(
+                klass, class_attr_props.get(klass.lower(), {})
+            )
+            dev_names = class_devices[klass]
+            result += [klass, str(len(dev_names))] + dev_names
+            for dev_name in dev_names:
+                dev_key = dev_name.lower()
+                result += _format_properties(dev_name, dev_props.get(dev_key, {}))
+                result += _format_attribute_properties(
+                    dev_name, dev_attr_props.get(dev_key, {})
+                )
+        result += _format_properties("CtrlSystem", obj_props.get("ctrlsystem", {}))
+        if tac_row is None:
+            result += [tac_name, "Not Found"]
+        else:
+            result += [_to_str(value) for value in tac_row]
+        return result
+
+    @use_read_cursor
+    def get_device_alias(self, dev_name):
+        cursor = self.cursor
+        cursor.execute("SELECT DISTINCT alias FROM device WHERE name = ?", (dev_name,))
         row = cursor.fetchone()
         if row is None:
             th_exc(
@@ -738,20 +1146,24 @@ class SqlDatabase:
             )
         return row[0]
 
-    @use_cursor
+    @use_read_cursor
     def get_device_alias_list(self, alias):
         cursor = self.cursor
+        alias_cond, alias = _match("alias", alias)
         cursor.execute(
-            "SELECT DISTINCT alias FROM device WHERE alias LIKE ? ORDER BY alias",
+            "SELECT DISTINCT alias FROM device WHERE " + alias_cond + " ORDER BY alias",
             (alias,),
         )
         return [row[0] for row in cursor.fetchall()]
 
-    @use_cursor
+    @use_read_cursor
     def get_device_attribute_list(self, dev_name, attribute):
         cursor = self.cursor
+        attr_cond, attribute = _match("attribute", attribute)
         cursor.execute(
-            "SELECT DISTINCT  attribute FROM property_attribute_device WHERE device=?  AND attribute LIKE ? ORDER BY attribute",
+            "SELECT DISTINCT attribute FROM property_attribute_device WHERE device=? AND "
+            + attr_cond
+            + " ORDER BY attribute",
             (
                 dev_name,
                 attribute,
@@ -759,10 +1171,10 @@ class SqlDatabase:
         )
         return [row[0] for row in cursor.fetchall()]
 
-    @use_cursor
+    @use_read_cursor
     def get_device_attribute_property(self, dev_name, attributes):
         cursor = self.cursor
-        stmt = "SELECT name,value FROM property_attribute_device WHERE device=? AND attribute LIKE ?"
+        stmt = "SELECT name,value FROM property_attribute_device WHERE device=? AND attribute=?"
         result = [dev_name, str(len(attributes))]
         for attribute in attributes:
             cursor.execute(stmt, (dev_name, attribute))
@@ -774,10 +1186,10 @@ class SqlDatabase:
                 result.append(row[1])
         return result
 
-    @use_cursor
+    @use_read_cursor
     def get_device_attribute_property2(self, dev_name, attributes):
         cursor = self.cursor
-        stmt = "SELECT name,value FROM property_attribute_device WHERE device=? AND attribute LIKE ? ORDER BY name,count"
+        stmt = "SELECT name,value FROM property_attribute_device WHERE device=? AND attribute=? ORDER BY name,count"
         result = [dev_name, str(len(attributes))]
         for attribute in attributes:
             cursor.execute(stmt, (dev_name, attribute))
@@ -810,23 +1222,33 @@ class SqlDatabase:
                     prop_size = 1
                 else:
                     prop_size = prop_size + 1
+            if prop_size != 0:
+                prop_sizes.append(prop_size)
 
             result.append(str(nb_props))
             j = 0
             k = 0
             for name in prop_names:
                 result.append(name)
-                result.append(prop_sizes[j])
+                result.append(str(prop_sizes[j]))
                 for i in range(0, prop_sizes[j]):
                     result.append(prop_values[k])
                     k = k + 1
                 j = j + 1
         return result
 
-    @use_cursor
+    @use_read_cursor
     def get_device_attribute_property_hist(self, dev_name, attribute, prop_name):
         cursor = self.cursor
-        stmt = "SELECT  DISTINCT id FROM property_attribute_device_hist WHERE device=? AND attribute LIKE ? AND name LIKE ? ORDER by date ASC"
+        attr_cond, attribute = _match("attribute", attribute)
+        name_cond, prop_name = _match("name", prop_name)
+        stmt = (
+            "SELECT  DISTINCT id FROM property_attribute_device_hist WHERE device=? AND "
+            + attr_cond
+            + " AND "
+            + name_cond
+            + " ORDER by date ASC"
+        )
 
         result = []
 
@@ -850,7 +1272,7 @@ class SqlDatabase:
 
         return result
 
-    @use_cursor
+    @use_read_cursor
     def get_device_class_list(self, server_name):
         cursor = self.cursor
         result = []
@@ -864,34 +1286,52 @@ class SqlDatabase:
 
         return result
 
-    @use_cursor
+    @use_read_cursor
     def get_device_domain_list(self, wildcard):
         cursor = self.cursor
+        name_cond, name = _match("name", wildcard)
+        alias_cond, alias = _match("alias", wildcard)
         cursor.execute(
-            "SELECT DISTINCT domain FROM device WHERE name LIKE ? OR alias LIKE ? ORDER BY domain",
-            (wildcard, wildcard),
+            "SELECT DISTINCT domain FROM device WHERE "
+            + name_cond
+            + " OR "
+            + alias_cond
+            + " ORDER BY domain",
+            (name, alias),
         )
         return [row[0] for row in cursor.fetchall()]
 
-    @use_cursor
+    @use_read_cursor
     def get_device_exported_list(self, wildcard):
         cursor = self.cursor
+        name_cond, name = _match("name", wildcard)
+        alias_cond, alias = _match("alias", wildcard)
         cursor.execute(
-            "SELECT DISTINCT name FROM device WHERE (name LIKE ? OR alias LIKE ?) AND exported=1 ORDER BY name",
-            (wildcard, wildcard),
+            "SELECT DISTINCT name FROM device WHERE ("
+            + name_cond
+            + " OR "
+            + alias_cond
+            + ") AND exported=1 ORDER BY name",
+            (name, alias),
         )
         return [row[0] for row in cursor.fetchall()]
 
-    @use_cursor
+    @use_read_cursor
     def get_device_family_list(self, wildcard):
         cursor = self.cursor
+        name_cond, name = _match("name", wildcard)
+        alias_cond, alias = _match("alias", wildcard)
         cursor.execute(
-            "SELECT DISTINCT family FROM device WHERE name LIKE ? OR alias LIKE ? ORDER BY family",
-            (wildcard, wildcard),
+            "SELECT DISTINCT family FROM device WHERE "
+            + name_cond
+            + " OR "
+            + alias_cond
+            + " ORDER BY family",
+            (name, alias),
         )
         return [row[0] for row in cursor.fetchall()]
 
-    @use_cursor
+    @use_read_cursor
     def get_device_info(self, dev_name):
         cursor = self.cursor
         cursor.execute(
@@ -933,61 +1373,116 @@ class SqlDatabase:
         result = (result_long, result_str)
         return result
 
-    @use_cursor
+    @use_read_cursor
     def get_device_list(self, server_name, class_name):
         cursor = self.cursor
+        server_cond, server_name = _match("server", server_name)
+        class_cond, class_name = _match("class", class_name)
         cursor.execute(
-            "SELECT DISTINCT name FROM device WHERE server LIKE ? AND class LIKE ? ORDER BY name",
+            "SELECT DISTINCT name FROM device WHERE "
+            + server_cond
+            + " AND "
+            + class_cond
+            + " ORDER BY name",
             (server_name, class_name),
         )
         return [row[0] for row in cursor.fetchall()]
 
-    @use_cursor
+    @use_read_cursor
     def get_device_wide_list(self, wildcard):
         cursor = self.cursor
+        name_cond, wildcard = _match("name", wildcard)
         cursor.execute(
-            "SELECT DISTINCT name FROM device WHERE name LIKE ? ORDER BY name",
+            "SELECT DISTINCT name FROM device WHERE " + name_cond + " ORDER BY name",
             (wildcard,),
         )
         return [row[0] for row in cursor.fetchall()]
 
-    @use_cursor
+    @use_read_cursor
     def get_device_member_list(self, wildcard):
         cursor = self.cursor
+        name_cond, wildcard = _match("name", wildcard)
         cursor.execute(
-            "SELECT DISTINCT  member FROM device WHERE name LIKE ? ORDER BY member",
+            "SELECT DISTINCT member FROM device WHERE "
+            + name_cond
+            + " ORDER BY member",
             (wildcard,),
         )
         return [row[0] for row in cursor.fetchall()]
 
-    @use_cursor
+    @use_read_cursor
     def get_device_property(self, dev_name, properties):
         cursor = self.cursor
-        stmt = "SELECT count,value,name FROM property_device WHERE device = ? AND name LIKE ?  ORDER BY count"
+        stmt = "SELECT count,value,name FROM property_device WHERE device = ? AND {} ORDER BY count"
         result = []
         result.append(dev_name)
         result.append(str(len(properties)))
         for prop in properties:
             result.append(prop)
-            tmp_name = replace_wildcard(prop)
-            cursor.execute(stmt, (dev_name, tmp_name))
+            name_cond, tmp_name = _match("name", replace_wildcard(prop))
+            cursor.execute(stmt.format(name_cond), (dev_name, tmp_name))
             rows = cursor.fetchall()
-            result.append(attribute)
             result.append(str(len(rows)))
             for row in rows:
                 result.append(row[1])
         return result
 
-    @use_cursor
+    @use_read_cursor
+    def get_device_property_bulk(self, dev_names, properties):
+        """Return the given properties (all of them when *properties* is
+        empty) of all the given devices, in the DbGetDeviceProperty reply
+        layout repeated once per device"""
+        cursor = self.cursor
+        stmt = "SELECT device,name,value FROM property_device WHERE device IN ({})"
+        # the property names are bound too: split them as well, so that
+        # half of the parameters at least are left for the device names
+        if properties:
+            names_chunks = _chunks(properties, MAX_PARAMETERS // 2)
+        else:
+            names_chunks = [[]]
+        dev_props = {}
+        for names in names_chunks:
+            names_stmt = stmt
+            if names:
+                names_stmt += " AND name IN ({})".format(",".join("?" * len(names)))
+            names_stmt += " ORDER BY device,name,count"
+            for dev_name, name, value in _fetch_in(
+                cursor, names_stmt, dev_names, *names
+            ):
+                props = dev_props.setdefault(dev_name.lower(), {})
+                props.setdefault(name.lower(), (name, []))[1].append(value)
+
+        result = []
+        for dev_name in dev_names:
+            props = dev_props.get(dev_name.lower(), {})
+            if properties:
+                props = [
+                    (prop, props.get(prop.lower(), (prop, []))[1])
+                    for prop in properties
+                ]
+            else:
+                props = list(props.values())
+            result.append(dev_name)
+            result.append(str(len(props)))
+            for name, values in props:
+                result.append(name)
+                result.append(str(len(values)))
+                result.extend(_to_str(value) for value in values)
+        return result
+
+    @use_read_cursor
     def get_device_property_hist(self, device_name, prop_name):
         cursor = self.cursor
-        stmt = "SELECT  DISTINCT id FROM property_device_hist WHERE device=? AND name LIKE ? ORDER by date ASC"
+        name_cond, tmp_name = _match("name", replace_wildcard(prop_name))
+        stmt = (
+            "SELECT  DISTINCT id FROM property_device_hist WHERE device=? AND "
+            + name_cond
+            + " ORDER by date ASC"
+        )
 
         result = []
 
-        tmp_name = replace_wildcard(prop_name)
-
-        cursor.execute(stmt, (class_name, device_name, tmp_name))
+        cursor.execute(stmt, (device_name, tmp_name))
 
         stmt = "SELECT DATE_FORMAT(date,'%Y-%m-%d %H:%i:%s'),value,name,count FROM property_device_hist WHERE id =? AND device =? ORDER BY count ASC"
 
@@ -1003,38 +1498,48 @@ class SqlDatabase:
 
         return result
 
-    @use_cursor
+    @use_read_cursor
     def get_device_server_class_list(self, server_name):
         cursor = self.cursor
+        server_cond, server_name = _match("server", server_name)
         cursor.execute(
-            "SELECT DISTINCT  class FROM device WHERE server LIKE ? ORDER BY class",
-            (sever_name,),
+            "SELECT DISTINCT class FROM device WHERE "
+            + server_cond
+            + " ORDER BY class",
+            (server_name,),
         )
         return [row[0] for row in cursor.fetchall()]
 
-    @use_cursor
+    @use_read_cursor
     def get_exported_device_list_for_class(self, class_name):
         cursor = self.cursor
+        class_cond, class_name = _match("class", class_name)
         cursor.execute(
-            "SELECT  DISTINCT name FROM device WHERE class LIKE ? AND exported=1 ORDER BY name",
+            "SELECT DISTINCT name FROM device WHERE "
+            + class_cond
+            + " AND exported=1 ORDER BY name",
             (class_name,),
         )
         return [row[0] for row in cursor.fetchall()]
 
-    @use_cursor
+    @use_read_cursor
     def get_host_list(self, host_name):
         cursor = self.cursor
+        host_cond, host_name = _match("host", host_name)
         cursor.execute(
-            "SELECT DISTINCT host FROM device WHERE host LIKE ?  ORDER BY host",
+            "SELECT DISTINCT host FROM device WHERE " + host_cond + " ORDER BY host",
             (host_name,),
         )
         return [row[0] for row in cursor.fetchall()]
 
-    @use_cursor
+    @use_read_cursor
     def get_host_server_list(self, host_name):
         cursor = self.cursor
+        host_cond, host_name = _match("host", host_name)
         cursor.execute(
-            "SELECT DISTINCT server FROM device WHERE host LIKE ?  ORDER BY server",
+            "SELECT DISTINCT server FROM device WHERE "
+            + host_cond
+            + " ORDER BY server",
             (host_name,),
         )
         return [row[0] for row in cursor.fetchall()]
@@ -1058,26 +1563,29 @@ class SqlDatabase:
             result.append(names[1])
         return result
 
-    @use_cursor
+    @use_read_cursor
     def get_object_list(self, name):
         cursor = self.cursor
+        object_cond, name = _match("object", name)
         cursor.execute(
-            "SELECT DISTINCT object FROM property WHERE object LIKE ?  ORDER BY object",
+            "SELECT DISTINCT object FROM property WHERE "
+            + object_cond
+            + " ORDER BY object",
             (name,),
         )
         return [row[0] for row in cursor.fetchall()]
 
-    @use_cursor
+    @use_read_cursor
     def get_property(self, object_name, properties):
         cursor = self.cursor
         result = []
         result.append(object_name)
         result.append(str(len(properties)))
-        stmt = "SELECT count,value,name FROM property WHERE object LIKE ?  AND name LIKE ? ORDER BY count"
+        stmt = "SELECT count,value,name FROM property WHERE object = ? AND {} ORDER BY count"
         for prop_name in properties:
             result.append(prop_name)
-            prop_name = replace_wildcard(prop_name)
-            cursor.execute(stmt, (object_name, prop_name))
+            name_cond, prop_name = _match("name", replace_wildcard(prop_name))
+            cursor.execute(stmt.format(name_cond), (object_name, prop_name))
             rows = cursor.fetchall()
             n_rows = len(rows)
             result.append(n_rows)
@@ -1088,13 +1596,17 @@ class SqlDatabase:
                     result.append(" ")
         return result
 
-    @use_cursor
+    @use_read_cursor
     def get_property_hist(self, object_name, prop_name):
         cursor = self.cursor
         result = []
 
-        stmt = "SELECT  DISTINCT id FROM property_hist WHERE object=? AND name LIKE ? ORDER by date"
-        prop_name = replace_wildcard(prop_name)
+        name_cond, prop_name = _match("name", replace_wildcard(prop_name))
+        stmt = (
+            "SELECT  DISTINCT id FROM property_hist WHERE object=? AND "
+            + name_cond
+            + " ORDER by date"
+        )
         cursor.execute(stmt, (object_name, prop_name))
 
         stmt = "SELECT DATE_FORMAT(date,'%Y-%m-%d %H:%i:%s'),value,name,count FROM property_hist WHERE id =? AND object =?"
@@ -1114,16 +1626,19 @@ class SqlDatabase:
 
         return result
 
-    @use_cursor
+    @use_read_cursor
     def get_property_list(self, object_name, wildcard):
         cursor = self.cursor
+        name_cond, wildcard = _match("name", wildcard)
         cursor.execute(
-            "SELECT DISTINCT name FROM property WHERE object LIKE ? AND name LIKE ? ORDER BY name",
+            "SELECT DISTINCT name FROM property WHERE object = ? AND "
+            + name_cond
+            + " ORDER BY name",
             (object_name, wildcard),
         )
         return [row[0] for row in cursor.fetchall()]
 
-    @use_cursor
+    @use_read_cursor
     def get_server_info(self, server_name):
         cursor = self.cursor
         cursor.execute(
@@ -1143,11 +1658,14 @@ class SqlDatabase:
 
         return result
 
-    @use_cursor
+    @use_read_cursor
     def get_server_list(self, wildcard):
         cursor = self.cursor
+        server_cond, wildcard = _match("server", wildcard)
         cursor.execute(
-            "SELECT DISTINCT server FROM device WHERE server LIKE ? ORDER BY server",
+            "SELECT DISTINCT server FROM device WHERE "
+            + server_cond
+            + " ORDER BY server",
             (wildcard,),
         )
         return [row[0] for row in cursor.fetchall()]
@@ -1165,7 +1683,7 @@ class SqlDatabase:
                 result.append(server_name)
         return result
 
-    @use_cursor
+    @use_read_cursor
     def import_device(self, dev_name):
         cursor = self.cursor
         result_long = []
@@ -1173,13 +1691,13 @@ class SqlDatabase:
         # Search first by server name and if nothing found by alias
         # Using OR takes much more time
         cursor.execute(
-            '"SELECT exported,ior,version,pid,server,host,class FROM device WHERE name =?',
+            "SELECT exported,ior,version,pid,server,host,class FROM device WHERE name =?",
             (dev_name,),
         )
         rows = cursor.fetchall()
         if len(rows) == 0:
             cursor.execute(
-                '"SELECT exported,ior,version,pid,server,host,class FROM device WHERE alias =?',
+                "SELECT exported,ior,version,pid,server,host,class FROM device WHERE alias =?",
                 (dev_name,),
             )
             rows = cursor.fetchall()
@@ -1204,13 +1722,13 @@ class SqlDatabase:
         result = (result_long, result_str)
         return result
 
-    @use_cursor
+    @use_read_cursor
     def import_event(self, event_name):
         cursor = self.cursor
         result_long = []
         result_str = []
         cursor.execute(
-            '"SELECT exported,ior,version,pid,host FROM event WHERE name =?',
+            "SELECT exported,ior,version,pid,host FROM event WHERE name =?",
             (event_name,),
         )
         rows = cursor.fetchall()
@@ -1233,7 +1751,7 @@ class SqlDatabase:
         result = (result_long, result_str)
         return result
 
-    @use_cursor
+    @use_read_cursor
     def info(self):
         cursor = self.cursor
         result = []
@@ -1369,7 +1887,7 @@ class SqlDatabase:
                 tmp_value = attr_prop_list[j + 1]
                 # first delete the tuple (device,name,count) from the property table
                 cursor.execute(
-                    "DELETE FROM property_attribute_class WHERE class LIKE ? AND attribute LIKE ? AND name LIKE ?",
+                    "DELETE FROM property_attribute_class WHERE class = ? AND attribute = ? AND name = ?",
                     (class_name, tmp_attribute, tmp_name),
                 )
                 # then insert the new value for this tuple
@@ -1406,7 +1924,7 @@ class SqlDatabase:
                 tmp_name = attr_prop_list[j]
                 # first delete the tuple (device,name,count) from the property table
                 cursor.execute(
-                    "DELETE FROM property_attribute_class WHERE class LIKE ? AND attribute LIKE ? AND name LIKE ?",
+                    "DELETE FROM property_attribute_class WHERE class = ? AND attribute = ? AND name = ?",
                     (class_name, tmp_attribute, tmp_name),
                 )
                 n_rows = attr_prop_list[j + 1]
@@ -1460,7 +1978,7 @@ class SqlDatabase:
             n_rows = attr_prop_list[k + 1]
             # first delete all tuples (device,name) from the property table
             cursor.execute(
-                "DELETE FROM property_class WHERE class LIKE ? AND name LIKE ?",
+                "DELETE FROM property_class WHERE class = ? AND name = ?",
                 (class_name, tmp_name),
             )
 
@@ -1502,7 +2020,7 @@ class SqlDatabase:
             )
         # update the new value for this tuple
         cursor.execute(
-            "UPDATE device SET alias=? ,started=NOW() where name LIKE ?",
+            "UPDATE device SET alias=? ,started=NOW() where name = ?",
             (device_alias, device_name),
         )
 
@@ -1518,7 +2036,7 @@ class SqlDatabase:
                 tmp_value = attr_prop_list[j + 1]
                 # first delete the tuple (device,name,count) from the property table
                 cursor.execute(
-                    "DELETE FROM property_attribute_device WHERE device LIKE ? AND attribute LIKE ? AND name LIKE ?",
+                    "DELETE FROM property_attribute_device WHERE device = ? AND attribute = ? AND name = ?",
                     (device_name, tmp_attribute, tmp_name),
                 )
                 # then insert the new value for this tuple
@@ -1557,7 +2075,7 @@ class SqlDatabase:
                 tmp_name = attr_prop_list[j]
                 # first delete the tuple (device,name,count) from the property table
                 cursor.execute(
-                    "DELETE FROM property_attribute_device WHERE device LIKE ? AND attribute LIKE ? AND name LIKE ?",
+                    "DELETE FROM property_attribute_device WHERE device = ? AND attribute = ? AND name = ?",
                     (device_name, tmp_attribute, tmp_name),
                 )
                 n_rows = attr_prop_list[j + 1]
@@ -1612,7 +2130,7 @@ class SqlDatabase:
             n_rows = attr_prop_list[k + 1]
             # first delete all tuples (device,name) from the property table
             cursor.execute(
-                "DELETE FROM property_device WHERE device LIKE ? AND name LIKE ?",
+                "DELETE FROM property_device WHERE device = ? AND name = ?",
                 (device_name, tmp_name),
             )
 
@@ -1697,7 +2215,7 @@ class SqlDatabase:
         cursor = self.cursor
         self._info("un-export device(dev_name=%s)", dev_name)
         cursor.execute(
-            "UPDATE device SET exported=0,stopped=NOW() WHERE name LIKE ?", (dev_name,)
+            "UPDATE device SET exported=0,stopped=NOW() WHERE name = ?", (dev_name,)
         )
 
     @use_cursor
@@ -1705,7 +2223,7 @@ class SqlDatabase:
         cursor = self.cursor
         self._info("un-export event (event_name=%s)", event_name)
         cursor.execute(
-            "UPDATE event SET exported=0,stopped=NOW() WHERE name LIKE ?", (event_name,)
+            "UPDATE event SET exported=0,stopped=NOW() WHERE name = ?", (event_name,)
         )
 
     @use_cursor
@@ -1713,7 +2231,7 @@ class SqlDatabase:
         cursor = self.cursor
         self._info("un-export all devices from server ", server_name)
         cursor.execute(
-            "UPDATE device SET exported=0,stopped=NOW() WHERE server LIKE ?",
+            "UPDATE device SET exported=0,stopped=NOW() WHERE server = ?",
             (server_name,),
         )
 
@@ -1753,7 +2271,7 @@ class SqlDatabase:
                     cursor=cursor,
                 )
 
-    @use_cursor
+    @use_read_cursor
     def my_sql_select(self, cmd):
         cursor = self.cursor
         cursor.execute(cmd)
@@ -1780,7 +2298,7 @@ class SqlDatabase:
         result = (result_long, result_str)
         return result
 
-    @use_cursor
+    @use_read_cursor
     def get_csdb_server_list(self):
         cursor = self.cursor
 
@@ -1789,19 +2307,17 @@ class SqlDatabase:
         )
         return [row[0] for row in cursor.fetchall()]
 
-    @use_cursor
+    @use_read_cursor
     def get_attribute_alias2(self, attr_name):
         cursor = self.cursor
-        cursor.execute(
-            "SELECT alias from attribute_alias WHERE name LIKE ? ", (attr_name,)
-        )
+        cursor.execute("SELECT alias from attribute_alias WHERE name = ?", (attr_name,))
         return [row[0] for row in cursor.fetchall()]
 
-    @use_cursor
+    @use_read_cursor
     def get_alias_attribute(self, alias_name):
         cursor = self.cursor
         cursor.execute(
-            "SELECT name from attribute_alias WHERE alias LIKE ? ", (alias_name,)
+            "SELECT name from attribute_alias WHERE alias = ?", (alias_name,)
         )
         return [row[0] for row in cursor.fetchall()]
 
@@ -1879,7 +2395,7 @@ def main():
 
 
 def get_db(**keys):
-    return Executor.submit(Sqlite3Database).result()
+    return Sqlite3Database()
 
 
 if __name__ == "__main__":
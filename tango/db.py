@@ -32,6 +32,7 @@ from ._tango import (
     DbHistory,
     DbServerInfo,
     DbServerData,
+    DevFailed,
 )
 
 from .utils import (
@@ -46,6 +47,7 @@ from .utils import (
     ensure_binary,
 )
 from .utils import document_method as __document_method
+from .utils import document_lazily
 
 
 # -~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-
@@ -513,6 +515,64 @@ def __Database__get_device_property(self, dev_name, value):
     )
 
 
+def __Database__get_device_property_bulk(self, dev_names, props=None):
+    """
+    get_device_property_bulk(self, dev_names, props=None) -> dict<str, dict<str, seq<str>>>
+
+        Query the database for the properties of several devices in a
+        single call to the database server.
+
+        New in PyTango 9.4.2
+
+        Parameters :
+            - dev_names : (sequence<str>) device names
+            - props : (str or sequence<str>) property names. If not given, all
+                      the properties of each device are returned.
+
+        Return     : a dictionary which keys are the device names, the value
+                     associated with each key being a dictionary which keys are
+                     the property names and values the sequence of strings
+                     being the property value. When a property name is given
+                     but not defined for a device, its value is an empty list.
+
+        Throws     : ConnectionFailed, CommunicationFailed, DevFailed from device (DB_SQLError)
+    """
+    if is_pure_str(dev_names):
+        dev_names = (dev_names,)
+    if props is None:
+        props = ()
+    elif is_pure_str(props):
+        props = (props,)
+    dev_names, props = list(dev_names), list(props)
+    argin = [str(len(dev_names))] + dev_names + props
+    try:
+        reply = self.command_inout("DbGetDevicePropertyBulk", argin)
+    except DevFailed as df:
+        if df.args[0].reason != "API_CommandNotFound":
+            raise
+        # database server without the bulk command: one call per device
+        result = {}
+        for dev_name in dev_names:
+            names = props
+            if not names:
+                names = self.get_device_property_list(dev_name, "*").value_string
+            result[dev_name] = self.get_device_property(dev_name, list(names))
+        return result
+
+    result = {}
+    index = 0
+    while index < len(reply):
+        dev_props = result[reply[index]] = {}
+        nb_prop = int(reply[index + 1])
+        index += 2
+        for _ in range(nb_prop):
+            name, nb_value = reply[index], int(reply[index + 1])
+            index += 2
+            dev_props[name] = list(reply[index : index + nb_value])
+            index += nb_value
+    return result
+
+
 def __Database__put_device_property(self, dev_name, value):
     """
     put_device_property(self, dev_name, value) -> None
@@ -1055,6 +1115,7 @@ def __init_Database():
     Database.get_property_forced = __Database__get_property_forced
     Database.delete_property = __Database__delete_property
     Database.get_device_property = __Database__get_device_property
+    Database.get_device_property_bulk = __Database__get_device_property_bulk
     Database.put_device_property = __Database__put_device_property
     Database.delete_device_property = __Database__delete_device_property
     Database.get_device_property_list = __Database__get_device_property_list
@@ -3027,14 +3088,14 @@ def __doc_DbServerData():
 def db_init(doc=True):
     __init_DbDatum()
     if doc:
-        __doc_DbDatum()
+        document_lazily(__doc_DbDatum, classes=(DbDatum,))
 
     __init_Database()
     if doc:
-        __doc_Database()
-        __doc_DbDevExportInfo()
-        __doc_DbDevImportInfo()
-        __doc_DbDevInfo()
-        __doc_DbHistory()
-        __doc_DbServerInfo()
-        __doc_DbServerData()
+        document_lazily(__doc_Database, classes=(Database,))
+        document_lazily(__doc_DbDevExportInfo, classes=(DbDevExportInfo,))
+        document_lazily(__doc_DbDevImportInfo, classes=(DbDevImportInfo,))
+        document_lazily(__doc_DbDevInfo, classes=(DbDevInfo,))
+        document_lazily(__doc_DbHistory, classes=(DbHistory,))
+        document_lazily(__doc_DbServerInfo, classes=(DbServerInfo,))
+        document_lazily(__doc_DbServerData, classes=(DbServerData,))
@@ -19,7 +19,10 @@ __docformat__ = "restructuredtext"
 
 import copy
 
+import numpy
+
 from .utils import document_method as __document_method
+from .utils import document_lazily
 from ._tango import DeviceAttribute, ExtractAs
 
 
@@ -49,6 +52,24 @@ def __DeviceAttribute__init(self, da=None):
         self.has_failed = da.has_failed
 
 
+def __DeviceAttribute__value_into(self, out):
+    value = self.value
+    if not isinstance(out, numpy.ndarray):
+        raise TypeError("out must be a numpy array")
+    if value is None:
+        raise ValueError("The attribute has no value")
+    value = numpy.asarray(value)
+    if out.dtype != value.dtype:
+        raise TypeError(f"out dtype {out.dtype} differs from value dtype {value.dtype}")
+    if out.shape != value.shape:
+        raise ValueError(
+            f"out shape {out.shape} differs from value shape {value.shape}"
+        )
+    numpy.copyto(out, value)
+    self.value = out
+    return out
+
+
 def __doc_DeviceAttribute():
     def document_method(method_name, desc, append=True):
         return __document_method(DeviceAttribute, method_name, desc, append)
@@ -79,11 +100,47 @@ def __doc_DeviceAttribute():
             - nb_written  : (int) attribute written total length
 
 
-        And two methods:
+        And three methods:
             - get_date
             - get_err_stack
+            - value_into
     """
 
+    document_method(
+        "value_into",
+        """
+    value_into(self, out) -> numpy.ndarray
+
+            Copy the read value into the given preallocated array, which
+            then replaces the value of this DeviceAttribute (so the received
+            array can be released). It allows an acquisition loop to reuse
+            the same buffers, for example with the attr_value of the
+            EventData received in an event callback::
+
+                def push_event(self, evt):
+                    if not evt.err:
+                        evt.attr_value.value_into(self.buffer)
+
+            It is a copy: the received array is not reused (see the note
+            of :meth:`DeviceProxy.read_attribute_into`).
+
+            See also :meth:`DeviceProxy.read_attribute_into` and
+            :class:`~tango.utils.AttributeRingBuffer`.
+
+        Parameters :
+            - out : (numpy.ndarray) writable array with the same shape and
+                    dtype as the value
+
+        Return     : (numpy.ndarray) out
+
+        Throws     : TypeError if out is not a numpy array or its dtype
+                     differs, ValueError if its shape differs or if there
+                     is no value (invalid quality, for example)
+
+        New in PyTango 9.4.2
+    """,
+    )
+
     document_method(
         "get_date",
         """
@@ -148,9 +205,10 @@ def __init_DeviceAttribute():
     DeviceAttribute.__init_orig = DeviceAttribute.__init__
     DeviceAttribute.__init__ = __DeviceAttribute__init
     DeviceAttribute.ExtractAs = ExtractAs
+    DeviceAttribute.value_into = __DeviceAttribute__value_into
 
 
 def device_attribute_init(doc=True):
     __init_DeviceAttribute()
     if doc:
-        __doc_DeviceAttribute()
+        document_lazily(__doc_DeviceAttribute, classes=(DeviceAttribute,))
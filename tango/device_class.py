@@ -18,7 +18,11 @@ __all__ = ("DeviceClass", "device_class_init")
 
 __docformat__ = "restructuredtext"
 
+import copy
+import time
+import logging
 import collections.abc
+import concurrent.futures
 
 from ._tango import (
     Except,
@@ -26,17 +30,23 @@ from ._tango import (
     DeviceClass,
     CmdArgType,
     DispLevel,
+    GreenMode,
     UserDefaultAttrProp,
 )
 from .pyutil import Util
 
 from .utils import is_pure_str, is_non_str_seq, seqStr_2_obj, obj_2_str, is_array
+from .utils import _ensure_omni_thread
 from .utils import document_method as __document_method
+from .utils import document_lazily
+from .pytango_init import init_server
 
 from .globals import get_class, get_class_by_class, get_constructed_class_by_class
 from .attr_data import AttrData
 from .pipe_data import PipeData
 
+__log = logging.getLogger("tango")
+
 
 class PropUtil:
     """An internal Property util class"""
@@ -76,9 +86,71 @@ class PropUtil:
 
     def __init__(self):
         self.db = None
+        self._prefetched_device_props = {}
         if Util._UseDb:
             self.db = Util.instance().get_database()
 
+    def prefetch_device_properties(self, dev_names, dev_prop):
+        """
+        prefetch_device_properties(self, dev_names, dev_prop) -> None
+
+                Fetches the device properties of several devices with a
+                single database call. The values are used (once) by the
+                following :meth:`get_device_properties` call for each
+                of these devices.
+
+            Parameters :
+                - dev_names : (sequence<str>) the device names
+                - dev_prop : (dict<str, obj>) the device properties
+
+            Return     : None
+
+            New in PyTango 9.4.2"""
+        if dev_prop == {} or not Util._UseDb or len(dev_names) < 2:
+            return
+        try:
+            props = self.db.get_device_property_bulk(dev_names, list(dev_prop.keys()))
+        except DevFailed:
+            # not fatal: each device will query the database on its own
+            return
+        for dev_name, values in props.items():
+            self._prefetched_device_props[dev_name.lower()] = values
+
+    def clear_prefetched_device_properties(self):
+        """
+        clear_prefetched_device_properties(self) -> None
+
+                Forgets the device property values fetched by
+                :meth:`prefetch_device_properties` and not used yet
+
+            Return     : None
+
+            New in PyTango 9.4.2"""
+        self._prefetched_device_props.clear()
+
+    def copy_properties(self, properties):
+        """
+        copy_properties(self, properties) -> dict<str, obj>
+
+                Returns a copy of the given property data, cheaper than a
+                deep copy: only the mutable default values are deep copied
+
+            Parameters :
+                - properties : (dict<str, obj>) property data
+
+            Return     : (dict<str, obj>) the property data copy
+
+            New in PyTango 9.4.2"""
+        result = {}
+        for name, data in properties.items():
+            data = list(data)
+            if len(data) > 2 and not isinstance(
+                data[2], (str, bytes, int, float, type(None))
+            ):
+                data[2] = copy.deepcopy(data[2])
+            result[name] = data
+        return result
+
     def set_default_property_values(self, dev_class, class_prop, dev_prop):
         """
         set_default_property_values(self, dev_class, class_prop, dev_prop) -> None
@@ -152,11 +224,15 @@ class PropUtil:
         if dev_prop == {} or not Util._UseDb:
             return
 
-        # Call database to get properties
-        props = self.db.get_device_property(dev.get_name(), list(dev_prop.keys()))
+        # Use the values prefetched by the device factory, if any, or call
+        # database to get properties
+        dev_name = dev.get_name()
+        props = self._prefetched_device_props.pop(dev_name.lower(), None)
+        if props is None:
+            props = self.db.get_device_property(dev_name, list(dev_prop.keys()))
         #    if value defined in database, store it
         for name in dev_prop:
-            prop_value = props[name]
+            prop_value = props.get(name, [])
             if len(prop_value):
                 data_type = self.get_property_type(name, dev_prop)
                 values = self.stringArray2values(prop_value, data_type)
@@ -663,11 +739,84 @@ def __DeviceClass__device_factory(self, device_list):
     deviceClassClass, deviceImplClass, deviceImplName = info
     deviceImplClass._device_class_instance = klass
 
-    tmp_dev_list = []
-    for dev_name in device_list:
+    # one database call for the properties of all the devices instead of
+    # one call per device in init_device
+    pu = getattr(self, "prop_util", None)
+    if pu is not None:
+        pu.prefetch_device_properties(list(device_list), self.device_property_list)
+
+    creation_times = self.__dict__.setdefault("_device_creation_times", {})
+
+    def new_device(dev_name):
+        start = time.perf_counter()
         device = self._new_device(deviceImplClass, klass, dev_name)
-        self._add_device(device)
-        tmp_dev_list.append(device)
+        creation_times[dev_name] = duration = time.perf_counter() - start
+        __log.debug("device %s created in %.3f s", dev_name, duration)
+        return device
+
+    max_workers = getattr(deviceImplClass, "max_concurrent_inits", 1)
+    concurrent_inits = max_workers > 1 and len(device_list) > 1
+    if concurrent_inits:
+        from .device_server import get_worker
+
+        if getattr(get_worker(), "green_mode", None) == GreenMode.Gevent:
+            __log.warning(
+                "%s devices are created in the gevent event loop: their "
+                "init_device only run concurrently when they yield to it",
+                klass_name,
+            )
+    tmp_dev_list = []
+    start = time.perf_counter()
+    try:
+        if concurrent_inits:
+            # construct the devices (and run their init_device) concurrently
+            # but add them to the class in the device_list order
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(max_workers, len(device_list)),
+                thread_name_prefix="PyTangoInit",
+                # init_device may push events, use proxies...
+                initializer=_ensure_omni_thread,
+            ) as pool:
+                futures = [pool.submit(new_device, name) for name in device_list]
+                for future in futures:
+                    if future.exception() is not None:
+                        # do not start the creation of the other devices
+                        for other in futures:
+                            other.cancel()
+                        break
+            devices, error = [], None
+            for future in futures:
+                if future.cancelled():
+                    continue
+                if future.exception() is None:
+                    devices.append(future.result())
+                elif error is None:
+                    error = future.exception()
+            if error is not None:
+                # none of them is added to the class: delete the created ones
+                for device in devices:
+                    try:
+                        device.delete_device()
+                    except Exception:
+                        __log.exception("Failed to delete %s", device.get_name())
+                raise error
+            for device in devices:
+                self._add_device(device)
+                tmp_dev_list.append(device)
+        else:
+            for dev_name in device_list:
+                device = new_device(dev_name)
+                self._add_device(device)
+                tmp_dev_list.append(device)
+    finally:
+        if pu is not None:
+            pu.clear_prefetched_device_properties()
+    __log.debug(
+        "%d %s device(s) created in %.3f s",
+        len(tmp_dev_list),
+        klass_name,
+        time.perf_counter() - start,
+    )
 
     self.dyn_attr(tmp_dev_list)
 
@@ -679,6 +828,22 @@ def __DeviceClass__device_factory(self, device_list):
     self.py_dev_list += tmp_dev_list
 
 
+def __DeviceClass__get_device_creation_times(self):
+    """
+    get_device_creation_times(self) -> dict<str, float>
+
+        Returns how long the creation of each device of this class took,
+        including its init_device.
+
+        New in PyTango 9.4.2
+
+    Parameters : None
+
+    Return     : (dict<str, float>) the creation time in seconds of each
+                 device, by device name"""
+    return dict(self.__dict__.get("_device_creation_times", {}))
+
+
 def __DeviceClass__create_device(self, device_name, alias=None, cb=None):
     """
     create_device(self, device_name, alias=None, cb=None) -> None
@@ -802,6 +967,7 @@ def __init_DeviceClass():
     DeviceClass._new_device = __DeviceClass__new_device
 
     DeviceClass.device_factory = __DeviceClass__device_factory
+    DeviceClass.get_device_creation_times = __DeviceClass__get_device_creation_times
     DeviceClass.create_device = __DeviceClass__create_device
     DeviceClass.delete_device = __DeviceClass__delete_device
     DeviceClass.dyn_attr = __DeviceClass__dyn_attr
@@ -1081,4 +1247,9 @@ def __doc_DeviceClass():
 def device_class_init(doc=True):
     __init_DeviceClass()
     if doc:
-        __doc_DeviceClass()
+        document_lazily(__doc_DeviceClass, classes=(DeviceClass,))
+
+
+# the low level server API is initialized on first use (see tango.__getattr__),
+# or when this module is imported directly (it needs the functions above)
+init_server()
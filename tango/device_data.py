@@ -18,6 +18,7 @@ __all__ = ("device_data_init",)
 __docformat__ = "restructuredtext"
 
 from .utils import document_method as __document_method
+from .utils import document_lazily
 from ._tango import DeviceData
 
 
@@ -96,4 +97,4 @@ def __doc_DeviceData():
 def device_data_init(doc=True):
     __init_DeviceData()
     if doc:
-        __doc_DeviceData()
+        document_lazily(__doc_DeviceData, classes=(DeviceData,))
@@ -11,19 +11,32 @@
 
 """Define python methods for DeviceProxy object."""
 
+import json
+import inspect
+import asyncio
 import time
 import textwrap
 import threading
 import enum
+import collections
 import collections.abc
+import functools
+import weakref
 import warnings
+import uuid
 
 from ._tango import StdStringVector, DbData, DbDatum, AttributeInfo
 from ._tango import AttributeInfoEx, AttributeInfoList, AttributeInfoListEx
-from ._tango import DeviceProxy, __CallBackAutoDie, __CallBackPushEvent
+from ._tango import (
+    DeviceProxy,
+    __CallBackAutoDie,
+    __CallBackPushEvent,
+    __CallBackBatchPushEvent,
+)
 from ._tango import EventType, DevFailed, Except, ExtractAs, GreenMode
 from ._tango import PipeInfo, PipeInfoList, constants
-from ._tango import CmdArgType, DevState
+from ._tango import CmdArgType, DevState, DevError, DeviceData
+from ._tango import ApiUtil, cb_sub_model, EnsureOmniThread
 
 from .utils import TO_TANGO_TYPE, scalar_to_array_type
 from .utils import is_pure_str, is_non_str_seq, is_integer, is_number
@@ -32,9 +45,11 @@ from .utils import DbData_2_dict, obj_2_property
 from .utils import document_method as __document_method
 from .utils import dir2
 from .utils import ensure_binary
+from .utils import document_lazily
 
+from .connection import __get_command_inout_param
 from .green import green, green_callback
-from .green import get_green_mode
+from .green import get_green_mode, get_object_executor
 
 __all__ = ("device_proxy_init", "get_device_proxy")
 
@@ -42,6 +57,13 @@ __docformat__ = "restructuredtext"
 
 _UNSUBSCRIBE_LIFETIME = 60
 
+# seconds during which a name which is neither a command, an attribute nor a
+# pipe of the device is not looked up again (unless the interface changes)
+_UNKNOWN_NAME_LIFETIME = 10
+
+# maximum number of device interfaces kept by the process wide registry
+_INTERFACE_REGISTRY_SIZE = 1000
+
 
 @green(consume_green_mode=False)
 def get_device_proxy(*args, **kwargs):
@@ -175,30 +197,82 @@ def __init_device_proxy_internals(proxy):
     proxy.__dict__["_initialized"] = True
     proxy.__dict__["_executors"] = executors
     proxy.__dict__["_pending_unsubscribe"] = {}
+    proxy.__dict__["_read_cache"] = None
+    proxy.__dict__["_read_batcher"] = None
+    proxy.__dict__["_interface"] = None
+    proxy.__dict__["_asyncio_ami"] = False
+
+
+class __DeviceInterface:
+    """Commands, attributes and pipes of a device, shared by all the
+    DeviceProxy instances to that device"""
+
+    def __init__(self):
+        self.cmd_cache = {}
+        self.attr_cache = {}
+        self.pipe_cache = ()
+        # lower case name -> time until which it is known not to exist
+        self.unknown_names = {}
+        self.lock = threading.Lock()
+        # weak reference to the proxy subscribed to the interface change
+        # events of the device, False when the device has no event support
+        self.watcher = None
+
+
+class __DeviceInterfaceRegistry:
+    """Process wide, thread safe, LRU bounded registry of the device
+    interfaces, keyed by fully qualified device name"""
+
+    def __init__(self, max_size, interface_class):
+        self.max_size = max_size
+        self.interface_class = interface_class
+        self.lock = threading.Lock()
+        self.interfaces = collections.OrderedDict()
+
+    def get(self, key):
+        with self.lock:
+            interface = self.interfaces.get(key)
+            if interface is None:
+                interface = self.interfaces[key] = self.interface_class()
+                while len(self.interfaces) > self.max_size:
+                    self.interfaces.popitem(last=False)
+            else:
+                self.interfaces.move_to_end(key)
+            return interface
+
+    def clear(self):
+        with self.lock:
+            self.interfaces.clear()
+
+
+_INTERFACE_REGISTRY = __DeviceInterfaceRegistry(
+    _INTERFACE_REGISTRY_SIZE, __DeviceInterface
+)
+
+
+def __get_interface(self):
+    interface = self.__dict__.get("_interface")
+    if interface is None:
+        dev_name = self.dev_name().lower()
+        if self.is_dbase_used():
+            key = f"tango://{self.get_db_host()}:{self.get_db_port()}/{dev_name}"
+        else:
+            key = f"tango://{self.get_dev_host()}:{self.get_dev_port()}/{dev_name}#dbase=no"
+        interface = _INTERFACE_REGISTRY.get(key.lower())
+        self.__dict__["_interface"] = interface
+    return interface
 
 
 def __DeviceProxy__get_cmd_cache(self):
-    try:
-        ret = self.__dict__["__cmd_cache"]
-    except KeyError:
-        self.__dict__["__cmd_cache"] = ret = {}
-    return ret
+    return __get_interface(self).cmd_cache
 
 
 def __DeviceProxy__get_attr_cache(self):
-    try:
-        ret = self.__dict__["__attr_cache"]
-    except KeyError:
-        self.__dict__["__attr_cache"] = ret = {}
-    return ret
+    return __get_interface(self).attr_cache
 
 
 def __DeviceProxy__get_pipe_cache(self):
-    try:
-        ret = self.__dict__["__pipe_cache"]
-    except KeyError:
-        self.__dict__["__pipe_cache"] = ret = ()
-    return ret
+    return __get_interface(self).pipe_cache
 
 
 def __DeviceProxy__init__(self, *args, **kwargs):
@@ -210,7 +284,10 @@ def __DeviceProxy__init__(self, *args, **kwargs):
     bypass___setattr["_executors"][GreenMode.Asyncio] = kwargs.pop(
         "asyncio_executor", None
     )
-    return DeviceProxy.__init_orig__(self, *args, **kwargs)
+    asyncio_ami = kwargs.pop("asyncio_ami", False)
+    DeviceProxy.__init_orig__(self, *args, **kwargs)
+    if asyncio_ami:
+        self.set_asyncio_ami(True)
 
 
 def __DeviceProxy__get_green_mode(self):
@@ -244,8 +321,7 @@ def __DeviceProxy__set_green_mode(self, green_mode=None):
     self._green_mode = green_mode
 
 
-def __DeviceProxy__refresh_cmd_cache(self):
-    cmd_list = self.command_list_query()
+def __build_cmd_cache(cmd_list):
     cmd_cache = {}
     for cmd in cmd_list:
         n = cmd.cmd_name.lower()
@@ -253,11 +329,10 @@ def __DeviceProxy__refresh_cmd_cache(self):
         doc += f" -  in ({cmd.in_type}): {cmd.in_type_desc}\n"
         doc += f" - out ({cmd.out_type}): {cmd.out_type_desc}\n"
         cmd_cache[n] = cmd, doc
-    self.__dict__["__cmd_cache"] = cmd_cache
+    return cmd_cache
 
 
-def __DeviceProxy__refresh_attr_cache(self):
-    attr_list = self.attribute_list_query_ex()
+def __build_attr_cache(attr_list):
     attr_cache = {}
     for attr in attr_list:
         name = attr.name.lower()
@@ -271,12 +346,105 @@ def __DeviceProxy__refresh_attr_cache(self):
             attr.name,
             enum_class,
         )
-    self.__dict__["__attr_cache"] = attr_cache
+    return attr_cache
+
+
+def __interface_change_callback(interface):
+    # must not reference the proxy (no reference cycle)
+    def push_event(event):
+        if event.err:
+            return
+        interface.cmd_cache = __build_cmd_cache(event.cmd_list)
+        interface.attr_cache = __build_attr_cache(event.att_list)
+        interface.unknown_names.clear()
+
+    return push_event
+
+
+def __interface_watcher_gone(interface):
+    # must not reference the proxy (called when it is deleted)
+    def forget(ref):
+        with interface.lock:
+            if interface.watcher is not ref:
+                return
+            interface.watcher = None
+        # nothing keeps the caches up to date anymore: refresh them on use
+        interface.cmd_cache = {}
+        interface.attr_cache = {}
+        interface.pipe_cache = ()
+        interface.unknown_names.clear()
+
+    return forget
+
+
+def __subscribe_interface_change(watcher, interface):
+    proxy = watcher()
+    if proxy is None:
+        return
+    try:
+        with EnsureOmniThread():
+            __DeviceProxy__subscribe_event_global(
+                proxy,
+                EventType.INTERFACE_CHANGE_EVENT,
+                __interface_change_callback(interface),
+                green_mode=GreenMode.Synchronous,
+            )
+    except Exception:
+        # no event support: unknown names expire after _UNKNOWN_NAME_LIFETIME.
+        # Do not try again
+        with interface.lock:
+            if interface.watcher is watcher:
+                interface.watcher = False
+    finally:
+        del proxy
+
+
+def __watch_interface(self):
+    """Keep the shared interface of the device up to date with its
+    interface change events. A single proxy per device subscribes, when it
+    is deleted the next proxy refreshing the interface subscribes again.
+    The subscription is made in the background: the name lookup which
+    refreshed the interface does not wait for it"""
+    interface = __get_interface(self)
+    with interface.lock:
+        if interface.watcher is not None:
+            return
+        watcher = weakref.ref(self, __interface_watcher_gone(interface))
+        interface.watcher = watcher
+    thread = threading.Thread(
+        target=__subscribe_interface_change,
+        args=(watcher, interface),
+        name="InterfaceChangeSubscriber",
+        daemon=True,
+    )
+    thread.start()
+
+
+def __DeviceProxy__refresh_cmd_cache(self):
+    cmd_list = self.command_list_query()
+    __get_interface(self).cmd_cache = __build_cmd_cache(cmd_list)
+    __watch_interface(self)
+
+
+def __DeviceProxy__refresh_attr_cache(self):
+    attr_list = self.attribute_list_query_ex()
+    __get_interface(self).attr_cache = __build_attr_cache(attr_list)
 
 
 def __DeviceProxy__refresh_pipe_cache(self):
     pipe_cache = [pipe_name.lower() for pipe_name in self.get_pipe_list()]
-    self.__dict__["__pipe_cache"] = pipe_cache
+    __get_interface(self).pipe_cache = pipe_cache
+
+
+def __is_unknown_name(self, name_l):
+    expire_time = __get_interface(self).unknown_names.get(name_l)
+    return expire_time is not None and expire_time > time.monotonic()
+
+
+def __add_unknown_name(self, name_l):
+    __watch_interface(self)
+    expire_time = time.monotonic() + _UNKNOWN_NAME_LIFETIME
+    __get_interface(self).unknown_names[name_l] = expire_time
 
 
 def __DeviceProxy__freeze_dynamic_interface(self):
@@ -420,6 +588,9 @@ def __DeviceProxy__getattr(self, name):
         if name_l in self.__get_pipe_cache():
             return self.read_pipe(name)
 
+        if __is_unknown_name(self, name_l):
+            raise AttributeError(name)
+
         try:
             self.__refresh_cmd_cache()
         except Exception as e:
@@ -449,6 +620,8 @@ def __DeviceProxy__getattr(self, name):
         if name_l in self.__get_pipe_cache():
             return self.read_pipe(name)
 
+        if cause is None:
+            __add_unknown_name(self, name_l)
         raise AttributeError(name) from cause
     finally:
         del cause
@@ -468,32 +641,36 @@ def __DeviceProxy__setattr(self, name, value):
         if name_l in self.__get_pipe_cache():
             return self.write_pipe(name, value)
 
-        try:
-            self.__refresh_cmd_cache()
-        except Exception as e:
-            if cause is None:
-                cause = e
+        if not __is_unknown_name(self, name_l):
+            try:
+                self.__refresh_cmd_cache()
+            except Exception as e:
+                if cause is None:
+                    cause = e
 
-        if name_l in self.__get_cmd_cache():
-            raise TypeError("Cannot set the value of a command") from cause
+            if name_l in self.__get_cmd_cache():
+                raise TypeError("Cannot set the value of a command") from cause
 
-        try:
-            self.__refresh_attr_cache()
-        except Exception as e:
-            if cause is None:
-                cause = e
+            try:
+                self.__refresh_attr_cache()
+            except Exception as e:
+                if cause is None:
+                    cause = e
 
-        if name_l in self.__get_attr_cache():
-            return __set_attribute_value(self, name, value)
+            if name_l in self.__get_attr_cache():
+                return __set_attribute_value(self, name, value)
 
-        try:
-            self.__refresh_pipe_cache()
-        except Exception as e:
-            if cause is None:
-                cause = e
+            try:
+                self.__refresh_pipe_cache()
+            except Exception as e:
+                if cause is None:
+                    cause = e
 
-        if name_l in self.__get_pipe_cache():
-            return self.write_pipe(name, value)
+            if name_l in self.__get_pipe_cache():
+                return self.write_pipe(name, value)
+
+            if cause is None:
+                __add_unknown_name(self, name_l)
 
         try:
             if name in self.__dict__ or not self.is_dynamic_interface_frozen():
@@ -546,8 +723,786 @@ def __DeviceProxy__contains(self, key):
     return key.lower() in map(str.lower, self.get_attribute_list())
 
 
+class __AttributeReadCache:
+    """Recent attribute readings of a DeviceProxy, see
+    :meth:`~tango.DeviceProxy.set_read_cache`"""
+
+    def __init__(self, max_age, use_events):
+        self.max_age = max_age
+        self.use_events = use_events
+        self.lock = threading.Lock()
+        # lower case attribute name -> (expire time, extract_as, DeviceAttribute)
+        self.entries = {}
+        # lower case attribute name -> change event id (None while subscribing)
+        self.event_ids = {}
+        self.event_extract_as = {}
+        self.no_events = set()
+        self.hits = 0
+        self.misses = 0
+        self.events = 0
+
+    def get(self, name, extract_as):
+        with self.lock:
+            entry = self.entries.get(name)
+            if entry is not None:
+                expires, entry_extract_as, dev_attr = entry
+                if entry_extract_as == extract_as and time.monotonic() < expires:
+                    self.hits += 1
+                    return dev_attr
+            self.misses += 1
+            return None
+
+    def put(self, name, extract_as, dev_attr):
+        expires = time.monotonic() + self.max_age
+        with self.lock:
+            entry = self.entries.get(name)
+            # do not shorten the life of a value fed by change events
+            if entry is None or entry[0] < expires:
+                self.entries[name] = expires, extract_as, dev_attr
+
+    def invalidate(self, name=None):
+        with self.lock:
+            if name is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(name, None)
+
+    def push_event(self, event):
+        name = event.attr_name.rsplit("/", 1)[-1].lower()
+        with self.lock:
+            self.events += 1
+            if event.err or event.attr_value is None:
+                # the value can no longer be trusted: read it again next time
+                self.entries.pop(name, None)
+            else:
+                # valid until the next change event (or error) arrives
+                extract_as = self.event_extract_as.get(name, ExtractAs.Numpy)
+                self.entries[name] = float("inf"), extract_as, event.attr_value
+
+    def stats(self):
+        with self.lock:
+            return dict(
+                hits=self.hits,
+                misses=self.misses,
+                events=self.events,
+                size=len(self.entries),
+                subscriptions=len(self.event_ids),
+            )
+
+    def reset_stats(self):
+        with self.lock:
+            self.hits = self.misses = self.events = 0
+
+
+def __read_cache_subscribe(self, cache, attr_name, extract_as):
+    name_l = attr_name.lower()
+    with cache.lock:
+        if name_l in cache.event_ids or name_l in cache.no_events:
+            return
+        cache.event_ids[name_l] = None
+        cache.event_extract_as[name_l] = extract_as
+    try:
+        # the first event (current value) is pushed during the subscription
+        event_id = __DeviceProxy__subscribe_event_attrib(
+            self,
+            attr_name,
+            EventType.CHANGE_EVENT,
+            cache.push_event,
+            extract_as=extract_as,
+            green_mode=GreenMode.Synchronous,
+        )
+    except DevFailed:
+        # no change event configured for this attribute: rely on max_age only
+        with cache.lock:
+            del cache.event_ids[name_l]
+            cache.no_events.add(name_l)
+        return
+    with cache.lock:
+        cache.event_ids[name_l] = event_id
+    if cache is not self.__dict__.get("_read_cache"):
+        # the cache was disabled while subscribing
+        __DeviceProxy__unsubscribe_event(self, event_id)
+
+
+def __read_cache_invalidate(self, attr):
+    cache = self.__dict__.get("_read_cache")
+    if cache is None:
+        return
+    name = attr if is_pure_str(attr) else getattr(attr, "name", None)
+    if name is None:
+        cache.invalidate()
+    else:
+        cache.invalidate(name.lower())
+
+
+def __DeviceProxy__set_read_cache(self, max_age=None, use_events=False):
+    """
+    set_read_cache(self, max_age=None, use_events=False) -> None
+
+            Enable (or disable) the client side cache of attribute readings
+            of this DeviceProxy.
+
+            When enabled, :meth:`~tango.DeviceProxy.read_attribute` (and
+            therefore reading attributes as DeviceProxy members) returns the
+            DeviceAttribute of a previous reading of the same attribute, if it
+            is not older than *max_age*, instead of reading it from the device.
+            Writing an attribute through this DeviceProxy discards its cached
+            value. The returned DeviceAttribute is shared between the callers:
+            do not modify it.
+
+        Parameters :
+            - max_age    : (float) maximum age, in seconds, of a cached value.
+                           None or 0 disables the cache.
+            - use_events : (bool) subscribe to the change events of the
+                           attributes read through the cache. Values fed by
+                           change events stay valid until the next event, so
+                           they are never read again from the device. Attributes
+                           without change events fall back to *max_age*.
+
+        Return     : None
+
+        .. versionadded:: 9.4.2
+    """
+    old_cache = self.__dict__.get("_read_cache")
+    if max_age:
+        self.__dict__["_read_cache"] = __AttributeReadCache(max_age, use_events)
+    else:
+        self.__dict__["_read_cache"] = None
+    if old_cache is not None:
+        with old_cache.lock:
+            event_ids = [eid for eid in old_cache.event_ids.values() if eid is not None]
+            old_cache.event_ids.clear()
+        for event_id in event_ids:
+            try:
+                __DeviceProxy__unsubscribe_event(self, event_id)
+            except Exception:
+                pass
+
+
+def __DeviceProxy__get_read_cache(self):
+    """
+    get_read_cache(self) -> float
+
+            Returns the maximum age, in seconds, of the values of the
+            attribute read cache, or None if the cache is disabled (see
+            :meth:`~tango.DeviceProxy.set_read_cache`).
+
+        .. versionadded:: 9.4.2
+    """
+    cache = self.__dict__.get("_read_cache")
+    return None if cache is None else cache.max_age
+
+
+def __DeviceProxy__get_read_cache_stats(self, reset=False):
+    """
+    get_read_cache_stats(self, reset=False) -> dict
+
+            Returns the statistics of the attribute read cache (see
+            :meth:`~tango.DeviceProxy.set_read_cache`): number of *hits* and
+            *misses*, number of change *events* received, number of cached
+            values (*size*) and of change event *subscriptions*.
+
+        Parameters :
+            - reset : (bool) reset the counters after reading them
+
+        Return     : (dict) or None if the cache is disabled
+
+        .. versionadded:: 9.4.2
+    """
+    cache = self.__dict__.get("_read_cache")
+    if cache is None:
+        return None
+    stats = cache.stats()
+    if reset:
+        cache.reset_stats()
+    return stats
+
+
+def __DeviceProxy__clear_read_cache(self):
+    """
+    clear_read_cache(self) -> None
+
+            Discard all the values of the attribute read cache (see
+            :meth:`~tango.DeviceProxy.set_read_cache`).
+
+        .. versionadded:: 9.4.2
+    """
+    __read_cache_invalidate(self, None)
+
+
+class __AttributeReadBatcher:
+    """Merges the read_attribute calls issued to a DeviceProxy from an
+    asyncio event loop within *window* seconds into a single read_attributes
+    call, see :meth:`~tango.DeviceProxy.set_read_batching`.
+
+    Only used from the event loop thread, so no locking is needed."""
+
+    def __init__(self, window):
+        self.window = window
+        # extract_as -> {lower case attribute name: (attribute name, futures)}
+        self.pending = {}
+        self.scheduled = False
+
+    def read(self, proxy, executor, attr_name, extract_as):
+        loop = executor.loop
+        future = loop.create_future()
+        names = self.pending.setdefault(extract_as, {})
+        names.setdefault(attr_name.lower(), (attr_name, []))[1].append(future)
+        if not self.scheduled:
+            self.scheduled = True
+            if self.window:
+                loop.call_later(self.window, self.flush, proxy, executor)
+            else:
+                loop.call_soon(self.flush, proxy, executor)
+        return future
+
+    def flush(self, proxy, executor):
+        pending, self.pending = self.pending, {}
+        self.scheduled = False
+        for extract_as, names in pending.items():
+            attr_names = [attr_name for attr_name, _ in names.values()]
+            call = functools.partial(self.read_all, proxy, attr_names, extract_as)
+            read = executor.loop.run_in_executor(executor.subexecutor, call)
+            read.add_done_callback(functools.partial(self.dispatch, names))
+
+    @staticmethod
+    def read_all(proxy, attr_names, extract_as):
+        try:
+            return proxy._read_attributes(attr_names, extract_as)
+        except DevFailed:
+            if len(attr_names) == 1:
+                raise
+        # the whole call fails if a single name is wrong: read the
+        # attributes one by one so every caller gets its own error
+        result = []
+        for attr_name in attr_names:
+            try:
+                result.append(proxy._read_attribute(attr_name, extract_as))
+            except DevFailed as df:
+                result.append(df)
+        return result
+
+    @staticmethod
+    def dispatch(names, read):
+        try:
+            results = read.result()
+        except BaseException as exc:
+            results = [exc] * len(names)
+        for (_, futures), dev_attr in zip(names.values(), results):
+            exc = None
+            if isinstance(dev_attr, BaseException):
+                exc = dev_attr
+            elif dev_attr.has_failed:
+                exc = DevFailed(*dev_attr.get_err_stack())
+            for future in futures:
+                if future.done():
+                    # cancelled by the caller
+                    continue
+                if exc is None:
+                    future.set_result(dev_attr)
+                else:
+                    future.set_exception(exc)
+
+
+def __DeviceProxy__set_read_batching(self, window=0.0):
+    """
+    set_read_batching(self, window=0.0) -> None
+
+            Enable (or disable) the batching of attribute reads.
+
+            When enabled, the :meth:`~tango.DeviceProxy.read_attribute` calls
+            issued to this DeviceProxy in *Asyncio* green mode from the event
+            loop within *window* seconds are merged into a single
+            :meth:`~tango.DeviceProxy.read_attributes` call to the device.
+            The result of each call is the one it would have got alone,
+            including the errors of each attribute. Concurrent reads of the
+            same attribute share the same DeviceAttribute: do not modify it.
+
+            Reads issued with ``wait=True`` or a ``timeout``, from other
+            green modes or while the attribute read cache is enabled (see
+            :meth:`~tango.DeviceProxy.set_read_cache`) are not batched.
+
+        Parameters :
+            - window : (float) time, in seconds, to wait for more reads
+                       before reading the attributes. 0 (default) batches the
+                       reads issued in the same event loop iteration.
+                       None disables the batching.
+
+        Return     : None
+
+        .. versionadded:: 9.4.2
+    """
+    if window is None:
+        self.__dict__["_read_batcher"] = None
+    else:
+        self.__dict__["_read_batcher"] = __AttributeReadBatcher(window)
+
+
+def __DeviceProxy__get_read_batching(self):
+    """
+    get_read_batching(self) -> float
+
+            Returns the attribute read batching window, in seconds, or None
+            if batching is disabled (see
+            :meth:`~tango.DeviceProxy.set_read_batching`).
+
+        .. versionadded:: 9.4.2
+    """
+    batcher = self.__dict__.get("_read_batcher")
+    return None if batcher is None else batcher.window
+
+
+def __get_loop_executor(self, kwargs):
+    """Returns the asyncio executor of the call if it is issued from its
+    event loop and does not wait for the result, None otherwise"""
+    if kwargs.get("wait"):
+        return None
+    green_mode = kwargs.get("green_mode")
+    if green_mode is None:
+        green_mode = self.get_green_mode()
+    if green_mode != GreenMode.Asyncio:
+        return None
+    executor = get_object_executor(self, green_mode)
+    if not executor.in_executor_context():
+        return None
+    return executor
+
+
+def __green_read_attribute(fn):
+    greener = green(fn)
+
+    @functools.wraps(fn)
+    def read_attribute(self, value, extract_as=ExtractAs.Numpy, **kwargs):
+        batcher = self.__dict__.get("_read_batcher")
+        if kwargs.get("timeout") is not None:
+            # the batched read of several callers has no timeout of its own
+            batcher = None
+        ami = self.__dict__.get("_asyncio_ami")
+        if (batcher is not None or ami) and self.__dict__.get("_read_cache") is None:
+            executor = __get_loop_executor(self, kwargs)
+            if executor is not None:
+                if batcher is not None:
+                    return batcher.read(self, executor, value, extract_as)
+                return __ami_read(self, executor.loop, [value], extract_as, True)
+        return greener(self, value, extract_as, **kwargs)
+
+    return read_attribute
+
+
+def __green_ami(greener, ami_fn):
+    @functools.wraps(greener)
+    def wrapper(self, *args, **kwargs):
+        if self.__dict__.get("_asyncio_ami"):
+            executor = __get_loop_executor(self, kwargs)
+            if executor is not None:
+                for key in ("green_mode", "wait", "timeout"):
+                    kwargs.pop(key, None)
+                return ami_fn(self, executor, *args, **kwargs)
+        return greener(self, *args, **kwargs)
+
+    return wrapper
+
+
+def __ami_resolve(loop, future, result, exc):
+    """Resolve the future from the tango callback thread"""
+
+    def resolve():
+        if future.done():
+            # cancelled by the caller
+            return
+        if exc is None:
+            future.set_result(result)
+        else:
+            future.set_exception(exc)
+
+    try:
+        loop.call_soon_threadsafe(resolve)
+    except RuntimeError:
+        # the event loop has been closed in the meantime
+        pass
+
+
+def __ami_read(self, loop, attr_names, extract_as, single):
+    future = loop.create_future()
+
+    def attr_read(event):
+        result, exc = event.argout, None
+        if event.err:
+            result, exc = None, DevFailed(*event.errors)
+        elif single:
+            result = result[0]
+            if result.has_failed:
+                exc = DevFailed(*result.get_err_stack())
+        __ami_resolve(loop, future, result, exc)
+
+    cb = __CallBackAutoDie()
+    cb.attr_read = attr_read
+    try:
+        self.__read_attributes_asynch(attr_names, cb, extract_as)
+    except DevFailed as df:
+        future.set_exception(df)
+    return future
+
+
+def __ami_read_attributes(self, executor, attr_names, extract_as=ExtractAs.Numpy):
+    return __ami_read(self, executor.loop, list(attr_names), extract_as, False)
+
+
+def __ami_write_error(errors):
+    err_stack = []
+    for named_dev_failed in errors.err_list:
+        err_stack.extend(named_dev_failed.err_stack)
+    if not err_stack:
+        err = DevError()
+        err.reason = "API_AttributeFailed"
+        err.desc = "Failed to write attribute(s)"
+        err.origin = "DeviceProxy.write_attributes_asynch()"
+        err_stack.append(err)
+    return DevFailed(*err_stack)
+
+
+def __ami_write_attributes(self, executor, name_val):
+    loop = executor.loop
+    future = loop.create_future()
+    name_val = [
+        (attr if is_pure_str(attr) else attr.name, value) for attr, value in name_val
+    ]
+    for attr_name, _ in name_val:
+        __read_cache_invalidate(self, attr_name)
+
+    def attr_written(event):
+        exc = __ami_write_error(event.errors) if event.err else None
+        __ami_resolve(loop, future, None, exc)
+
+    cb = __CallBackAutoDie()
+    cb.attr_written = attr_written
+    try:
+        self.__write_attributes_asynch(name_val, cb)
+    except DevFailed as df:
+        future.set_exception(df)
+    return future
+
+
+def __ami_write_attribute(self, executor, attr_name, value):
+    return __ami_write_attributes(self, executor, [(attr_name, value)])
+
+
+def __ami_command_inout(self, executor, cmd_name, cmd_param=None):
+    if cmd_param is not None and not isinstance(cmd_param, DeviceData):
+        cmd_info = self.__get_cmd_cache().get(cmd_name.lower())
+        if cmd_info is None:
+            # the argument type is not known yet: get it (and run this call)
+            # on the executor rather than blocking the event loop
+            def command_inout():
+                self.__refresh_cmd_cache()
+                return self.command_inout(
+                    cmd_name, cmd_param, green_mode=GreenMode.Synchronous
+                )
+
+            return executor.delegate(command_inout)
+        argin = DeviceData()
+        argin.insert(cmd_info[0].in_type, cmd_param)
+    else:
+        argin = __get_command_inout_param(self, cmd_name, cmd_param)
+
+    loop = executor.loop
+    future = loop.create_future()
+    extract_as = self.defaultCommandExtractAs
+
+    def cmd_ended(event):
+        result, exc = None, None
+        if event.err:
+            exc = DevFailed(*event.errors)
+        else:
+            try:
+                result = event.argout_raw.extract(extract_as)
+            except Exception as e:
+                exc = e
+        __ami_resolve(loop, future, result, exc)
+
+    cb = __CallBackAutoDie()
+    cb.cmd_ended = cmd_ended
+    try:
+        self.__command_inout_asynch_cb(cmd_name, argin, cb)
+    except DevFailed as df:
+        future.set_exception(df)
+    return future
+
+
+class __AsyncioAmiUsers:
+    """Proxies with the native asyncio requests enabled. The process uses
+    the PUSH_CALLBACK asynchronous callback model while there is at least
+    one of them, the previous model is restored afterwards"""
+
+    def __init__(self):
+        # reentrant: a proxy may be garbage collected while it is held
+        self.lock = threading.RLock()
+        # id of the proxy -> weak reference to it
+        self.proxies = {}
+        self.previous_model = None
+
+    def add(self, proxy):
+        key = id(proxy)
+        with self.lock:
+            if key in self.proxies:
+                return
+            if not self.proxies:
+                api_util = ApiUtil.instance()
+                self.previous_model = api_util.get_asynch_cb_sub_model()
+                if self.previous_model != cb_sub_model.PUSH_CALLBACK:
+                    api_util.set_asynch_cb_sub_model(cb_sub_model.PUSH_CALLBACK)
+            self.proxies[key] = weakref.ref(proxy, lambda ref: self._remove(key, ref))
+
+    def remove(self, proxy):
+        self._remove(id(proxy))
+
+    def _remove(self, key, ref=None):
+        with self.lock:
+            if ref is not None and self.proxies.get(key) is not ref:
+                return
+            if self.proxies.pop(key, None) is None or self.proxies:
+                return
+            if self.previous_model != cb_sub_model.PUSH_CALLBACK:
+                ApiUtil.instance().set_asynch_cb_sub_model(self.previous_model)
+
+
+_ASYNCIO_AMI_USERS = __AsyncioAmiUsers()
+
+
+def __DeviceProxy__set_asyncio_ami(self, enabled=True):
+    """
+    set_asyncio_ami(self, enabled=True) -> None
+
+            Enable (or disable) the native asynchronous requests in
+            *Asyncio* green mode.
+
+            By default, every asyncio call is run by a thread of the executor,
+            blocked until the device replies. When enabled,
+            :meth:`~tango.DeviceProxy.read_attribute`,
+            :meth:`~tango.DeviceProxy.read_attributes`,
+            :meth:`~tango.DeviceProxy.write_attribute`,
+            :meth:`~tango.DeviceProxy.write_attributes` and
+            :meth:`~tango.DeviceProxy.command_inout` issued from the event
+            loop send an asynchronous (CORBA AMI) request and return an
+            asyncio future resolved by the tango callback thread, so any
+            number of requests can be in flight without using threads.
+
+            While at least one DeviceProxy has it enabled, the process uses
+            the :obj:`~tango.cb_sub_model.PUSH_CALLBACK` asynchronous
+            callback model (see :meth:`tango.ApiUtil.set_asynch_cb_sub_model`).
+            The previous model is restored when the last one disables it or
+            is deleted.
+
+            It can also be enabled with the *asyncio_ami* keyword argument of
+            the DeviceProxy constructor.
+
+        Parameters :
+            - enabled : (bool) enable or disable the native requests
+
+        Return     : None
+
+        .. versionadded:: 9.4.2
+    """
+    if enabled:
+        _ASYNCIO_AMI_USERS.add(self)
+    else:
+        _ASYNCIO_AMI_USERS.remove(self)
+    self.__dict__["_asyncio_ami"] = bool(enabled)
+
+
+def __DeviceProxy__is_asyncio_ami(self):
+    """
+    is_asyncio_ami(self) -> bool
+
+            Returns True if the native asynchronous requests are enabled in
+            *Asyncio* green mode (see :meth:`~tango.DeviceProxy.set_asyncio_ami`).
+
+        .. versionadded:: 9.4.2
+    """
+    return self.__dict__.get("_asyncio_ami", False)
+
+
 def __DeviceProxy__read_attribute(self, value, extract_as=ExtractAs.Numpy):
-    return __check_read_attribute(self._read_attribute(value, extract_as))
+    cache = self.__dict__.get("_read_cache")
+    if cache is None:
+        return __check_read_attribute(self._read_attribute(value, extract_as))
+    name_l = value.lower()
+    dev_attr = cache.get(name_l, extract_as)
+    if dev_attr is None:
+        dev_attr = __check_read_attribute(self._read_attribute(value, extract_as))
+        cache.put(name_l, extract_as, dev_attr)
+        if cache.use_events:
+            __read_cache_subscribe(self, cache, value, extract_as)
+    return dev_attr
+
+
+def __DeviceProxy__read_attribute_into(self, attr_name, out):
+    """
+    read_attribute_into(self, attr_name, out, green_mode=None, wait=True, timeout=None) -> DeviceAttribute
+
+            Read a SPECTRUM or IMAGE attribute and copy its value into the
+            preallocated numpy array *out*, which becomes the value of the
+            returned DeviceAttribute. Acquisition loops reading the same
+            attribute over and over can then reuse the same buffer instead
+            of keeping a new array per read::
+
+                buffer = numpy.empty(65536, dtype=numpy.float64)
+                while acquiring:
+                    proxy.read_attribute_into("spectrum", buffer)
+                    process(buffer)
+
+            The read bypasses the read cache (see :meth:`set_read_cache`).
+
+            .. note::
+                Tango still receives the value in a new buffer, which
+                :meth:`read_attribute` returns without a copy: this method
+                costs one more copy. It does not make a read faster; what it
+                gives is a value at a fixed address (shared memory, a
+                buffer given to another library, the slots of
+                :class:`~tango.utils.AttributeRingBuffer`), the received
+                buffer being released as soon as it is copied.
+                ``tests/benchmark_read_into.py`` measures both.
+
+        Parameters :
+            - attr_name : (str) attribute name
+            - out : (numpy.ndarray) writable array with the shape and dtype
+                    of the value (for example (dim_y, dim_x) for an image)
+            - green_mode : (GreenMode) Defaults to the current DeviceProxy
+                           GreenMode. (see :meth:`~tango.DeviceProxy.get_green_mode`
+                           and :meth:`~tango.DeviceProxy.set_green_mode`).
+            - wait : (bool) whether or not to wait for result. If green_mode
+                     is *Synchronous*, this parameter is ignored as it always
+                     waits for the result.
+            - timeout : (float) The number of seconds to wait for the result.
+                        If None, then there is no limit on the wait time.
+
+        Return     : (DeviceAttribute)
+
+        Throws     : ConnectionFailed, CommunicationFailed, DevFailed from
+                     device, TypeError if the dtype of out differs from the
+                     one of the value, ValueError if the shape differs
+
+        See also :meth:`DeviceAttribute.value_into` and
+        :class:`~tango.utils.AttributeRingBuffer`.
+
+        New in PyTango 9.4.2
+    """
+    dev_attr = __check_read_attribute(self._read_attribute(attr_name, ExtractAs.Numpy))
+    dev_attr.value_into(out)
+    return dev_attr
+
+
+def __read_chunk(self, attr_name, offset, chunk_elems, token):
+    """
+    Reads one chunk of a chunked attribute (see read_attribute_chunks).
+    Returns (chunk, token, number of elements of the value)
+    """
+    import numpy
+
+    client = self.__dict__.get("_chunk_client")
+    if client is None:
+        client = self.__dict__["_chunk_client"] = uuid.uuid4().hex
+    header, data = self.command_inout(
+        "ReadAttributeChunk",
+        ([offset, chunk_elems, token], [attr_name, client]),
+        green_mode=GreenMode.Synchronous,
+    )
+    header = json.loads(header)
+    shape = header["shape"]
+    chunk = numpy.frombuffer(data, dtype=header["dtype"])
+    if len(shape) == 2 and chunk.size:
+        chunk = chunk.reshape(-1, shape[1])
+    return chunk, header["token"], int(numpy.prod(shape))
+
+
+def __read_attribute_chunks(self, executor, attr_name, chunk_elems):
+    offset, token = 0, 0
+    while True:
+        chunk, token, size = executor.run(
+            __read_chunk, (self, attr_name, offset, chunk_elems, token), wait=True
+        )
+        if not chunk.size:
+            return
+        yield chunk
+        offset += chunk.size
+        if offset >= size:
+            return
+
+
+async def __read_attribute_chunks_async(self, executor, attr_name, chunk_elems):
+    offset, token = 0, 0
+    while True:
+        result = executor.run(
+            __read_chunk, (self, attr_name, offset, chunk_elems, token), wait=False
+        )
+        if inspect.isawaitable(result):
+            result = await result
+        chunk, token, size = result
+        if not chunk.size:
+            return
+        yield chunk
+        offset += chunk.size
+        if offset >= size:
+            return
+
+
+def __DeviceProxy__read_attribute_chunks(
+    self, attr_name, chunk_elems=1048576, green_mode=None
+):
+    """
+    read_attribute_chunks(self, attr_name, chunk_elems=1048576, green_mode=None) -> iterator
+
+            Read the value of a large SPECTRUM or IMAGE attribute in slices
+            of at most *chunk_elems* elements, one request per slice, so
+            that neither the client nor the server have to transfer the
+            whole value in a single reply::
+
+                total = 0
+                for chunk in proxy.read_attribute_chunks("frame", 1000000):
+                    total += chunk.sum()
+
+            The attribute must be declared with ``chunked=True`` in the
+            device (see :class:`~tango.server.attribute`). The value is read
+            once by the server, on the first request, so all the chunks
+            belong to the same value.
+
+            Spectrum chunks are 1D numpy arrays. Image chunks are 2D numpy
+            arrays of whole rows (at least one row, even if it has more
+            than *chunk_elems* elements).
+
+            Each chunk is requested according to the green mode: in
+            *Asyncio* green mode the result is an asynchronous iterator::
+
+                async for chunk in proxy.read_attribute_chunks("frame"):
+                    total += chunk.sum()
+
+            A server keeps at most
+            :attr:`~tango.server.BaseDevice.max_chunked_reads` values being
+            read in chunks per client (each DeviceProxy is a client).
+
+        Parameters :
+            - attr_name : (str) attribute name
+            - chunk_elems : (int) maximum number of elements per chunk
+            - green_mode : (GreenMode) Defaults to the current DeviceProxy
+                           GreenMode. (see :meth:`~tango.DeviceProxy.get_green_mode`
+                           and :meth:`~tango.DeviceProxy.set_green_mode`).
+
+        Return     : an iterator (an asynchronous iterator in *Asyncio*
+                     green mode) of read only numpy arrays
+
+        Throws     : ValueError, DevFailed from device (for example if the
+                     attribute is not chunked or the server dropped the
+                     value because the client had too many chunked reads in
+                     progress)
+
+        New in PyTango 9.4.2
+    """
+    if chunk_elems < 1:
+        raise ValueError("chunk_elems must be a positive number")
+    executor = get_object_executor(self, green_mode)
+    if executor.green_mode == GreenMode.Asyncio:
+        return __read_attribute_chunks_async(self, executor, attr_name, chunk_elems)
+    return __read_attribute_chunks(self, executor, attr_name, chunk_elems)
 
 
 def __DeviceProxy__read_attributes_asynch(
@@ -687,6 +1642,7 @@ def __DeviceProxy__write_attribute_asynch(self, attr_name, value, cb=None):
 def __DeviceProxy__write_read_attribute(
     self, attr_name, value, extract_as=ExtractAs.Numpy
 ):
+    __read_cache_invalidate(self, attr_name)
     result = self._write_read_attribute(attr_name, value, extract_as)
     return __check_read_attribute(result)
 
@@ -694,6 +1650,8 @@ def __DeviceProxy__write_read_attribute(
 def __DeviceProxy__write_read_attributes(
     self, name_val, attr_read_names, extract_as=ExtractAs.Numpy
 ):
+    for attr_name, _ in name_val:
+        __read_cache_invalidate(self, attr_name)
     return self._write_read_attributes(name_val, attr_read_names, extract_as)
 
 
@@ -1417,6 +2375,134 @@ def __DeviceProxy__subscribe_event_attrib(
         Except.throw_exception("Py_InternalError", desc, "DeviceProxy.subscribe_event")
 
 
+def __DeviceProxy__subscribe_event_batch(
+    self,
+    attr_name,
+    event_type,
+    callback,
+    max_batch=100,
+    max_latency=0.1,
+    coalesce=False,
+    filters=[],
+    stateless=False,
+    extract_as=ExtractAs.Numpy,
+    green_mode=None,
+):
+    """
+    subscribe_event_batch(self, attr_name, event_type, callback, max_batch=100, max_latency=0.1, coalesce=False, filters=[], stateless=False, extract_as=Numpy, green_mode=None) -> int
+
+            Subscribe for event reception in the push model, receiving the
+            events in batches.
+
+            The events are queued natively, without taking the python GIL,
+            and delivered by a dispatcher thread to the callback as a list of
+            at most *max_batch* events, at the latest *max_latency* seconds
+            after the first queued event. With many high-rate subscriptions
+            this avoids acquiring the GIL (and, in the asyncio and gevent
+            green modes, submitting a job to the executor) once per event.
+
+        Parameters :
+            - attr_name : (str) The device attribute name which will be sent
+                          as an event e.g. "current".
+            - event_type: (EventType) Is the event reason (see subscribe_event)
+            - callback  : (callable) Is any callable object or an object with a
+                          callable "push_events" method. It receives a list
+                          of EventData (or AttrConfEventData, ...)
+            - max_batch : (int) maximum number of events per batch
+            - max_latency : (float) maximum time (seconds) an event may wait
+                            in the queue before being delivered
+            - coalesce  : (bool) if True, only the latest event of the
+                          attribute is delivered for each batch. The ones
+                          it replaces are counted as 'coalesced' in
+                          get_event_batch_statistics()
+            - filters   : (sequence<str>) see subscribe_event
+            - stateless : (bool) see subscribe_event
+            - extract_as : (ExtractAs)
+            - green_mode : the corresponding green mode (default is GreenMode.Synchronous)
+
+        Return     : An event id which has to be specified when unsubscribing
+                     from this event with unsubscribe_event().
+
+        Throws     : EventSystemFailed,
+                     TypeError
+
+        New in PyTango 9.4.2
+    """
+    if hasattr(callback, "push_events") and isinstance(
+        callback.push_events, collections.abc.Callable
+    ):
+        callback = callback.push_events
+    elif not isinstance(callback, collections.abc.Callable):
+        raise TypeError(
+            "Parameter callback should be a callable object or "
+            "an object with a 'push_events' method."
+        )
+    cb = __CallBackBatchPushEvent(int(max_batch), float(max_latency), bool(coalesce))
+    push_events = green_callback(callback, obj=self, green_mode=green_mode)
+    cb.push_events = push_events
+    # events not carrying an EventData (attribute configuration,
+    # data ready...) are not queued: deliver them as a batch of one
+    cb.push_event = lambda event: push_events([event])
+
+    event_id = self.__subscribe_event(
+        attr_name, event_type, cb, filters, stateless, extract_as
+    )
+
+    with self.__get_event_map_lock():
+        se = self.__get_event_map()
+        evt_data = se.get(event_id)
+        if evt_data is None:
+            se[event_id] = (cb, event_type, attr_name)
+            return event_id
+        # Raise exception
+        desc = textwrap.dedent(
+            f"""\
+            Internal PyTango error:
+            {self}.subscribe_event_batch({attr_name}, {event_type}) already has key {event_id} assigned to ({evt_data[2]}, {evt_data[1]})
+            Please report error to PyTango"""
+        )
+        Except.throw_exception(
+            "Py_InternalError", desc, "DeviceProxy.subscribe_event_batch"
+        )
+
+
+def __DeviceProxy__get_event_batch_statistics(self, event_id, flush=False):
+    """
+    get_event_batch_statistics(self, event_id, flush=False) -> dict
+
+            Return the counters of a subscription made with
+            subscribe_event_batch(): the number of events *received*,
+            *coalesced* (replaced by a newer event of the same attribute),
+            *dispatched* to the callback and still *queued*, and the number
+            of *batches* dispatched.
+
+        Parameters :
+            - event_id : (int) the event identifier returned by
+                         subscribe_event_batch()
+            - flush : (bool) if True, the queued events are delivered
+                      without waiting for the batch to be full or the
+                      maximum latency to expire
+
+        Return     : (dict)
+
+        Throws     : KeyError, TypeError
+
+        New in PyTango 9.4.2
+    """
+    with self.__get_event_map_lock():
+        try:
+            cb = self.__get_event_map()[event_id][0]
+        except KeyError:
+            raise KeyError(
+                "This device proxy does not own this subscription " + str(event_id)
+            )
+    if not isinstance(cb, __CallBackBatchPushEvent):
+        raise TypeError(f"Event {event_id} was not subscribed with batches")
+    if flush:
+        cb.flush()
+    return cb.get_statistics()
+
+
 def __DeviceProxy__unsubscribe_event(self, event_id):
     """
     unsubscribe_event(self, event_id) -> None
@@ -1549,6 +2635,238 @@ def __DeviceProxy__get_events(
         )
 
 
+class __EventStream:
+    """Iterator over the events of an attribute, returned by
+    :meth:`~tango.DeviceProxy.events`.
+
+    The events are pushed by the tango event thread into a buffer of at most
+    *maxsize* events (0 means unbounded). When the buffer is full, the
+    *policy* tells which event is discarded: ``"drop_oldest"`` (the oldest
+    buffered event) or ``"drop_newest"`` (the event being received). The
+    number of discarded events is kept in :attr:`dropped`.
+
+    The stream is both an iterator, blocking until the next event arrives,
+    and an asynchronous iterator, awaking the consuming task when the next
+    event arrives. Iteration ends when the stream is closed."""
+
+    POLICIES = ("drop_oldest", "drop_newest")
+
+    def __init__(
+        self, subscribe, unsubscribe, maxsize=0, policy="drop_oldest", executor=None
+    ):
+        if policy not in self.POLICIES:
+            raise ValueError(
+                f"Unknown policy {policy!r} (expected one of {self.POLICIES})"
+            )
+        self.maxsize = maxsize
+        self.policy = policy
+        self.dropped = 0
+        self.event_id = None
+        self._subscribe = subscribe
+        self._unsubscribe = unsubscribe
+        # returns the asyncio executor subscribing for the async consumers
+        self._executor = executor
+        # one subscription, whatever the number of consumers starting. Not
+        # self._cond: the event thread pushes events while subscribing
+        self._subscribe_lock = threading.Lock()
+        self._events = collections.deque()
+        self._cond = threading.Condition()
+        # (loop, future) of the tasks waiting for an event
+        self._waiters = []
+        self._closed = False
+
+    def subscribe(self):
+        with self._subscribe_lock:
+            if self.event_id is None and not self._closed:
+                event_id = self._subscribe(self)
+                with self._cond:
+                    closed = self._closed
+                    if not closed:
+                        self.event_id = event_id
+                if closed:
+                    # closed while subscribing
+                    self._unsubscribe(event_id)
+        return self
+
+    def close(self):
+        """Unsubscribe from the event and end the iteration once the
+        buffered events are consumed"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            event_id, self.event_id = self.event_id, None
+            self._cond.notify_all()
+            waiters, self._waiters = self._waiters, []
+        self._wake(waiters)
+        if event_id is not None:
+            self._unsubscribe(event_id)
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def qsize(self):
+        """Return the number of buffered events"""
+        return len(self._events)
+
+    def push_event(self, event):
+        with self._cond:
+            if self._closed:
+                return
+            if self.maxsize and len(self._events) >= self.maxsize:
+                self.dropped += 1
+                if self.policy == "drop_newest":
+                    return
+                self._events.popleft()
+            self._events.append(event)
+            self._cond.notify()
+            waiters, self._waiters = self._waiters, []
+        self._wake(waiters)
+
+    def _wake(self, waiters):
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(self._resolve, future)
+            except RuntimeError:
+                # event loop closed
+                pass
+
+    @staticmethod
+    def _resolve(future):
+        if not future.done():
+            future.set_result(None)
+
+    def get(self, timeout=None):
+        """Return the next event, waiting at most *timeout* seconds for it
+        (forever if None). Raise StopIteration if the stream is closed
+        and TimeoutError if no event arrived in time."""
+        self.subscribe()
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._events or self._closed, timeout):
+                raise TimeoutError("No event received in time")
+            if self._events:
+                return self._events.popleft()
+        raise StopIteration
+
+    def __iter__(self):
+        return self.subscribe()
+
+    def __next__(self):
+        return self.get()
+
+    def __enter__(self):
+        return self.subscribe()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    async def _async_subscribe(self):
+        if self.event_id is None and not self._closed:
+            executor = self._executor() if self._executor else None
+            loop = asyncio.get_running_loop()
+            if executor is not None and executor.loop is loop:
+                await executor.delegate(self.subscribe)
+            else:
+                subexecutor = getattr(executor, "subexecutor", None)
+                await loop.run_in_executor(subexecutor, self.subscribe)
+        return self
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await self._async_subscribe()
+        while True:
+            with self._cond:
+                if self._events:
+                    return self._events.popleft()
+                if self._closed:
+                    raise StopAsyncIteration
+                loop = asyncio.get_running_loop()
+                future = loop.create_future()
+                waiter = loop, future
+                self._waiters.append(waiter)
+            try:
+                await future
+            finally:
+                # still there if the task was cancelled
+                with self._cond:
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+
+    async def __aenter__(self):
+        return await self._async_subscribe()
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+
+def __DeviceProxy__events(
+    self,
+    attr_name,
+    event_type,
+    maxsize=0,
+    policy="drop_oldest",
+    filters=[],
+    stateless=False,
+    extract_as=ExtractAs.Numpy,
+):
+    """
+    events(self, attr_name, event_type, maxsize=0, policy="drop_oldest", filters=[], stateless=False, extract_as=Numpy) -> iterator
+
+            Subscribe to an event and return an iterator over the received
+            events, an alternative to polling :meth:`get_events` in the
+            pull model. The consumer wakes up exactly when an event arrives::
+
+                for evt in proxy.events("current", EventType.CHANGE_EVENT):
+                    print(evt.attr_value.value)
+
+                async with proxy.events("current", EventType.CHANGE_EVENT) as evts:
+                    async for evt in evts:
+                        print(evt.attr_value.value)
+
+            The subscription is made when the iteration starts (or the
+            context is entered) and removed when the stream is closed,
+            with its close() method or at the exit of the context.
+
+        Parameters :
+            - attr_name : (str) The device attribute name.
+            - event_type: (EventType) Is the event reason (see subscribe_event)
+            - maxsize : (int) maximum number of buffered events (0 means no
+                        limit).
+            - policy : (str) event discarded when the buffer is full:
+                       "drop_oldest" or "drop_newest". The number of
+                       discarded events is given by the *dropped*
+                       attribute of the iterator.
+            - filters   : (sequence<str>) see subscribe_event
+            - stateless : (bool) see subscribe_event
+            - extract_as : (ExtractAs)
+
+        Return     : an iterator and asynchronous iterator of EventData
+                     (or AttrConfEventData, DataReadyEventData, ...)
+
+        Throws     : EventSystemFailed (at subscription), ValueError
+
+        New in PyTango 9.4.2
+    """
+    subscribe = functools.partial(
+        __DeviceProxy__subscribe_event_attrib,
+        self,
+        attr_name,
+        event_type,
+        filters=filters,
+        stateless=stateless,
+        extract_as=extract_as,
+        green_mode=GreenMode.Synchronous,
+    )
+    unsubscribe = functools.partial(__DeviceProxy__unsubscribe_event, self)
+    executor = functools.partial(get_object_executor, self, GreenMode.Asyncio)
+    return __EventStream(
+        subscribe, unsubscribe, maxsize=maxsize, policy=policy, executor=executor
+    )
+
+
 def __DeviceProxy___get_info_(self):
     """Protected method that gets device info once and stores it in cache"""
     if not hasattr(self, "_dev_info"):
@@ -1662,10 +2980,17 @@ def __DeviceProxy__read_attributes(self, *args, **kwargs):
 
 
 def __DeviceProxy__write_attribute(self, *args, **kwargs):
+    if args:
+        __read_cache_invalidate(self, args[0])
+    else:
+        __read_cache_invalidate(self, kwargs.get("attr_name", kwargs.get("attr_info")))
     return self._write_attribute(*args, **kwargs)
 
 
 def __DeviceProxy__write_attributes(self, *args, **kwargs):
+    name_val = args[0] if args else kwargs.get("name_val", ())
+    for attr_name, _ in name_val:
+        __read_cache_invalidate(self, attr_name)
     return self._write_attributes(*args, **kwargs)
 
 
@@ -1769,10 +3094,32 @@ def __init_DeviceProxy():
     DeviceProxy.state = green(__DeviceProxy__state)
     DeviceProxy.status = green(__DeviceProxy__status)
 
-    DeviceProxy.read_attribute = green(__DeviceProxy__read_attribute)
-    DeviceProxy.read_attributes = green(__DeviceProxy__read_attributes)
-    DeviceProxy.write_attribute = green(__DeviceProxy__write_attribute)
-    DeviceProxy.write_attributes = green(__DeviceProxy__write_attributes)
+    DeviceProxy.set_read_cache = __DeviceProxy__set_read_cache
+    DeviceProxy.get_read_cache = __DeviceProxy__get_read_cache
+    DeviceProxy.get_read_cache_stats = __DeviceProxy__get_read_cache_stats
+    DeviceProxy.clear_read_cache = __DeviceProxy__clear_read_cache
+
+    DeviceProxy.set_read_batching = __DeviceProxy__set_read_batching
+    DeviceProxy.get_read_batching = __DeviceProxy__get_read_batching
+
+    DeviceProxy.set_asyncio_ami = __DeviceProxy__set_asyncio_ami
+    DeviceProxy.is_asyncio_ami = __DeviceProxy__is_asyncio_ami
+
+    DeviceProxy.read_attribute = __green_read_attribute(__DeviceProxy__read_attribute)
+    DeviceProxy.read_attribute_into = green(__DeviceProxy__read_attribute_into)
+    DeviceProxy.read_attribute_chunks = __DeviceProxy__read_attribute_chunks
+    DeviceProxy.read_attributes = __green_ami(
+        green(__DeviceProxy__read_attributes), __ami_read_attributes
+    )
+    DeviceProxy.write_attribute = __green_ami(
+        green(__DeviceProxy__write_attribute), __ami_write_attribute
+    )
+    DeviceProxy.write_attributes = __green_ami(
+        green(__DeviceProxy__write_attributes), __ami_write_attributes
+    )
+    DeviceProxy.command_inout = __green_ami(
+        DeviceProxy.command_inout, __ami_command_inout
+    )
     DeviceProxy.write_read_attribute = green(__DeviceProxy__write_read_attribute)
     DeviceProxy.write_read_attributes = green(__DeviceProxy__write_read_attributes)
 
@@ -1805,8 +3152,13 @@ def __init_DeviceProxy():
     DeviceProxy.subscribe_event = green(
         __DeviceProxy__subscribe_event, consume_green_mode=False
     )
+    DeviceProxy.subscribe_event_batch = green(
+        __DeviceProxy__subscribe_event_batch, consume_green_mode=False
+    )
+    DeviceProxy.get_event_batch_statistics = __DeviceProxy__get_event_batch_statistics
     DeviceProxy.unsubscribe_event = green(__DeviceProxy__unsubscribe_event)
     DeviceProxy.get_events = __DeviceProxy__get_events
+    DeviceProxy.events = __DeviceProxy__events
     DeviceProxy.__unsubscribe_event_all = __DeviceProxy__unsubscribe_event_all
 
     DeviceProxy.__str__ = __DeviceProxy__str
@@ -3086,4 +4438,4 @@ def __doc_DeviceProxy():
 def device_proxy_init(doc=True):
     __init_DeviceProxy()
     if doc:
-        __doc_DeviceProxy()
+        document_lazily(__doc_DeviceProxy, classes=(DeviceProxy,))
@@ -14,7 +14,6 @@ This is an internal PyTango module.
 """
 
 
-import copy
 import functools
 import inspect
 import os
@@ -41,6 +40,8 @@ from ._tango import (
 
 from .utils import document_method as __document_method
 from .utils import copy_doc, get_latest_device_class, set_complex_value, is_pure_str
+from .utils import document_lazily
+from .pytango_init import init_server
 from .green import get_executor
 from .attr_data import AttrData
 
@@ -365,7 +366,7 @@ def __DeviceImpl__get_device_properties(self, ds_class=None):
             return
     try:
         pu = self.prop_util = ds_class.prop_util
-        self.device_property_list = copy.deepcopy(ds_class.device_property_list)
+        self.device_property_list = pu.copy_properties(ds_class.device_property_list)
         class_prop = ds_class.class_property_list
         pu.get_device_properties(self, class_prop, self.device_property_list)
         for prop_name in class_prop:
@@ -636,6 +637,12 @@ def __DeviceImpl__remove_attribute(self, attr_name):
         :raises DevFailed:
     """
     self._remove_attribute(attr_name)
+    # forget its zero copy mode and arrays (see Attribute.set_zero_copy)
+    name = attr_name.lower()
+    self.__dict__.get("_zero_copy_attributes", {}).pop(name, None)
+    arrays = self.__dict__.get("_zero_copy_arrays", {})
+    for key in [key for key in arrays if key[0] == name]:
+        del arrays[key]
 
 
 def __DeviceImpl__add_command(self, cmd, device_level=True):
@@ -2466,6 +2473,46 @@ def __doc_Attribute():
     """,
     )
 
+    document_method(
+        "set_zero_copy",
+        """
+    set_zero_copy(self, zero_copy)
+
+        Set the zero copy mode of a SPECTRUM or IMAGE attribute.
+
+        By default :meth:`set_value` (and the push event methods) copy the
+        given data into a new tango buffer. In zero copy mode, a C contiguous
+        and aligned numpy array of the attribute type is given to tango as
+        it is. The reply (or event) using the array is sent by the thread
+        which set it, so the device keeps the array alive until the event
+        has been pushed, or until the same thread sets the next value of the
+        attribute or starts its next request on the device (or the device or
+        the attribute is deleted). Other values are still copied.
+
+        The array must not be modified after it has been set as the
+        attribute value (set a new array for every value).
+
+        :param zero_copy: True to enable the zero copy mode
+        :type zero_copy: bool
+
+        New in PyTango 9.4.2
+    """,
+    )
+
+    document_method(
+        "is_zero_copy",
+        """
+    is_zero_copy(self) -> bool
+
+        Tell if the attribute is in zero copy mode (see :meth:`set_zero_copy`).
+
+        :returns: True if the attribute is in zero copy mode
+        :rtype: bool
+
+        New in PyTango 9.4.2
+    """,
+    )
+
     document_method(
         "set_value_date_quality",
         """
@@ -3830,13 +3877,18 @@ def device_server_init(doc=True):
     __init_UserDefaultAttrProp()
     __init_Logger()
     if doc:
-        __doc_DeviceImpl()
-        __doc_extra_DeviceImpl(Device_3Impl)
-        __doc_extra_DeviceImpl(Device_4Impl)
-        __doc_extra_DeviceImpl(Device_5Impl)
-        __doc_Attribute()
-        __doc_WAttribute()
-        __doc_MultiAttribute()
-        __doc_MultiClassAttribute()
-        __doc_UserDefaultAttrProp()
-        __doc_Attr()
+        document_lazily(__doc_DeviceImpl, classes=(DeviceImpl,))
+        document_lazily(__doc_extra_DeviceImpl, Device_3Impl, classes=(Device_3Impl,))
+        document_lazily(__doc_extra_DeviceImpl, Device_4Impl, classes=(Device_4Impl,))
+        document_lazily(__doc_extra_DeviceImpl, Device_5Impl, classes=(Device_5Impl,))
+        document_lazily(__doc_Attribute, classes=(Attribute,))
+        document_lazily(__doc_WAttribute, classes=(WAttribute,))
+        document_lazily(__doc_MultiAttribute, classes=(MultiAttribute,))
+        document_lazily(__doc_MultiClassAttribute, classes=(MultiClassAttribute,))
+        document_lazily(__doc_UserDefaultAttrProp, classes=(UserDefaultAttrProp,))
+        document_lazily(__doc_Attr, classes=(Attr,))
+
+
+# the low level server API is initialized on first use (see tango.__getattr__),
+# or when this module is imported directly (it needs the functions above)
+init_server()
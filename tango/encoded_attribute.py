@@ -17,10 +17,13 @@ __all__ = ("encoded_attribute_init",)
 
 __docformat__ = "restructuredtext"
 
+import struct
+
 from ._tango import EncodedAttribute, ExtractAs, _ImageFormat
 from ._tango import constants
 
 from .utils import is_pure_str, is_seq
+from .utils import document_lazily
 
 if constants.NUMPY_SUPPORT:
     try:
@@ -34,6 +37,37 @@ else:
 
 _allowed_extract = (ExtractAs.Numpy, ExtractAs.String, ExtractAs.Tuple, ExtractAs.List)
 
+# numpy dtype of the pixels of the uncompressed formats which can be
+# decoded without copying the received buffer (see ExtractAs.Buffer)
+_raw_image_dtypes = {"GRAY8": "u1", "GRAY16": ">u2"}
+
+
+def __decode_buffer(da, encoded_format):
+    """Return the image of a DeviceAttribute extracted with ExtractAs.Buffer
+    as a 2D view of its buffer. The raw formats start with the width and
+    height of the image as two big endian 16 bits integers"""
+    value = getattr(da, "value", None)
+    if (
+        not isinstance(value, tuple)
+        or np is None
+        or not isinstance(value[1], np.ndarray)
+    ):
+        raise TypeError(
+            "DeviceAttribute argument must have been obtained from "
+            "a call with extract_as=ExtractAs.Buffer"
+        )
+    fmt, data = value
+    if fmt != encoded_format:
+        raise TypeError(
+            f"Only {encoded_format} images can be decoded with "
+            f"ExtractAs.Buffer (got {fmt})"
+        )
+    width = (int(data[0]) << 8) | int(data[1])
+    height = (int(data[2]) << 8) | int(data[3])
+    dtype = np.dtype(_raw_image_dtypes[encoded_format])
+    pixels = data[4 : 4 + width * height * dtype.itemsize]
+    return pixels.view(dtype).reshape(height, width)
+
 
 def __EncodedAttribute_encode_jpeg_gray8(self, gray8, width=0, height=0, quality=100.0):
     """Encode a 8 bit grayscale image as JPEG format
@@ -61,6 +95,10 @@ def __EncodedAttribute_encode_jpeg_gray8(self, gray8, width=0, height=0, quality
               gray8.dtype is one of `numpy.dtype.byte`, `numpy.dtype.ubyte`,
               `numpy.dtype.int8` or `numpy.dtype.uint8`)
 
+    The python GIL is released while encoding, so frames can be encoded in
+    parallel by several threads (each one using its own EncodedAttribute).
+    (New in PyTango 9.4.2)
+
     Example::
 
         def read_myattr(self, attr):
@@ -286,6 +324,10 @@ def __EncodedAttribute_encode_jpeg_rgb24(self, rgb24, width=0, height=0, quality
               `numpy.dtype.int8` or `numpy.dtype.uint8`) and shape **MUST** be
               (height, width, 3)
 
+    The python GIL is released while encoding, so frames can be encoded in
+    parallel by several threads (each one using its own EncodedAttribute).
+    (New in PyTango 9.4.2)
+
     Example::
 
         def read_myattr(self, attr):
@@ -424,6 +466,10 @@ def __EncodedAttribute_encode_jpeg_rgb32(self, rgb32, width=0, height=0, quality
             - if rgb32.ndims == 2, rgb32.itemsize **MUST** be 4 (typically,
               rgb32.dtype is one of `numpy.dtype.int32`, `numpy.dtype.uint32`)
 
+    The python GIL is released while encoding, so frames can be encoded in
+    parallel by several threads (each one using its own EncodedAttribute).
+    (New in PyTango 9.4.2)
+
     Example::
 
         def read_myattr(self, attr):
@@ -500,6 +546,10 @@ def __EncodedAttribute_decode_gray8(self, da, extract_as=ExtractAs.Numpy):
        returned with ndim=2, shape=(height, width) and dtype=numpy.uint8.
      - In case Tuple or List are choosen, a tuple<tuple<int>> or list<list<int>>
        is returned.
+     - In case Buffer is choosen, the DeviceAttribute must have been read
+       with ``extract_as=ExtractAs.Buffer`` and contain a GRAY8 image. The
+       returned :class:`numpy.ndarray` (dtype=numpy.uint8) is a view on the
+       received buffer: the image is not copied. (New in PyTango 9.4.2)
 
     .. warning::
         The PyTango calls that return a :class:`DeviceAttribute`
@@ -513,13 +563,15 @@ def __EncodedAttribute_decode_gray8(self, da, extract_as=ExtractAs.Numpy):
             enc = tango.EncodedAttribute()
             data = enc.decode_gray8(da)
     """
+    if extract_as == ExtractAs.Buffer:
+        return __decode_buffer(da, "GRAY8")
     if hasattr(da, "value"):
         raise TypeError(
             "DeviceAttribute argument must have been obtained from "
             "a call which doesn't extract the contents"
         )
     if extract_as not in _allowed_extract:
-        raise TypeError("extract_as must be one of Numpy, String, Tuple, List")
+        raise TypeError("extract_as must be one of Numpy, String, Tuple, List, Buffer")
     return self._decode_gray8(da, extract_as)
 
 
@@ -538,6 +590,10 @@ def __EncodedAttribute_decode_gray16(self, da, extract_as=ExtractAs.Numpy):
        returned with ndim=2, shape=(height, width) and dtype=numpy.uint16.
      - In case Tuple or List are choosen, a tuple<tuple<int>> or list<list<int>>
        is returned.
+     - In case Buffer is choosen, the DeviceAttribute must have been read
+       with ``extract_as=ExtractAs.Buffer`` and contain a GRAY16 image. The
+       returned :class:`numpy.ndarray` (dtype='>u2') is a view on the
+       received buffer: the image is not copied. (New in PyTango 9.4.2)
 
     .. warning::
         The PyTango calls that return a :class:`DeviceAttribute`
@@ -551,13 +607,15 @@ def __EncodedAttribute_decode_gray16(self, da, extract_as=ExtractAs.Numpy):
             enc = tango.EncodedAttribute()
             data = enc.decode_gray16(da)
     """
+    if extract_as == ExtractAs.Buffer:
+        return __decode_buffer(da, "GRAY16")
     if hasattr(da, "value"):
         raise TypeError(
             "DeviceAttribute argument must have been obtained from "
             "a call which doesn't extract the contents"
         )
     if extract_as not in _allowed_extract:
-        raise TypeError("extract_as must be one of Numpy, String, Tuple, List")
+        raise TypeError("extract_as must be one of Numpy, String, Tuple, List, Buffer")
     return self._decode_gray16(da, extract_as)
 
 
@@ -599,6 +657,253 @@ def __EncodedAttribute_decode_rgb32(self, da, extract_as=ExtractAs.Numpy):
     return self._decode_rgb32(da, extract_as)
 
 
+# Lossless image encodings: the image is compressed with one of these codecs
+# ("zlib" always available, "lz4" and "zstd" if the lz4 / zstandard packages
+# are installed), either as is (RAW_<CODEC> formats) or as the difference
+# with the previous frame (DELTA_<CODEC> formats)
+_CODECS = ("zlib", "lz4", "zstd")
+
+# dtype (e.g. "<u2", "<c16", null padded), number of dimensions, keyframe,
+# shape (3 dimensions), frame number
+_DTYPE_SIZE = 8
+_frame_header = struct.Struct(f"<{_DTYPE_SIZE}sBBIIII")
+
+
+def _get_codec(codec):
+    """Return the (compress, decompress) functions of a codec"""
+    codec = codec.lower()
+    if codec == "zlib":
+        import zlib
+
+        return zlib.compress, zlib.decompress
+    if codec == "lz4":
+        try:
+            import lz4.frame
+        except ImportError:
+            raise ValueError("lz4 codec requires the lz4 package")
+        return lz4.frame.compress, lz4.frame.decompress
+    if codec == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError("zstd codec requires the zstandard package")
+        return (
+            lambda data, level=3: zstandard.ZstdCompressor(level=level).compress(data),
+            lambda data: zstandard.ZstdDecompressor().decompress(data),
+        )
+    raise ValueError(f"Unknown codec {codec!r} (expected one of {_CODECS})")
+
+
+def _as_image(image):
+    if np is None:
+        raise TypeError("Lossless image encodings require numpy")
+    image = np.ascontiguousarray(image)
+    if image.ndim not in (2, 3):
+        raise TypeError("Expected a 2 or 3 dimensions numpy.ndarray")
+    if image.dtype.hasobject or len(image.dtype.str) > _DTYPE_SIZE:
+        raise TypeError(f"Cannot encode an image of dtype {image.dtype}")
+    return image
+
+
+def _compress_frame(image, pixels, codec, level, keyframe, number):
+    """Return the header describing *image* followed by the compressed
+    *pixels* (the image itself or its difference with the previous one)"""
+    compress, _ = _get_codec(codec)
+    shape = image.shape + (1,) * (3 - image.ndim)
+    header = _frame_header.pack(
+        image.dtype.str.encode(), image.ndim, keyframe, *shape, number
+    )
+    # no memoryview cast: it does not support every dtype (e.g. complex)
+    data = pixels.reshape(-1).view(np.uint8)
+    payload = compress(data) if level is None else compress(data, level)
+    return header + payload
+
+
+def _decompress_frame(value):
+    """Return (codec kind, header fields, pixels as a flat uint8 array) of a
+    (format, data) DevEncoded value"""
+    if np is None:
+        raise TypeError("Lossless image encodings require numpy")
+    fmt, data = value
+    kind, _, codec = fmt.partition("_")
+    if kind not in ("RAW", "DELTA") or codec.lower() not in _CODECS:
+        raise TypeError(f"Not a lossless image encoding: {fmt}")
+    _, decompress = _get_codec(codec)
+    data = memoryview(data).cast("B")
+    header = _frame_header.unpack_from(data)
+    pixels = decompress(data[_frame_header.size :])
+    return kind, header, np.frombuffer(pixels, dtype=np.uint8)
+
+
+def _encoded_value(da):
+    # a DeviceAttribute / EventData.attr_value or directly its value
+    value = getattr(da, "value", da)
+    if not isinstance(value, tuple) or len(value) != 2:
+        raise TypeError(
+            "Expected a DevEncoded (format, data) value or a DeviceAttribute "
+            "containing one"
+        )
+    return value
+
+
+def _frame_from_pixels(header, pixels):
+    dtype, ndim, _, dim0, dim1, dim2, _ = header
+    shape = (dim0, dim1, dim2)[:ndim]
+    dtype = np.dtype(dtype.rstrip(b"\0").decode())
+    return pixels.view(dtype).reshape(shape)
+
+
+def __EncodedAttribute_encode_compressed(self, image, codec="zlib", level=None):
+    """Encode an image losslessly compressed with the given codec.
+
+        :param image: the image (any dtype), with shape (height, width) or
+                      (height, width, channels)
+        :type image: :class:`numpy.ndarray`
+        :param codec: "zlib", "lz4" (requires the lz4 package) or "zstd"
+                      (requires the zstandard package)
+        :type codec: :py:obj:`str`
+        :param level: compression level (default is the codec default)
+        :type level: :py:obj:`int`
+        :return: the DevEncoded value (format, data) to give to
+                 :meth:`~tango.Attribute.set_value` or to push as event. The
+                 format is "RAW_<CODEC>", e.g. "RAW_ZLIB"
+        :rtype: :py:obj:`tuple`
+
+    Unlike the other encode methods, the encoded data is returned instead of
+    being stored in the EncodedAttribute. Decode it with
+    :meth:`~tango.EncodedAttribute.decode_compressed`.
+
+    Example::
+
+        def read_myattr(self):
+            return self.enc.encode_compressed(self.camera.frame, codec="lz4")
+
+    New in PyTango 9.4.2
+    """
+    image = _as_image(image)
+    data = _compress_frame(image, image, codec, level, True, 0)
+    return f"RAW_{codec.upper()}", data
+
+
+def __EncodedAttribute_decode_compressed(self, da):
+    """Decode an image encoded with :meth:`~tango.EncodedAttribute.encode_compressed`
+
+        :param da: DeviceAttribute (or EventData.attr_value) containing the
+                   image, or directly its (format, data) value
+        :type da: :class:`DeviceAttribute`
+        :return: the image, with its original dtype and shape
+        :rtype: :class:`numpy.ndarray`
+
+    Contrary to the other decode methods, the DeviceAttribute **MUST** have
+    been extracted (by default, or with ExtractAs.Buffer to avoid a copy).
+
+    New in PyTango 9.4.2
+    """
+    kind, header, pixels = _decompress_frame(_encoded_value(da))
+    if kind != "RAW":
+        raise TypeError("Use decode_delta to decode DELTA images")
+    return _frame_from_pixels(header, pixels)
+
+
+def __EncodedAttribute_encode_delta(
+    self, image, codec="zlib", level=None, keyframe_interval=30
+):
+    """Encode an image as its difference with the previous image encoded by
+    this EncodedAttribute, losslessly compressed with the given codec.
+
+    Consecutive frames of a camera are often nearly identical: their
+    difference (a bitwise XOR) is mostly zeros and compresses much better
+    than the frames themselves. Every *keyframe_interval* frames (and when the
+    dtype or shape of the image changes) the whole image is sent instead, so
+    that a client subscribing to the events (or after a lost event) can start
+    decoding.
+
+        :param image: the image (any dtype), with shape (height, width) or
+                      (height, width, channels)
+        :type image: :class:`numpy.ndarray`
+        :param codec: "zlib", "lz4" (requires the lz4 package) or "zstd"
+                      (requires the zstandard package)
+        :type codec: :py:obj:`str`
+        :param level: compression level (default is the codec default)
+        :type level: :py:obj:`int`
+        :param keyframe_interval: number of frames between two whole images
+        :type keyframe_interval: :py:obj:`int`
+        :return: the DevEncoded value (format, data) to push as event. The
+                 format is "DELTA_<CODEC>", e.g. "DELTA_LZ4"
+        :rtype: :py:obj:`tuple`
+
+    Decode the frames, in order, with
+    :meth:`~tango.EncodedAttribute.decode_delta` on one EncodedAttribute per
+    stream. Use one EncodedAttribute per attribute on the server side too.
+
+    Example::
+
+        def acquisition_loop(self):
+            enc = tango.EncodedAttribute()
+            for frame in self.camera.frames():
+                self.push_change_event("image", *enc.encode_delta(frame))
+
+    New in PyTango 9.4.2
+    """
+    image = _as_image(image)
+    previous = self.__dict__.get("_delta_previous")
+    number = self.__dict__.get("_delta_number", -1) + 1
+    keyframe = (
+        previous is None
+        or previous.dtype != image.dtype
+        or previous.shape != image.shape
+        or number % max(1, keyframe_interval) == 0
+    )
+    if keyframe:
+        number = 0
+        pixels = image
+    else:
+        pixels = np.bitwise_xor(
+            image.reshape(-1).view(np.uint8), previous.reshape(-1).view(np.uint8)
+        )
+    data = _compress_frame(image, pixels, codec, level, keyframe, number)
+    self.__dict__["_delta_previous"] = image.copy()
+    self.__dict__["_delta_number"] = number
+    return f"DELTA_{codec.upper()}", data
+
+
+def __EncodedAttribute_decode_delta(self, da):
+    """Decode an image encoded with :meth:`~tango.EncodedAttribute.encode_delta`
+
+        :param da: DeviceAttribute (or EventData.attr_value) containing the
+                   image, or directly its (format, data) value
+        :type da: :class:`DeviceAttribute`
+        :return: the image, with its original dtype and shape
+        :rtype: :class:`numpy.ndarray`
+        :throws: ValueError if the previous frame was not decoded by this
+                 EncodedAttribute (e.g. the event was lost). Decoding resumes
+                 with the next keyframe.
+
+    The frames must be decoded in order by the same EncodedAttribute, which
+    keeps the last decoded image as reference. The DeviceAttribute **MUST**
+    have been extracted (by default, or with ExtractAs.Buffer to avoid a copy).
+
+    New in PyTango 9.4.2
+    """
+    kind, header, pixels = _decompress_frame(_encoded_value(da))
+    if kind == "RAW":
+        return _frame_from_pixels(header, pixels)
+    keyframe, number = header[2], header[-1]
+    if not keyframe:
+        previous = self.__dict__.get("_delta_reference")
+        if previous is None or self.__dict__.get("_delta_number") != number - 1:
+            self.__dict__["_delta_reference"] = None
+            raise ValueError(
+                f"Cannot decode frame {number}: the previous frame is missing. "
+                "Decoding resumes with the next keyframe"
+            )
+        pixels = np.bitwise_xor(pixels, previous)
+    # the caller may modify the returned image: keep a private reference
+    self.__dict__["_delta_reference"] = pixels
+    self.__dict__["_delta_number"] = number
+    return _frame_from_pixels(header, pixels.copy())
+
+
 def __init_EncodedAttribute():
     EncodedAttribute._generic_encode_gray8 = __EncodedAttribute_generic_encode_gray8
     EncodedAttribute.encode_gray8 = __EncodedAttribute_encode_gray8
@@ -611,6 +916,10 @@ def __init_EncodedAttribute():
     EncodedAttribute.decode_gray8 = __EncodedAttribute_decode_gray8
     EncodedAttribute.decode_gray16 = __EncodedAttribute_decode_gray16
     EncodedAttribute.decode_rgb32 = __EncodedAttribute_decode_rgb32
+    EncodedAttribute.encode_compressed = __EncodedAttribute_encode_compressed
+    EncodedAttribute.decode_compressed = __EncodedAttribute_decode_compressed
+    EncodedAttribute.encode_delta = __EncodedAttribute_encode_delta
+    EncodedAttribute.decode_delta = __EncodedAttribute_decode_delta
 
 
 def __doc_EncodedAttribute():
@@ -620,4 +929,4 @@ def __doc_EncodedAttribute():
 def encoded_attribute_init(doc=True):
     __init_EncodedAttribute()
     if doc:
-        __doc_EncodedAttribute()
+        document_lazily(__doc_EncodedAttribute, classes=(EncodedAttribute,))
@@ -18,6 +18,7 @@ __all__ = ("exception_init",)
 __docformat__ = "restructuredtext"
 
 from .utils import document_static_method as __document_static_method
+from .utils import document_lazily
 from ._tango import Except, DevError, ErrSeverity
 
 
@@ -197,5 +198,5 @@ def exception_init(doc=True):
     __init_Except()
     __init_DevError()
     if doc:
-        __doc_Except()
-        __doc_DevError()
+        document_lazily(__doc_Except, classes=(Except,))
+        document_lazily(__doc_DevError, classes=(DevError,))
@@ -13,6 +13,7 @@
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # Tango imports
+from ._tango import GreenMode
 from .green import AbstractExecutor
 
 __all__ = ("FuturesExecutor", "get_global_executor", "set_global_executor")
@@ -42,6 +43,7 @@ class FuturesExecutor(AbstractExecutor):
 
     asynchronous = True
     default_wait = True
+    green_mode = GreenMode.Futures
 
     def __init__(self, process=False, max_workers=20):
         super().__init__()
@@ -16,15 +16,18 @@ from collections import namedtuple
 
 # Gevent imports
 import gevent.event
+import gevent.lock
 import gevent.queue
 import gevent.monkey
 import gevent.threadpool
 
 # Bypass gevent monkey patching
 ThreadSafeEvent = gevent.monkey.get_original("threading", "Event")
+ThreadSafeLock = gevent.monkey.get_original("threading", "Lock")
 
 # Tango imports
-from .green import AbstractExecutor
+from ._tango import GreenMode
+from .green import AbstractExecutor, ExecutorStatistics, get_executor_pool_size
 
 
 __all__ = ("get_global_executor", "set_global_executor", "GeventExecutor")
@@ -50,7 +53,10 @@ def set_global_executor(executor):
 def get_global_threadpool():
     global _THREAD_POOL
     if _THREAD_POOL is None:
-        _THREAD_POOL = ThreadPool(maxsize=10**4)
+        max_workers, max_queue = get_executor_pool_size()
+        if max_workers is None:
+            max_workers = 10**4
+        _THREAD_POOL = ThreadPool(maxsize=max_workers, max_queue=max_queue)
     return _THREAD_POOL
 
 
@@ -86,9 +92,47 @@ def unwrap_error(source):
 
 
 class ThreadPool(gevent.threadpool.ThreadPool):
+    def __init__(self, maxsize, max_queue=None, **kwargs):
+        super().__init__(maxsize, **kwargs)
+        # updated from the threads of the pool: use a native lock
+        self.statistics = ExecutorStatistics(lock=ThreadSafeLock())
+        # calls queued or run by the threads at the same time
+        self.slots = None
+        if max_queue is not None:
+            self.slots = gevent.lock.BoundedSemaphore(maxsize + max_queue)
+
+    def set_size(self, maxsize=None, max_queue=None):
+        """Resize the pool (see :func:`~tango.set_executor_pool_size`). The
+        calls already spawned are not interrupted."""
+        if maxsize is None:
+            maxsize = 10**4
+        self.maxsize = maxsize
+        self.slots = None
+        if max_queue is not None:
+            self.slots = gevent.lock.BoundedSemaphore(maxsize + max_queue)
+
     def spawn(self, fn, *args, **kwargs):
-        wrapped = wrap_error(fn)
-        raw = super().spawn(wrapped, *args, **kwargs)
+        # the one acquired, even if the pool is resized meanwhile
+        slots = self.slots
+        if slots is not None:
+            if slots.locked():
+                # back-pressure: the calling greenlet waits for room
+                self.statistics.add_waiting(1)
+                try:
+                    slots.acquire()
+                finally:
+                    self.statistics.add_waiting(-1)
+            else:
+                slots.acquire()
+        wrapped = wrap_error(self.statistics.wrap(fn))
+        try:
+            raw = super().spawn(wrapped, *args, **kwargs)
+        except BaseException:
+            if slots is not None:
+                slots.release()
+            raise
+        if slots is not None:
+            raw.rawlink(lambda _: slots.release())
         return unwrap_error(raw)
 
 
@@ -132,6 +176,7 @@ class GeventExecutor(AbstractExecutor):
 
     asynchronous = True
     default_wait = True
+    green_mode = GreenMode.Gevent
 
     def __init__(self, loop=None, subexecutor=None):
         super().__init__()
@@ -142,6 +187,12 @@ class GeventExecutor(AbstractExecutor):
         self.loop = loop
         self.subexecutor = subexecutor
 
+    def get_statistics(self):
+        """Return the counters of the calls delegated to the thread pool
+        (see :class:`~tango.green.ExecutorStatistics`)"""
+        statistics = getattr(self.subexecutor, "statistics", None)
+        return None if statistics is None else statistics.as_dict()
+
     def delegate(self, fn, *args, **kwargs):
         """Return the given operation as a gevent future."""
         return self.subexecutor.spawn(fn, *args, **kwargs)
@@ -12,6 +12,10 @@
 
 # Imports
 import os
+import sys
+import time
+import warnings
+import threading
 from functools import wraps
 
 # Compatibility imports
@@ -26,10 +30,13 @@ from ._tango import GreenMode
 __all__ = (
     "get_green_mode",
     "set_green_mode",
+    "get_executor_pool_size",
+    "set_executor_pool_size",
     "green",
     "green_callback",
     "get_executor",
     "get_object_executor",
+    "ExecutorStatistics",
 )
 
 # Handle current green mode
@@ -68,12 +75,182 @@ def get_green_mode():
     return _CURRENT_GREEN_MODE
 
 
+# Handle the size of the thread pools of the asyncio and gevent executors
+
+
+def _get_env_int(name, minimum):
+    value = os.environ.get(name)
+    if value is None:
+        return None
+    try:
+        value = int(value)
+    except ValueError:
+        value = None
+    if value is None or value < minimum:
+        warnings.warn(
+            f"Ignoring {name}={os.environ[name]!r}: an integer >= {minimum} is expected",
+            RuntimeWarning,
+        )
+        return None
+    return value
+
+
+def _check_pool_size(max_workers, max_queue):
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers must be None or a positive number")
+    if max_queue is not None and max_queue < 0:
+        raise ValueError("max_queue must be None or a number >= 0")
+
+
+_EXECUTOR_MAX_WORKERS = _get_env_int("PYTANGO_GREEN_MAX_WORKERS", 1)
+_EXECUTOR_MAX_QUEUE = _get_env_int("PYTANGO_GREEN_MAX_QUEUE", 0)
+
+
+def set_executor_pool_size(max_workers=None, max_queue=None):
+    """Sets the size of the thread pools used by the *Asyncio* and *Gevent*
+    executors to run the blocking tango calls.
+
+    The thread pools of the global executors already created are resized:
+    the calls being run or queued are not interrupted, the new sizes apply
+    to the next calls. Executors created with their own thread pool are
+    not affected. The defaults can also be set with the environment
+    variables :envvar:`PYTANGO_GREEN_MAX_WORKERS` and
+    :envvar:`PYTANGO_GREEN_MAX_QUEUE` (invalid values are ignored with a
+    warning).
+
+    :param max_workers: maximum number of threads. None means the default
+                        of the green mode (the default executor of the
+                        asyncio event loop, 10000 threads for gevent)
+    :type max_workers: int
+    :param max_queue: maximum number of calls waiting for a thread. Further
+                      calls wait (cooperatively) for room in the queue
+                      before being queued. None means unbounded.
+    :type max_queue: int
+    :raises ValueError: if a size is not positive (max_queue can be 0)
+
+    New in PyTango 9.4.2
+    """
+    global _EXECUTOR_MAX_WORKERS, _EXECUTOR_MAX_QUEUE
+    _check_pool_size(max_workers, max_queue)
+    _EXECUTOR_MAX_WORKERS = max_workers
+    _EXECUTOR_MAX_QUEUE = max_queue
+    # the executor modules are not imported here (gevent is optional)
+    asyncio_executor = sys.modules.get(__package__ + ".asyncio_executor")
+    if asyncio_executor is not None:
+        executor = asyncio_executor._EXECUTOR
+        if executor is not None and executor.owns_subexecutor:
+            executor.set_pool_size(max_workers, max_queue)
+    gevent_executor = sys.modules.get(__package__ + ".gevent_executor")
+    if gevent_executor is not None and gevent_executor._THREAD_POOL is not None:
+        gevent_executor._THREAD_POOL.set_size(max_workers, max_queue)
+
+
+def get_executor_pool_size():
+    """Returns the size of the thread pools used by the *Asyncio* and
+    *Gevent* executors (see :func:`set_executor_pool_size`).
+
+    :returns: the maximum number of threads and of queued calls
+    :rtype: tuple(int, int)
+
+    New in PyTango 9.4.2
+    """
+    return _EXECUTOR_MAX_WORKERS, _EXECUTOR_MAX_QUEUE
+
+
+class ExecutorStatistics:
+    """Thread safe counters of the calls delegated by an executor to its
+    thread pool.
+
+    - waiting: calls waiting for room in the bounded queue
+    - queued: calls waiting for a thread
+    - active: calls being run
+    - completed: calls finished (including the failed ones)
+    - failed: calls which raised an exception
+    - mean_queue_time / max_queue_time: time (s) spent waiting for a thread
+    - mean_latency / max_latency: time (s) from submission to completion
+
+    New in PyTango 9.4.2
+    """
+
+    def __init__(self, lock=None):
+        self._lock = threading.Lock() if lock is None else lock
+        self.waiting = 0
+        self.queued = 0
+        self.active = 0
+        self.reset()
+
+    def reset(self):
+        """Reset the cumulative counters (not the current waiting, queued
+        and active calls)"""
+        with self._lock:
+            self.started = 0
+            self.completed = 0
+            self.failed = 0
+            self.total_queue_time = 0.0
+            self.max_queue_time = 0.0
+            self.total_latency = 0.0
+            self.max_latency = 0.0
+
+    def add_waiting(self, count):
+        with self._lock:
+            self.waiting += count
+
+    def wrap(self, fn):
+        """Count *fn* as queued and return the callable to give to the
+        thread pool instead of *fn*"""
+        submit_time = time.perf_counter()
+        with self._lock:
+            self.queued += 1
+
+        def run(*args, **kwargs):
+            start_time = time.perf_counter()
+            queue_time = start_time - submit_time
+            with self._lock:
+                self.queued -= 1
+                self.active += 1
+                self.started += 1
+                self.total_queue_time += queue_time
+                self.max_queue_time = max(self.max_queue_time, queue_time)
+            failed = True
+            try:
+                result = fn(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                latency = time.perf_counter() - submit_time
+                with self._lock:
+                    self.active -= 1
+                    self.completed += 1
+                    self.failed += failed
+                    self.total_latency += latency
+                    self.max_latency = max(self.max_latency, latency)
+
+        return run
+
+    def as_dict(self):
+        with self._lock:
+            started = max(self.started, 1)
+            completed = max(self.completed, 1)
+            return dict(
+                waiting=self.waiting,
+                queued=self.queued,
+                active=self.active,
+                completed=self.completed,
+                failed=self.failed,
+                mean_queue_time=self.total_queue_time / started,
+                max_queue_time=self.max_queue_time,
+                mean_latency=self.total_latency / completed,
+                max_latency=self.max_latency,
+            )
+
+
 # Abstract executor class
 
 
 class AbstractExecutor:
     asynchronous = NotImplemented
     default_wait = NotImplemented
+    green_mode = NotImplemented
 
     def __init__(self):
         self.thread_id = get_ident()
@@ -124,6 +301,7 @@ class AbstractExecutor:
 class SynchronousExecutor(AbstractExecutor):
     asynchronous = False
     default_wait = True
+    green_mode = GreenMode.Synchronous
 
 
 # Default synchronous executor
@@ -22,6 +22,7 @@ import collections.abc
 from ._tango import __Group as _RealGroup, StdStringVector
 from .utils import seq_2_StdStringVector, is_pure_str
 from .utils import document_method as __document_method
+from .utils import document_lazily
 from .device_proxy import __init_device_proxy_internals as init_device_proxy
 
 
@@ -819,5 +820,5 @@ def __doc_Group():
 
 def group_init(doc=True):
     if doc:
-        __doc_Group()
+        document_lazily(__doc_Group, classes=(Group, _RealGroup))
     __init_proxy_Group()
@@ -18,6 +18,7 @@ __all__ = ("group_reply_init",)
 __docformat__ = "restructuredtext"
 
 from .utils import document_method as __document_method
+from .utils import document_lazily
 from ._tango import GroupReply, GroupCmdReply, GroupAttrReply, ExtractAs
 
 
@@ -116,4 +117,4 @@ def __doc_GroupReply():
 def group_reply_init(doc=True):
     __init_GroupReply()
     if doc:
-        __doc_GroupReply()
+        document_lazily(__doc_GroupReply, classes=(GroupReply,))
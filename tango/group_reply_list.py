@@ -18,6 +18,7 @@ __all__ = ("group_reply_list_init",)
 __docformat__ = "restructuredtext"
 
 from ._tango import GroupReplyList, GroupCmdReplyList, GroupAttrReplyList
+from .utils import document_lazily
 
 
 def __GroupReplyList__getitem(self, item):
@@ -88,4 +89,4 @@ def __doc_GroupReplyList():
 def group_reply_list_init(doc=True):
     __init_GroupReplyList()
     if doc:
-        __doc_GroupReplyList()
+        document_lazily(__doc_GroupReplyList, classes=(GroupReplyList,))
@@ -30,6 +30,7 @@ from .utils import (
     is_number,
 )
 from .utils import document_method as __document_method
+from .utils import document_lazily
 
 
 class PipeConfig:
@@ -188,4 +189,4 @@ def __doc_UserDefaultPipeProp():
 def pipe_init(doc=True):
     __init_Pipe()
     if doc:
-        __doc_UserDefaultPipeProp()
+        document_lazily(__doc_UserDefaultPipeProp, classes=(UserDefaultPipeProp,))
@@ -13,36 +13,35 @@
 This is an internal PyTango module.
 """
 
-__all__ = ("init",)
+__all__ = ("init", "init_server", "init_group", "init_encoded_attribute")
 
 __docformat__ = "restructuredtext"
 
+import os
+import sys
+import threading
+
 from .attribute_proxy import attribute_proxy_init
 from .base_types import base_types_init
 from .exception import exception_init
 from .callback import callback_init
 from .api_util import api_util_init
-from .encoded_attribute import encoded_attribute_init
 from .connection import connection_init
 from .db import db_init
 from .device_attribute import device_attribute_init
-from .device_class import device_class_init
 from .device_data import device_data_init
 from .device_proxy import device_proxy_init
-from .device_server import device_server_init
-from .group import group_init
-from .group_reply import group_reply_init
-from .group_reply_list import group_reply_list_init
 from .pytango_pprint import pytango_pprint_init
-from .pyutil import pyutil_init
 from .time_val import time_val_init
-from .auto_monitor import auto_monitor_init
-from .pipe import pipe_init
+from .utils import set_lazy_doc, install_lazy_doc
+from . import _tango
 from ._tango import constants
 from ._tango import _get_tango_lib_release
 
 __INITIALIZED = False
 __DOC = True
+# set the docstrings when they are first needed (see tango.utils.load_docs)
+__LAZY_DOC = os.environ.get("PYTANGO_LAZY_DOC", "1") != "0"
 
 
 def init_constants():
@@ -93,6 +92,23 @@ def init_constants():
     constants.Runtime = Runtime
 
 
+def __install_lazy_doc(modules):
+    classes = set()
+    for module in modules:
+        for value in vars(module).values():
+            if isinstance(value, type):
+                classes.add(value)
+    install_lazy_doc(classes)
+
+
+def __init_server_on_subclass(cls, **kwargs):
+    # a device class derived from tango._tango.DeviceImpl imported directly.
+    # Not the classes of the server API modules: they are being initialized
+    if not cls.__module__.startswith("tango."):
+        init_server()
+    super(_tango.DeviceImpl, cls).__init_subclass__(**kwargs)
+
+
 def init():
     global __INITIALIZED
     if __INITIALIZED:
@@ -100,29 +116,84 @@ def init():
 
     global __DOC
     doc = __DOC
+    set_lazy_doc(__LAZY_DOC)
     init_constants()
     base_types_init(doc=doc)
     exception_init(doc=doc)
     callback_init(doc=doc)
     api_util_init(doc=doc)
-    encoded_attribute_init(doc=doc)
     connection_init(doc=doc)
     db_init(doc=doc)
     device_attribute_init(doc=doc)
-    device_class_init(doc=doc)
     device_data_init(doc=doc)
     device_proxy_init(doc=doc)
-    device_server_init(doc=doc)
-    group_init(doc=doc)
-    group_reply_init(doc=doc)
-    group_reply_list_init(doc=doc)
     pytango_pprint_init(doc=doc)
-    pyutil_init(doc=doc)
     time_val_init(doc=doc)
-    auto_monitor_init(doc=doc)
-    pipe_init(doc=doc)
 
     # must come last: depends on device_proxy.init()
     attribute_proxy_init(doc=doc)
 
+    if doc and __LAZY_DOC:
+        __install_lazy_doc((_tango, sys.modules["tango"]))
+
+    _tango.DeviceImpl.__init_subclass__ = classmethod(__init_server_on_subclass)
+
     __INITIALIZED = True
+
+
+# The server API and the rarely used client classes are initialized the
+# first time they are needed: a client which only uses DeviceProxy does not
+# import their modules (see tango.__getattr__)
+
+__LAZY_INITIALIZED = set()
+__LAZY_LOCK = threading.RLock()
+
+
+def init_server():
+    """Initializes the server API (for internal usage only)"""
+    with __LAZY_LOCK:
+        if "server" in __LAZY_INITIALIZED:
+            return
+        __LAZY_INITIALIZED.add("server")
+
+        from . import device_class, device_server, pyutil, pipe, auto_monitor
+        from .pytango_pprint import pytango_pprint_server_init
+
+        doc = __DOC
+        device_class.device_class_init(doc=doc)
+        device_server.device_server_init(doc=doc)
+        pyutil.pyutil_init(doc=doc)
+        auto_monitor.auto_monitor_init(doc=doc)
+        pipe.pipe_init(doc=doc)
+        pytango_pprint_server_init(doc=doc)
+        if doc:
+            __install_lazy_doc((device_class, device_server, pyutil, pipe))
+
+
+def init_group():
+    """Initializes the Group API (for internal usage only)"""
+    with __LAZY_LOCK:
+        if "group" in __LAZY_INITIALIZED:
+            return
+        __LAZY_INITIALIZED.add("group")
+
+        from . import group, group_reply, group_reply_list
+
+        doc = __DOC
+        group.group_init(doc=doc)
+        group_reply.group_reply_init(doc=doc)
+        group_reply_list.group_reply_list_init(doc=doc)
+        if doc:
+            __install_lazy_doc((group,))
+
+
+def init_encoded_attribute():
+    """Initializes the EncodedAttribute API (for internal usage only)"""
+    with __LAZY_LOCK:
+        if "encoded_attribute" in __LAZY_INITIALIZED:
+            return
+        __LAZY_INITIALIZED.add("encoded_attribute")
+
+        from . import encoded_attribute
+
+        encoded_attribute.encoded_attribute_init(doc=__DOC)
@@ -13,7 +13,7 @@
 This is an internal PyTango module.
 """
 
-__all__ = ("pytango_pprint_init",)
+__all__ = ("pytango_pprint_init", "pytango_pprint_server_init")
 
 __docformat__ = "restructuredtext"
 
@@ -69,10 +69,6 @@ from ._tango import (
     CmdArgType,
 )
 
-from .device_server import AttributeAlarm, EventProperties
-from .device_server import ChangeEventProp, PeriodicEventProp, ArchiveEventProp
-from .device_server import AttributeConfig, AttributeConfig_2
-from .device_server import AttributeConfig_3, AttributeConfig_5
 import collections.abc
 
 
@@ -212,15 +208,6 @@ def __registerStructStr():
         EventData,
         AttrConfEventData,
         DataReadyEventData,
-        AttributeConfig,
-        AttributeConfig_2,
-        AttributeConfig_3,
-        AttributeConfig_5,
-        ChangeEventProp,
-        PeriodicEventProp,
-        ArchiveEventProp,
-        AttributeAlarm,
-        EventProperties,
     )
 
     for struct in structs:
@@ -239,6 +226,35 @@ def __registerStructStr():
     DevError.__str__ = __str__DevError
 
 
+def __registerServerStructStr():
+    """helper method to register str and repr methods for the structures
+    of the server API"""
+    from .device_server import AttributeAlarm, EventProperties
+    from .device_server import ChangeEventProp, PeriodicEventProp, ArchiveEventProp
+    from .device_server import AttributeConfig, AttributeConfig_2
+    from .device_server import AttributeConfig_3, AttributeConfig_5
+
+    structs = (
+        AttributeConfig,
+        AttributeConfig_2,
+        AttributeConfig_3,
+        AttributeConfig_5,
+        ChangeEventProp,
+        PeriodicEventProp,
+        ArchiveEventProp,
+        AttributeAlarm,
+        EventProperties,
+    )
+
+    for struct in structs:
+        struct.__str__ = __str__Struct
+        struct.__repr__ = __repr__Struct
+
+
 def pytango_pprint_init(doc=True):
     __registerSeqStr()
     __registerStructStr()
+
+
+def pytango_pprint_server_init(doc=True):
+    __registerServerStructStr()
@@ -13,21 +13,27 @@
 
 
 import sys
-import copy
+import json
+import itertools
+import collections
 from inspect import getfullargspec
 import inspect
 import logging
 import functools
+import threading
 import traceback
+import concurrent.futures
+
+import numpy
 
 from ._tango import AttrDataFormat, AttrWriteType, CmdArgType, PipeWriteType
-from ._tango import DevFailed, GreenMode, SerialModel
+from ._tango import AttReqType, DevFailed, Except, GreenMode, SerialModel
 
 from .attr_data import AttrData
 from .pipe_data import PipeData
 from .device_class import DeviceClass
 from .device_server import LatestDeviceImpl, get_worker, set_worker, run_in_executor
-from .utils import get_enum_labels
+from .utils import get_enum_labels, copy_doc, document_lazily, install_lazy_doc
 from .utils import (
     is_seq,
     is_non_str_seq,
@@ -35,10 +41,16 @@ from .utils import (
     is_enum_seq,
     is_enum,
     set_complex_value,
+    FROM_TANGO_TO_NUMPY_TYPE,
+    _ensure_omni_thread,
 )
 from .utils import is_devstate, is_devstate_seq, scalar_to_array_type, TO_TANGO_TYPE
 from .green import get_green_mode, get_executor
 from .pyutil import Util
+from .pytango_init import init_server
+
+# the low level server API is initialized on first use (see tango.__getattr__)
+init_server()
 
 __all__ = (
     "DeviceMeta",
@@ -89,6 +101,165 @@ def from_typeformat_to_type(dtype, dformat):
     return scalar_to_array_type(dtype)
 
 
+def __pop_concurrent_read(device, attr):
+    """
+    Returns the future of the attribute value if it is read concurrently
+    (see :attr:`BaseDevice.max_concurrent_reads`), None otherwise
+    """
+    reads = device.__dict__.get("_concurrent_reads")
+    if not reads:
+        return None
+    return reads.pop(attr.get_name(), None)
+
+
+def __pop_concurrent_is_allowed(device, attribute, request_type):
+    """
+    Returns the result of the is allowed method of the attribute if it was
+    already called by __start_concurrent_reads for the current
+    read_attributes request, None otherwise
+    """
+    if request_type != AttReqType.READ_REQ:
+        return None
+    allowed = device.__dict__.get("_concurrent_allowed")
+    if not allowed:
+        return None
+    return allowed.pop(attribute.attr_name.lower(), None)
+
+
+def __stop_concurrent_reads(device):
+    """
+    Shuts down the thread pool of the concurrent reads of the device
+    """
+    device.__dict__["_concurrent_reads"] = None
+    device.__dict__["_concurrent_allowed"] = None
+    pool = device.__dict__.pop("_concurrent_read_pool", None)
+    if pool is not None:
+        pool.shutdown(wait=False)
+
+
+def __release_zero_copy_arrays(device):
+    """
+    Releases the zero copy arrays set by the current thread (see
+    :meth:`~tango.Attribute.set_zero_copy`): the thread starts a new
+    request on the device, so the replies which used them have been sent
+    """
+    arrays = device.__dict__.get("_zero_copy_arrays")
+    if not arrays:
+        return
+    ident = threading.get_ident()
+    for key in [key for key in arrays if key[1] == ident]:
+        arrays.pop(key, None)
+
+
+def __start_concurrent_reads(device, attr_list):
+    """
+    Starts the evaluation of the read methods of the attributes of a
+    read_attributes request, at most device.max_concurrent_reads at the
+    same time. Their wrapped read method then waits for the result
+    instead of calling the read method.
+
+    :param device: the device
+    :type device: BaseDevice
+    :param attr_list: indices of the attributes to be read
+    :type attr_list: Sequence[int]
+    """
+    device.__dict__["_concurrent_reads"] = None
+    # Tango calls the is allowed methods after read_attr_hardware: they get
+    # these results instead of being called again
+    allowed = device.__dict__["_concurrent_allowed"] = {}
+    worker = get_worker()
+    green_mode = getattr(worker, "green_mode", None)
+    in_event_loop = green_mode in (GreenMode.Asyncio, GreenMode.Gevent)
+    attributes = getattr(type(device), "TangoClassClass", None)
+    if attributes is None:
+        return
+    attributes = attributes.attr_list
+    dev_attr = device.get_device_attr()
+    read_methods = {}
+    for index in attr_list:
+        name = dev_attr.get_attr_by_ind(index).get_name()
+        attr = attributes.get(name)
+        if attr is None or attr.forward:
+            # dynamic or forwarded attribute
+            continue
+        if attr.attr_write not in (AttrWriteType.READ, AttrWriteType.READ_WRITE):
+            continue
+        if in_event_loop and not attr.read_green_mode:
+            continue
+        is_allowed = getattr(device, attr.is_allowed_name, None)
+        if is_allowed is not None:
+            allowed[name.lower()] = is_allowed(AttReqType.READ_REQ)
+            if not allowed[name.lower()]:
+                continue
+        read_method = getattr(device, attr.read_method_name).__wrapped__
+        read_methods[name] = read_method, attr.read_green_mode
+    if len(read_methods) < 2:
+        return
+
+    if green_mode == GreenMode.Asyncio:
+        import asyncio
+
+        async def read_all():
+            slots = asyncio.Semaphore(device.max_concurrent_reads)
+
+            async def read(read_method):
+                async with slots:
+                    ret = read_method(device)
+                    if inspect.isawaitable(ret):
+                        ret = await ret
+                    return ret
+
+            coros = [read(read_method) for read_method, _ in read_methods.values()]
+            return await asyncio.gather(*coros, return_exceptions=True)
+
+    elif green_mode == GreenMode.Gevent:
+        import gevent
+        import gevent.pool
+
+        def read_all():
+            # in greenlets of the gevent event loop: they overlap when the
+            # read methods yield to it
+            slots = gevent.pool.Pool(device.max_concurrent_reads)
+
+            def read(read_method):
+                try:
+                    return read_method(device)
+                except Exception as exc:
+                    return exc
+
+            greenlets = [
+                slots.spawn(read, method) for method, _ in read_methods.values()
+            ]
+            gevent.joinall(greenlets)
+            return [greenlet.value for greenlet in greenlets]
+
+    if in_event_loop:
+        futures = {}
+        for name, ret in zip(read_methods, worker.execute(read_all)):
+            future = futures[name] = concurrent.futures.Future()
+            if isinstance(ret, BaseException):
+                future.set_exception(ret)
+            else:
+                future.set_result(ret)
+    else:
+        pool = device.__dict__.get("_concurrent_read_pool")
+        if pool is None:
+            pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=device.max_concurrent_reads,
+                thread_name_prefix="PyTangoRead",
+                # the read methods may push events, use proxies...
+                initializer=_ensure_omni_thread,
+            )
+            device.__dict__["_concurrent_read_pool"] = pool
+        futures = {}
+        for name, (read_method, read_green_mode) in read_methods.items():
+            if read_green_mode:
+                futures[name] = pool.submit(worker.execute, read_method, device)
+            else:
+                futures[name] = pool.submit(read_method, device)
+    device.__dict__["_concurrent_reads"] = futures
+
+
 def __get_wrapped_read_method(attribute, read_method):
     """
     Make sure attr is updated on read, and wrap it with executor, if needed.
@@ -107,8 +278,12 @@ def __get_wrapped_read_method(attribute, read_method):
 
         @functools.wraps(read_method)
         def read_attr(self, attr):
-            worker = get_worker()
-            ret = worker.execute(read_method, self)
+            future = __pop_concurrent_read(self, attr)
+            if future is not None:
+                ret = future.result()
+            else:
+                worker = get_worker()
+                ret = worker.execute(read_method, self)
             if not attr.get_value_flag() and ret is not None:
                 set_complex_value(attr, ret)
             return ret
@@ -117,7 +292,11 @@ def __get_wrapped_read_method(attribute, read_method):
 
         @functools.wraps(read_method)
         def read_attr(self, attr):
-            ret = read_method(self)
+            future = __pop_concurrent_read(self, attr)
+            if future is not None:
+                ret = future.result()
+            else:
+                ret = read_method(self)
             if not attr.get_value_flag() and ret is not None:
                 set_complex_value(attr, ret)
             return ret
@@ -213,14 +392,22 @@ def __get_wrapped_isallowed_method(attribute, isallowed_method):
 
         @functools.wraps(isallowed_method)
         def isallowed_attr(self, request_type):
+            allowed = __pop_concurrent_is_allowed(self, attribute, request_type)
+            if allowed is not None:
+                return allowed
             worker = get_worker()
             return worker.execute(isallowed_method, self, request_type)
 
     else:
-        isallowed_attr = isallowed_method
 
-    if isallowed_attr is not isallowed_method:
-        isallowed_attr.__access_wrapped__ = True
+        @functools.wraps(isallowed_method)
+        def isallowed_attr(self, request_type):
+            allowed = __pop_concurrent_is_allowed(self, attribute, request_type)
+            if allowed is not None:
+                return allowed
+            return isallowed_method(self, request_type)
+
+    isallowed_attr.__access_wrapped__ = True
     return isallowed_attr
 
 
@@ -480,7 +667,10 @@ def __patch_standard_device_methods(klass):
 
         @functools.wraps(delete_device_orig)
         def delete_device(self):
-            return get_worker().execute(delete_device_orig, self)
+            try:
+                return get_worker().execute(delete_device_orig, self)
+            finally:
+                __stop_concurrent_reads(self)
 
         delete_device.__access_wrapped__ = True
         setattr(klass, "delete_device", delete_device)
@@ -513,7 +703,10 @@ def __patch_standard_device_methods(klass):
 
         @functools.wraps(read_attr_hardware_orig)
         def read_attr_hardware(self, attr_list):
-            return get_worker().execute(read_attr_hardware_orig, self, attr_list)
+            ret = get_worker().execute(read_attr_hardware_orig, self, attr_list)
+            if self.max_concurrent_reads > 1:
+                __start_concurrent_reads(self, attr_list)
+            return ret
 
         read_attr_hardware.__access_wrapped__ = True
         setattr(klass, "read_attr_hardware", read_attr_hardware)
@@ -524,12 +717,134 @@ def __patch_standard_device_methods(klass):
 
         @functools.wraps(always_executed_hook_orig)
         def always_executed_hook(self):
+            # new request: forget the is allowed results of an aborted one
+            self.__dict__["_concurrent_allowed"] = None
+            __release_zero_copy_arrays(self)
             return get_worker().execute(always_executed_hook_orig, self)
 
         always_executed_hook.__access_wrapped__ = True
         setattr(klass, "always_executed_hook", always_executed_hook)
 
 
+__CHUNK_COMMAND = "ReadAttributeChunk"
+__CHUNK_MAX_CLIENTS = 16
+
+
+def __read_attribute_chunk(self, attributes, argin):
+    """
+    Serves a slice of the value of a chunked attribute. The whole value
+    is read once, when the first chunk is requested, and kept until its
+    last chunk has been sent (or until the client starts more than
+    max_chunked_reads reads, or until more than __CHUNK_MAX_CLIENTS other
+    clients start reads)
+
+    :param attributes: the chunked attributes (lower case name -> AttrData)
+    :type attributes: dict
+    :param argin: ([offset, count, token], [attribute name, client id]).
+                  The client id is missing for older clients
+    :type argin: tuple
+    :return: (header, data). The header is a json dictionary with the
+             dtype, shape, offset and token of the snapshot, the data
+             are the raw bytes of the slice
+    :rtype: tuple
+    """
+    (offset, count, token), names = argin
+    attr_name, client = names[0], names[1] if len(names) > 1 else ""
+    count = max(1, count)
+    attr = attributes.get(attr_name.lower())
+    if attr is None:
+        raise ValueError(f"{attr_name} is not a chunked attribute")
+    clients = self.__dict__.setdefault("_chunk_snapshots", collections.OrderedDict())
+    snapshots = clients.pop(client, None)
+    if snapshots is None:
+        snapshots = collections.OrderedDict()
+    # the least recently active clients are forgotten first
+    clients[client] = snapshots
+    while len(clients) > __CHUNK_MAX_CLIENTS:
+        clients.popitem(last=False)
+    key = attr_name.lower(), token
+    if offset == 0 or key not in snapshots:
+        if offset != 0:
+            raise ValueError(
+                f"Chunked read of {attr_name} expired (token {token}), "
+                f"restart it from offset 0"
+            )
+        is_allowed = getattr(self, attr.is_allowed_name, None)
+        if is_allowed is not None and not is_allowed(AttReqType.READ_REQ):
+            Except.throw_exception(
+                "API_AttrNotAllowed",
+                f"It is currently not allowed to read attribute {attr_name}",
+                __CHUNK_COMMAND,
+            )
+        read_method = getattr(self, attr.read_method_name).__wrapped__
+        if attr.read_green_mode:
+            value = get_worker().execute(read_method, self)
+        else:
+            value = read_method(self)
+        if value is None:
+            raise ValueError(
+                f"{attr_name} read method must return the value to be read in "
+                f"chunks (attr.set_value is not supported)"
+            )
+        if isinstance(value, tuple) and len(value) == 3 and is_seq(value[0]):
+            # (value, date, quality), as told apart by set_complex_value
+            rows = value[0]
+            if attr.attr_format == AttrDataFormat.SPECTRUM or (
+                len(rows) and is_seq(rows[0])
+            ):
+                value = rows
+        value = numpy.ascontiguousarray(
+            value, dtype=FROM_TANGO_TO_NUMPY_TYPE[attr.attr_type]
+        )
+        if attr.attr_format == AttrDataFormat.SPECTRUM:
+            value = value.reshape(-1)
+        elif value.ndim != 2:
+            raise ValueError(f"{attr_name} value must be a 2D array")
+        tokens = self.__dict__.setdefault("_chunk_tokens", itertools.count(1))
+        token = next(tokens) % 2**31
+        key = attr_name.lower(), token
+        snapshots[key] = value
+        while len(snapshots) > max(1, self.max_chunked_reads):
+            snapshots.popitem(last=False)
+    value = snapshots[key]
+    if value.ndim == 2 and value.shape[1]:
+        # images are sent in whole rows
+        row = value.shape[1]
+        count = max(row, count - count % row)
+    flat = value.reshape(-1)
+    end = offset + count
+    if end >= flat.size:
+        del snapshots[key]
+        if not snapshots:
+            del clients[client]
+    header = dict(
+        dtype=value.dtype.str, shape=list(value.shape), offset=offset, token=token
+    )
+    return json.dumps(header), flat[offset:end].tobytes()
+
+
+def __patch_chunked_read_command(tango_device_klass, chunked_attrs, cmd_list):
+    """
+    Adds the command used by :meth:`~tango.DeviceProxy.read_attribute_chunks`
+    to read the chunked attributes in slices.
+
+    :param tango_device_klass: a DeviceImpl class
+    :type tango_device_klass: class
+    :param chunked_attrs: the chunked attributes data information
+    :type chunked_attrs: sequence<AttrData>
+    :param cmd_list: the class command list
+    :type cmd_list: dict
+    """
+    attributes = {attr.attr_name.lower(): attr for attr in chunked_attrs}
+    cmd = functools.partialmethod(__read_attribute_chunk, attributes)
+    setattr(tango_device_klass, __CHUNK_COMMAND, cmd)
+    cmd_list[__CHUNK_COMMAND] = [
+        [CmdArgType.DevVarLongStringArray, "([offset, count, token], [attr name])"],
+        [CmdArgType.DevEncoded, "(json header, raw data)"],
+        {},
+    ]
+
+
 class _DeviceClass(DeviceClass):
     def __init__(self, name):
         DeviceClass.__init__(self, name)
@@ -568,6 +883,7 @@ def __create_tango_deviceclass_klass(tango_device_klass, attrs=None):
     class_property_list = {}
     device_property_list = {}
     cmd_list = {}
+    chunked_attrs = []
 
     for attr_name, attr_obj in attrs.items():
         if isinstance(attr_obj, attribute):
@@ -578,6 +894,8 @@ def __create_tango_deviceclass_klass(tango_device_klass, attrs=None):
             attr_list[attr_name] = attr_obj
             if not attr_obj.forward:
                 __patch_attr_methods(tango_device_klass, attr_obj)
+                if attr_obj.chunked:
+                    chunked_attrs.append(attr_obj)
         elif isinstance(attr_obj, pipe):
             if attr_obj.pipe_name is None:
                 attr_obj._set_name(attr_name)
@@ -621,6 +939,9 @@ def __create_tango_deviceclass_klass(tango_device_klass, attrs=None):
                         tango_device_klass, is_allowed_method, cmd_name
                     )
 
+    if chunked_attrs:
+        __patch_chunked_read_command(tango_device_klass, chunked_attrs, cmd_list)
+
     __patch_standard_device_methods(tango_device_klass)
 
     devclass_name = klass_name + "Class"
@@ -710,11 +1031,68 @@ class BaseDevice(LatestDeviceImpl):
 
     It should not be used directly, since this class is not an
     instance of MetaDevice. Use tango.server.Device instead.
+
+    The read methods of the attributes of a read_attributes request are
+    called one after the other. To call them concurrently, for example
+    when each one waits for slow hardware, set the class member
+    *max_concurrent_reads* to the maximum number of read methods running
+    at the same time::
+
+        class PowerSupply(Device):
+
+            max_concurrent_reads = 8
+
+    In *Asyncio* green mode the read methods are gathered in the event
+    loop, and in *Gevent* green mode they run in greenlets of the gevent
+    event loop, so they only overlap when they yield to it (e.g. with
+    gevent.sleep). Otherwise they run in a thread pool of the device, so
+    they must be thread safe (its threads are omniORB threads: the read
+    methods can push events). Only the attributes declared in the class
+    are read concurrently, dynamic attributes and, in the *Asyncio* and
+    *Gevent* green modes, attributes with a synchronous read method
+    (*read_green_mode* set to False) are still read one after the other.
+
+    At server startup, the devices of a class are created (and their
+    *init_device* called) one after the other. To create them
+    concurrently, for example when *init_device* connects to slow
+    hardware, set the class member *max_concurrent_inits* to the maximum
+    number of devices created at the same time::
+
+        class PowerSupply(Device):
+
+            max_concurrent_inits = 16
+
+    The devices are created in a thread pool, so *init_device* must be
+    thread safe (in *Asyncio* green mode the *init_device* coroutines run
+    concurrently in the event loop, in *Gevent* green mode *init_device*
+    runs in the gevent event loop and only overlaps when it yields to it).
+    The devices are added to the class in the order of the device list,
+    and exported once all of them are created. The creation time of each device is given by
+    :meth:`~tango.DeviceClass.get_device_creation_times`.
+
+    The value of a chunked attribute (see
+    :meth:`~tango.DeviceProxy.read_attribute_chunks`) is kept until its
+    last chunk is sent. The class member *max_chunked_reads* is the
+    maximum number of values kept per client: when a client starts more
+    reads, its oldest one is dropped (and fails on its next chunk).
+
+    .. versionadded:: 9.4.2
+        max_concurrent_reads, max_concurrent_inits and max_chunked_reads
     """
 
+    max_concurrent_reads = 1
+    max_concurrent_inits = 1
+    max_chunked_reads = 4
+
     def __init__(self, cl, name):
         self._tango_properties = {}
         LatestDeviceImpl.__init__(self, cl, name)
+        klass = getattr(type(self), "TangoClassClass", None)
+        if klass is not None:
+            dev_attr = self.get_device_attr()
+            for attr in klass.attr_list.values():
+                if attr.zero_copy:
+                    dev_attr.get_attr_by_name(attr.attr_name).set_zero_copy(True)
         self.init_device()
 
     def init_device(self):
@@ -726,8 +1104,6 @@ class BaseDevice(LatestDeviceImpl):
     def delete_device(self):
         pass
 
-    delete_device.__doc__ = LatestDeviceImpl.delete_device.__doc__
-
     def read_attr_hardware(self, attr_list):
         return LatestDeviceImpl.read_attr_hardware(self, attr_list)
 
@@ -747,7 +1123,9 @@ class BaseDevice(LatestDeviceImpl):
                 return
         try:
             pu = self.prop_util = ds_class.prop_util
-            self.device_property_list = copy.deepcopy(ds_class.device_property_list)
+            self.device_property_list = pu.copy_properties(
+                ds_class.device_property_list
+            )
             class_prop = ds_class.class_property_list
             pu.get_device_properties(self, class_prop, self.device_property_list)
             for prop_name in class_prop:
@@ -806,6 +1184,10 @@ class BaseDevice(LatestDeviceImpl):
         return run((cls,), args, **kwargs)
 
 
+document_lazily(copy_doc, BaseDevice, "delete_device", classes=(BaseDevice,))
+install_lazy_doc((BaseDevice,))
+
+
 class attribute(AttrData):
     '''
     Declares a new tango attribute in a :class:`Device`. To be used
@@ -873,6 +1255,8 @@ class attribute(AttrData):
     write_green_mode       :obj:`bool`                      'green_mode' value                      green mode for write function. If True: run with green mode executor, if False: run directly
     isallowed_green_mode   :obj:`bool`                      'green_mode' value                      green mode for is allowed function. If True: run with green mode executor, if False: run directly
     forwarded              :obj:`bool`                      False                                   the attribute should be forwarded if True
+    chunked                :obj:`bool`                      False                                   the (SPECTRUM or IMAGE) attribute can also be read in slices with :meth:`~tango.DeviceProxy.read_attribute_chunks`
+    zero_copy              :obj:`bool`                      False                                   numpy values of the (SPECTRUM or IMAGE) attribute are given to tango without copy (see :meth:`~tango.Attribute.set_zero_copy`)
     ===================== ================================ ======================================= =======================================================================================
 
     .. note::
@@ -920,6 +1304,9 @@ class attribute(AttrData):
 
     .. versionadded:: 8.1.7
         added green_mode, read_green_mode and write_green_mode options
+
+    .. versionadded:: 9.4.2
+        added chunked and zero_copy options
     '''
 
     def __init__(self, fget=None, **kwargs):
@@ -927,11 +1314,15 @@ class attribute(AttrData):
         self.name = kwargs.pop("name", None)
         class_name = kwargs.pop("class_name", None)
         forward = kwargs.get("forwarded", False)
+        self.chunked = False
+        self.zero_copy = False
         if forward:
             expected = 2 if "label" in kwargs else 1
             if len(kwargs) > expected:
                 raise TypeError("Forwarded attributes only support label argument")
         else:
+            self.chunked = kwargs.pop("chunked", False)
+            self.zero_copy = kwargs.pop("zero_copy", False)
             green_mode = kwargs.pop("green_mode", True)
             self.read_green_mode = kwargs.pop("read_green_mode", green_mode)
             self.write_green_mode = kwargs.pop("write_green_mode", green_mode)
@@ -993,6 +1384,12 @@ class attribute(AttrData):
                 dtype, dformat, caller="attribute"
             )
         self.build_from_dict(kwargs)
+        if self.chunked:
+            numpy_type = FROM_TANGO_TO_NUMPY_TYPE.get(self.attr_type, str)
+            if self.attr_format == AttrDataFormat.SCALAR or numpy_type is str:
+                raise TypeError(
+                    "Only numerical SPECTRUM and IMAGE attributes can be chunked"
+                )
 
     def get_attribute(self, obj):
         return obj.get_device_attr().get_attr_by_name(self.attr_name)
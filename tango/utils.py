@@ -20,6 +20,7 @@ import types
 import numbers
 import inspect
 import enum
+import threading
 import numpy
 
 from argparse import HelpFormatter
@@ -42,10 +43,12 @@ from ._tango import (
     DevFailed,
     constants,
     DevState,
+    GreenMode,
     CommunicationFailed,
     PipeEventData,
     DevIntrChangeEventData,
     Database,
+    EnsureOmniThread,
 )
 
 from . import _tango
@@ -74,9 +77,12 @@ __all__ = (
     "document_method",
     "document_static_method",
     "document_enum",
+    "document_lazily",
+    "load_docs",
     "CaselessList",
     "CaselessDict",
     "EventCallback",
+    "AttributeRingBuffer",
     "get_home",
     "from_version_str_to_hex_str",
     "from_version_str_to_int",
@@ -1233,6 +1239,223 @@ def document_enum(klass, enum_name, desc, append=True):
         enum_class.__doc__ = desc
 
 
+__LAZY_DOC = False
+# documentation functions which are not bound to classes: called with the
+# documentation of the first class needed
+__LAZY_DOC_FUNCS = []
+# class -> documentation functions of the class
+__LAZY_DOC_CLASS_FUNCS = {}
+# class -> (_LazyDoc or None, [(name, _LazyDocMethod)]) of the placeholders
+# installed in the class
+__LAZY_DOC_CLASSES = {}
+# id(function) -> (function, docstring) of the hidden method docstrings
+__LAZY_DOC_HIDDEN = {}
+__LAZY_DOC_LOCK = threading.RLock()
+
+
+class _LazyDoc:
+    """Placeholder of the docstring of a class until its documentation
+    registered with :func:`document_lazily` is loaded: the first access to
+    the class docstring loads it (see :func:`load_docs`)"""
+
+    def __init__(self, doc):
+        self.doc = doc
+
+    def __get__(self, obj, klass=None):
+        load_class_docs(klass)
+        for base in klass.__mro__:
+            if "__doc__" in base.__dict__:
+                doc = base.__dict__["__doc__"]
+                return doc.doc if isinstance(doc, _LazyDoc) else doc
+        return None
+
+
+class _LazyDocMethod:
+    """Placeholder of a method of a class until the documentation of the
+    class is loaded. Only an access through the class loads it
+    (``help(tango.DeviceProxy.read_attribute)``, or ``help(proxy.read_attribute)``
+    which looks the docstring up in the class): calling the method of an
+    instance does not"""
+
+    def __init__(self, method):
+        self.method = method
+
+    def __get__(self, obj, klass=None):
+        if obj is None:
+            load_class_docs(klass)
+        return self.method.__get__(obj, klass)
+
+
+def set_lazy_doc(lazy):
+    """Enables (or disables) the lazy documentation: if enabled, the
+    functions given to :func:`document_lazily` are not called until
+    :func:`load_docs` is (for internal usage only)"""
+    global __LAZY_DOC
+    __LAZY_DOC = lazy
+
+
+def __hide_doc(func):
+    # a method without a docstring makes inspect.getdoc and pydoc look it up
+    # in the class, which loads the documentation of the class
+    if not isinstance(func, types.FunctionType) or func.__doc__ is None:
+        return
+    __LAZY_DOC_HIDDEN.setdefault(id(func), (func, func.__doc__))
+    func.__doc__ = None
+
+
+def __restore_doc(func):
+    hidden = __LAZY_DOC_HIDDEN.pop(id(func), None)
+    if hidden is not None:
+        func.__doc__ = hidden[1]
+
+
+def install_lazy_doc(classes):
+    """Replaces the docstring and the public methods of the given classes
+    (and of the classes with pending documentation functions) by
+    placeholders which load the pending documentation of the class when
+    they are accessed (for internal usage only)"""
+    with __LAZY_DOC_LOCK:
+        if not __LAZY_DOC_FUNCS and not __LAZY_DOC_CLASS_FUNCS:
+            return
+        for klass in set(classes) | set(__LAZY_DOC_CLASS_FUNCS):
+            if klass in __LAZY_DOC_CLASSES or "__doc__" not in klass.__dict__:
+                # already installed or inherited docstring
+                continue
+            doc = klass.__dict__["__doc__"]
+            try:
+                klass.__doc__ = _LazyDoc(doc)
+            except (AttributeError, TypeError):
+                # builtin or extension type without a writable __doc__
+                continue
+            methods = []
+            for name, method in list(vars(klass).items()):
+                if name.startswith("_") or isinstance(method, type):
+                    continue
+                if isinstance(method, (staticmethod, classmethod)):
+                    # called through the class: documented with the class
+                    continue
+                if not callable(method) or not hasattr(type(method), "__get__"):
+                    continue
+                if isinstance(method, types.FunctionType):
+                    # what document_method does: pydoc looks the method up
+                    # in the class by its name
+                    try:
+                        method.__name__ = name
+                    except AttributeError:
+                        pass
+                __hide_doc(method)
+                placeholder = _LazyDocMethod(method)
+                setattr(klass, name, placeholder)
+                methods.append((name, placeholder))
+            __LAZY_DOC_CLASSES[klass] = (klass.__dict__["__doc__"], methods)
+
+
+def document_lazily(doc_func, *args, classes=(), **kwargs):
+    """Calls doc_func(*args, **kwargs), which sets docstrings, or delays
+    the call until the documentation is needed if the lazy documentation
+    is enabled (the default when importing tango, unless the environment
+    variable :envvar:`PYTANGO_LAZY_DOC` is set to 0)
+
+    :param classes: the classes documented by doc_func: it is called the
+                    first time the documentation of one of them is needed.
+                    Without classes, it is called the first time the
+                    documentation of any class is needed
+    :type classes: sequence<type>
+
+    .. versionadded:: 9.4.2
+    """
+    with __LAZY_DOC_LOCK:
+        if __LAZY_DOC:
+            entry = [doc_func, args, kwargs]
+            if not classes:
+                __LAZY_DOC_FUNCS.append(entry)
+            for klass in classes:
+                __LAZY_DOC_CLASS_FUNCS.setdefault(klass, []).append(entry)
+            return
+    doc_func(*args, **kwargs)
+
+
+def __call_doc_func(entry):
+    doc_func, args, kwargs = entry
+    if doc_func is None:
+        # already called for another class
+        return
+    entry[0] = None
+    doc_func(*args, **kwargs)
+
+
+def __uninstall_lazy_doc(klass):
+    doc, methods = __LAZY_DOC_CLASSES.pop(klass, (None, ()))
+    # restore the original docstrings first: some documentation
+    # functions append to them
+    if klass.__dict__.get("__doc__") is doc:
+        klass.__doc__ = doc.doc
+    # in reverse order: the same function may be installed twice
+    for name, placeholder in reversed(methods):
+        if klass.__dict__.get(name) is placeholder:
+            setattr(klass, name, placeholder.method)
+        __restore_doc(placeholder.method)
+
+
+def load_class_docs(klass):
+    """Sets the pending docstrings of the given class and of its base
+    classes (for internal usage only)"""
+    with __LAZY_DOC_LOCK:
+        funcs = list(__LAZY_DOC_FUNCS)
+        del __LAZY_DOC_FUNCS[:]
+        bases = list(reversed(klass.__mro__))
+        for base in bases:
+            __uninstall_lazy_doc(base)
+        for entry in funcs:
+            __call_doc_func(entry)
+        # the documentation of the base classes first: the classes copy it
+        for base in bases:
+            for entry in __LAZY_DOC_CLASS_FUNCS.pop(base, ()):
+                __call_doc_func(entry)
+
+
+def load_docs():
+    """Sets all the docstrings given to :func:`document_lazily` which are
+    not set yet.
+
+    When the lazy documentation is enabled, the docstrings of a PyTango
+    class and of its methods are set the first time the docstring of the
+    class or one of its methods is accessed through the class
+    (``help(tango.DeviceProxy)`` or ``help(proxy.read_attribute)`` for
+    example). Calling the methods does not set them. Call this function to
+    set all of them before.
+
+    .. versionadded:: 9.4.2
+    """
+    global __LAZY_DOC
+    with __LAZY_DOC_LOCK:
+        # from now on, the documentation functions are called immediately
+        __LAZY_DOC = False
+        for klass in list(__LAZY_DOC_CLASSES):
+            __uninstall_lazy_doc(klass)
+        funcs = list(__LAZY_DOC_FUNCS)
+        del __LAZY_DOC_FUNCS[:]
+        for klass_funcs in __LAZY_DOC_CLASS_FUNCS.values():
+            funcs.extend(klass_funcs)
+        __LAZY_DOC_CLASS_FUNCS.clear()
+        for entry in funcs:
+            __call_doc_func(entry)
+
+
+__OMNI_THREAD = threading.local()
+
+
+def _ensure_omni_thread():
+    """Makes the calling thread look like an omniORB thread until it ends.
+    The initializer of the thread pools which call Tango (for internal
+    usage only)"""
+    if getattr(__OMNI_THREAD, "ensure", None) is None:
+        ensure = EnsureOmniThread()
+        ensure.__enter__()
+        # released by its destructor when the thread ends
+        __OMNI_THREAD.ensure = ensure
+
+
 class CaselessList(list):
     """A case insensitive lists that has some caseless methods. Only allows
     strings as list members. Most methods that would normally return a list,
@@ -1708,6 +1931,134 @@ class EventCallback:
             return
 
 
+class AttributeRingBuffer:
+    """
+    Ring buffer of the last *capacity* values of a SPECTRUM or IMAGE
+    attribute, preallocated once: keeping a history does not hold one
+    received array per value (each value is copied, see the note of
+    :meth:`~tango.DeviceProxy.read_attribute_into`).
+
+    It can be filled by reading the attribute or used as the callback of
+    an event subscription. Each value is copied into its slot (see
+    :meth:`~tango.DeviceAttribute.value_into`)::
+
+        >>> ring = tango.utils.AttributeRingBuffer(1000, (65536,), numpy.float64)
+        >>> for _ in range(100):
+        ...     ring.read_attribute(dev, "spectrum")
+        >>> id = dev.subscribe_event("spectrum", tango.EventType.CHANGE_EVENT, ring)
+        >>> ring.values().mean(axis=0)
+
+    :param capacity: maximum number of values kept
+    :type capacity: int
+    :param shape: shape of the attribute value ((dim_y, dim_x) for images)
+    :type shape: tuple
+    :param dtype: numpy dtype of the attribute value
+    :type dtype: numpy.dtype
+
+    New in PyTango 9.4.2
+    """
+
+    def __init__(self, capacity, shape, dtype):
+        if capacity < 1:
+            raise ValueError("capacity must be a positive number")
+        self._data = numpy.empty((capacity,) + tuple(shape), dtype=dtype)
+        self._times = numpy.zeros(capacity)
+        self._count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self):
+        """The maximum number of values kept"""
+        return len(self._data)
+
+    @property
+    def count(self):
+        """The total number of values stored since the creation (or the
+        last :meth:`clear`)"""
+        return self._count
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    def clear(self):
+        """Forget all the stored values"""
+        with self._lock:
+            self._count = 0
+
+    def _store(self, dev_attr):
+        with self._lock:
+            index = self._count % self.capacity
+            dev_attr.value_into(self._data[index])
+            self._times[index] = dev_attr.time.totime()
+            self._count += 1
+
+    def read_attribute(self, proxy, attr_name):
+        """
+        Read the attribute and store its value in the next slot,
+        overwriting the oldest value when the buffer is full
+
+        :param proxy: the device
+        :type proxy: DeviceProxy
+        :param attr_name: the attribute name
+        :type attr_name: str
+        :return: the read attribute, its value is the slot
+        :rtype: DeviceAttribute
+        """
+        # not read_attribute: the value of a cached DeviceAttribute
+        # must not be replaced by the slot
+        (dev_attr,) = proxy.read_attributes(
+            [attr_name], green_mode=GreenMode.Synchronous
+        )
+        if dev_attr.has_failed:
+            raise DevFailed(*dev_attr.get_err_stack())
+        self._store(dev_attr)
+        return dev_attr
+
+    def push_event(self, evt):
+        """Stores the value of the received event (events with an error or
+        without value are ignored)"""
+        if not evt.err and evt.attr_value.value is not None:
+            self._store(evt.attr_value)
+
+    def values(self):
+        """
+        Return a copy of the stored values, from the oldest to the newest
+
+        :return: an array of shape (len(self),) + shape
+        :rtype: numpy.ndarray
+        """
+        return self.items()[1]
+
+    def items(self):
+        """
+        Return a copy of the stored values and of their timestamps, from the
+        oldest to the newest
+
+        :return: (timestamps, values)
+        :rtype: tuple<numpy.ndarray, numpy.ndarray>
+        """
+        with self._lock:
+            if self._count <= self.capacity:
+                count = self._count
+                return self._times[:count].copy(), self._data[:count].copy()
+            start = self._count % self.capacity
+            order = numpy.r_[start : self.capacity, 0:start]
+            return self._times[order], self._data[order]
+
+    def latest(self):
+        """
+        Return the last stored value (it is not a copy, so it will be
+        overwritten once the buffer wraps around)
+
+        :return: the last value or None if the buffer is empty
+        :rtype: numpy.ndarray
+        """
+        with self._lock:
+            if not self._count:
+                return None
+            return self._data[(self._count - 1) % self.capacity]
+
+
 def get_home():
     """
     Find user's home directory if possible. Otherwise raise error.
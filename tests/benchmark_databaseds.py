@@ -0,0 +1,168 @@
+"""Time the sqlite3 backend calls behind the most used DataBase commands
+against a synthetic database. Not collected by pytest, run it with::
+
+    python tests/benchmark_databaseds.py --servers 400 --devices 100
+"""
+
+import os
+import sys
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+import statistics
+
+from tango.databaseds.db_access.sqlite3 import Sqlite3Database
+
+
+def populate(db_name, n_servers, n_devices, n_props, n_attrs):
+    """Fill the database with *n_servers* servers of *n_devices* devices
+    each, every device having *n_props* properties and *n_attrs* attributes
+    with two properties each"""
+    conn = sqlite3.connect(db_name)
+    devices = []
+    dev_props = []
+    attr_props = []
+    for s in range(n_servers):
+        server = f"BenchServer/{s}"
+        devices.append(
+            (f"dserver/{server}", "dserver", "BenchServer", str(s), server, "DServer")
+        )
+        for d in range(n_devices):
+            name = f"bench/server{s}/{d}"
+            devices.append((name, "bench", f"server{s}", str(d), server, "BenchDevice"))
+            for p in range(n_props):
+                dev_props.append((name, f"prop{p}", 1, f"value{p}"))
+            for a in range(n_attrs):
+                attr_props.append((name, f"attr{a}", "min_value", 1, "0"))
+                attr_props.append((name, f"attr{a}", "max_value", 1, "100"))
+    conn.executemany(
+        "INSERT INTO device (name, domain, family, member, exported, ior, host, "
+        "server, pid, class, version) VALUES (?, ?, ?, ?, 1, 'IOR:00', 'host', "
+        "?, 1, ?, '5')",
+        devices,
+    )
+    conn.executemany(
+        "INSERT INTO property_device (device, name, count, value, updated, "
+        "accessed) VALUES (?, ?, ?, ?, 0, 0)",
+        dev_props,
+    )
+    conn.executemany(
+        "INSERT INTO property_attribute_device (device, attribute, name, count, "
+        "value, updated, accessed) VALUES (?, ?, ?, ?, ?, 0, 0)",
+        attr_props,
+    )
+    conn.commit()
+    conn.close()
+
+
+def timeit(func, args_list):
+    times = []
+    for args in args_list:
+        start = time.perf_counter()
+        func(*args)
+        times.append((time.perf_counter() - start) * 1000.0)
+    return times
+
+
+def report(name, times):
+    times = sorted(times)
+    p99 = times[min(len(times) - 1, int(len(times) * 0.99))]
+    print(
+        "%-32s %8d %10.3f %10.3f %10.3f"
+        % (name, len(times), statistics.mean(times), statistics.median(times), p99)
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--servers", type=int, default=400)
+    parser.add_argument("--devices", type=int, default=100, help="per server")
+    parser.add_argument("--properties", type=int, default=5, help="per device")
+    parser.add_argument("--attributes", type=int, default=5, help="per device")
+    parser.add_argument("--calls", type=int, default=1000, help="per command")
+    parser.add_argument("--db", default=None, help="database file (kept)")
+    options = parser.parse_args(argv)
+
+    tmp_dir = None
+    db_name = options.db
+    if db_name is None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        db_name = os.path.join(tmp_dir.name, "bench.db")
+
+    db = Sqlite3Database(db_name=db_name, fire_to_starter=False)
+    n_devices = options.servers * options.devices
+    print(f"Populating {db_name} with {n_devices} devices...")
+    start = time.perf_counter()
+    populate(
+        db_name,
+        options.servers,
+        options.devices,
+        options.properties,
+        options.attributes,
+    )
+    print(f"done in {time.perf_counter() - start:.1f} s\n")
+
+    rnd = random.Random(0)
+
+    def random_device():
+        return "bench/server%d/%d" % (
+            rnd.randrange(options.servers),
+            rnd.randrange(options.devices),
+        )
+
+    def random_server():
+        return "BenchServer/%d" % rnd.randrange(options.servers)
+
+    calls = options.calls
+    props = [f"prop{p}" for p in range(options.properties)]
+    attrs = [f"attr{a}" for a in range(options.attributes)]
+    benchmarks = [
+        (
+            "DbImportDevice",
+            db.import_device,
+            [(random_device(),) for _ in range(calls)],
+        ),
+        (
+            "DbGetDeviceProperty",
+            db.get_device_property,
+            [(random_device(), props) for _ in range(calls)],
+        ),
+        (
+            "DbGetDevicePropertyBulk(100)",
+            db.get_device_property_bulk,
+            [
+                ([random_device() for _ in range(100)], props)
+                for _ in range(max(1, calls // 10))
+            ],
+        ),
+        (
+            "DbGetDeviceAttributeProperty2",
+            db.get_device_attribute_property2,
+            [(random_device(), attrs) for _ in range(calls)],
+        ),
+        (
+            "DbGetDeviceList",
+            db.get_device_list,
+            [(random_server(), "BenchDevice") for _ in range(calls)],
+        ),
+        ("DbGetClassList", db.get_class_list, [("BenchDevice",)] * calls),
+        (
+            "DbGetDataForServerCache",
+            db.get_data_for_server_cache,
+            [(random_server(), "host") for _ in range(max(1, calls // 10))],
+        ),
+    ]
+
+    print("%-32s %8s %10s %10s %10s" % ("command", "calls", "avg(ms)", "p50", "p99"))
+    for name, func, args_list in benchmarks:
+        report(name, timeit(func, args_list))
+
+    db.close_db()
+    if tmp_dir is not None:
+        tmp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Reads of the sqlite3 backend of the DataBase device server served while
+a long write runs. The server runs its commands in the gevent event loop,
+which delegates the backend calls to threads: the reads overlap the write
+(see tango.databaseds.db_access.sqlite3.use_read_cursor). With --serial,
+the backend is called in the event loop, as before: no read is served
+until the write ends. Not collected by pytest, run it with::
+
+    python tests/benchmark_db_concurrency.py --devices 200000
+    python tests/benchmark_db_concurrency.py --devices 200000 --serial
+"""
+
+import os
+import sys
+import time
+import sqlite3
+import argparse
+import tempfile
+import statistics
+
+import gevent
+
+from tango import GreenMode
+from tango.green import get_executor
+from tango.device_server import set_worker
+from tango.databaseds.db_access.sqlite3 import Sqlite3Database
+
+
+def populate(db_name, n_devices):
+    """A server of *n_devices* devices to delete, and one device to read"""
+    devices = [
+        (f"bench/write/{d}", "bench", "write", str(d), "BenchServer/write")
+        for d in range(n_devices)
+    ]
+    devices.append(("bench/read/0", "bench", "read", "0", "BenchServer/read"))
+    conn = sqlite3.connect(db_name)
+    conn.executemany(
+        "INSERT INTO device (name, domain, family, member, exported, ior, host, "
+        "server, pid, class, version) VALUES (?, ?, ?, ?, 1, 'IOR:00', 'host', "
+        "?, 1, 'BenchDevice', '5')",
+        devices,
+    )
+    conn.commit()
+    conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=200000, help="deleted")
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--serial", action="store_true")
+    options = parser.parse_args(argv)
+
+    green_mode = GreenMode.Synchronous if options.serial else GreenMode.Gevent
+    set_worker(get_executor(green_mode))
+    tmp_dir = tempfile.TemporaryDirectory()
+    db_name = os.path.join(tmp_dir.name, "bench.db")
+    db = Sqlite3Database(db_name=db_name, fire_to_starter=False)
+    populate(db_name, options.devices)
+
+    latencies = []
+
+    def write():
+        start = time.perf_counter()
+        db.delete_server("BenchServer/write")
+        return time.perf_counter() - start
+
+    def read():
+        while not writer.ready():
+            start = time.perf_counter()
+            db.import_device("bench/read/0")
+            latencies.append(time.perf_counter() - start)
+            # let the other greenlets run
+            gevent.sleep(0)
+
+    writer = gevent.spawn(write)
+    readers = [gevent.spawn(read) for _ in range(options.readers)]
+    gevent.joinall([writer] + readers, raise_error=True)
+
+    mode = "serial" if options.serial else "concurrent"
+    print(f"{mode}: write of {options.devices} devices in {writer.value:.3f} s")
+    if latencies:
+        print(
+            f"{len(latencies)} reads served during the write, "
+            f"p50 {statistics.median(latencies) * 1000.0:.3f} ms, "
+            f"max {max(latencies) * 1000.0:.3f} ms"
+        )
+    else:
+        print("no read served during the write")
+
+    db.close_db()
+    tmp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""Time taken and memory used by ``import tango`` in a new interpreter,
+with the docstrings set at import time and set lazily (PYTANGO_LAZY_DOC),
+for a client (the server API is not loaded) and for a server (the server
+API is loaded on first use). Not collected by pytest, run it with::
+
+    python tests/benchmark_import.py --runs 20
+
+The baseline is the import as it was before the lazy loading: the
+server API loaded and the docstrings set at import time ("server", "eager
+doc"). The targets, checked at the end (the exit status is 1 if one is
+missed), are for a client import with lazy docstrings:
+
+- it loads none of the server modules (tests/test_import.py checks it);
+- its median time is at most 80 % of the baseline one (TIME_TARGET);
+- its median max RSS is at most 95 % of the baseline one (RSS_TARGET).
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+CODE = """\
+import json
+import time
+import resource
+start = time.perf_counter()
+import tango
+{access}
+duration = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps([duration, rss]))
+"""
+
+TIME_TARGET = 0.80
+RSS_TARGET = 0.95
+
+MODES = (("eager doc", "0"), ("lazy doc", "1"))
+# a method is called too: it must not set the docstrings
+APIS = (
+    ("client", "tango.DeviceProxy; tango.DeviceData().is_empty()"),
+    ("server", "tango.server; tango.DeviceData().is_empty()"),
+)
+
+
+def import_time(lazy_doc, access):
+    """Returns the import time (ms) and the max RSS (kB on Linux)"""
+    env = dict(os.environ, PYTANGO_LAZY_DOC=lazy_doc)
+    code = CODE.format(access=access)
+    output = subprocess.check_output(
+        [sys.executable, "-c", code], env=env, universal_newlines=True
+    )
+    duration, rss = json.loads(output.splitlines()[-1])
+    return duration * 1000.0, rss
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    options = parser.parse_args(argv)
+
+    # warm up the file system caches
+    import_time("1", APIS[-1][1])
+    print(
+        f"{'api':>8} {'mode':>10} {'runs':>6} {'min(ms)':>10} {'p50(ms)':>10} "
+        f"{'rss(kB)':>10}"
+    )
+    medians = {}
+    for api, access in APIS:
+        for name, lazy_doc in MODES:
+            results = [import_time(lazy_doc, access) for _ in range(options.runs)]
+            times = [duration for duration, _ in results]
+            rss = statistics.median(rss for _, rss in results)
+            medians[api, name] = statistics.median(times), rss
+            print(
+                f"{api:>8} {name:>10} {options.runs:>6} {min(times):>10.1f} "
+                f"{statistics.median(times):>10.1f} {rss:>10.0f}"
+            )
+
+    base_time, base_rss = medians["server", "eager doc"]
+    client_time, client_rss = medians["client", "lazy doc"]
+    met = True
+    for what, ratio, target in (
+        ("time", client_time / base_time, TIME_TARGET),
+        ("rss", client_rss / base_rss, RSS_TARGET),
+    ):
+        ok = ratio <= target
+        met &= ok
+        print(
+            f"client lazy doc {what}: {ratio:.0%} of the baseline "
+            f"(target <= {target:.0%}): {'ok' if ok else 'MISSED'}"
+        )
+    return 0 if met else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
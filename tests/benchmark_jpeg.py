@@ -0,0 +1,89 @@
+"""Throughput of the EncodedAttribute JPEG encoders per frame size and
+quality, encoding the frames on 1 thread and on a pool of threads (the GIL
+is released while encoding). Not collected by pytest, run it with::
+
+    python tests/benchmark_jpeg.py --frames 20 --workers 4
+"""
+
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from tango import EncodedAttribute
+
+SIZES = (512, 1024, 2048)
+QUALITIES = (50.0, 90.0, 100.0)
+
+
+def make_frames(size, nb_frames, rgb):
+    rnd = np.random.default_rng(0)
+    shape = (size, size, 4) if rgb else (size, size)
+    # smooth gradient plus noise: closer to a camera image than pure noise
+    gradient = np.add.outer(np.arange(size), np.arange(size)) % 256
+    if rgb:
+        gradient = gradient[..., np.newaxis]
+    frames = []
+    for _ in range(nb_frames):
+        noise = rnd.integers(0, 16, size=shape)
+        frame = ((gradient + noise) % 256).astype(np.uint8)
+        if rgb:
+            # one uint32 per pixel
+            frame = frame.view(np.uint32)[..., 0]
+        frames.append(frame)
+    return frames
+
+
+def encode(frame, quality, rgb):
+    enc = EncodedAttribute()
+    if rgb:
+        enc.encode_jpeg_rgb32(frame, quality=quality)
+    else:
+        enc.encode_jpeg_gray8(frame, quality=quality)
+    return enc
+
+
+def run(frames, quality, rgb, workers):
+    start = time.perf_counter()
+    if workers == 1:
+        for frame in frames:
+            encode(frame, quality, rgb)
+    else:
+        with ThreadPoolExecutor(workers) as pool:
+            list(pool.map(lambda frame: encode(frame, quality, rgb), frames))
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4)
+    options = parser.parse_args(argv)
+
+    print(
+        "%-6s %6s %8s %8s %12s %12s"
+        % ("image", "size", "quality", "workers", "frames/s", "Mpixel/s")
+    )
+    for rgb in (False, True):
+        for size in SIZES:
+            frames = make_frames(size, options.frames, rgb)
+            for quality in QUALITIES:
+                for workers in sorted({1, options.workers}):
+                    duration = run(frames, quality, rgb, workers)
+                    fps = len(frames) / duration
+                    print(
+                        "%-6s %6d %8.0f %8d %12.1f %12.1f"
+                        % (
+                            "rgb32" if rgb else "gray8",
+                            size,
+                            quality,
+                            workers,
+                            fps,
+                            fps * size * size / 1e6,
+                        )
+                    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Cost of reading a SPECTRUM attribute from a client: read_attribute,
+read_attribute_into a reused buffer, and keeping a history of the last
+values (a deque of the read arrays or an AttributeRingBuffer). Reports the
+time per read, the minor page faults per read and the peak RSS of the
+client (the device runs in another process). Not collected by pytest, run
+it with::
+
+    python tests/benchmark_read_into.py --reads 2000 --elements 65536
+"""
+
+import time
+import argparse
+import resource
+import collections
+
+import numpy as np
+
+from tango.server import Device, attribute
+from tango.test_context import DeviceTestContext
+from tango.utils import AttributeRingBuffer
+
+MAX_ELEMENTS = 1 << 22
+
+
+class BenchDevice(Device):
+    def init_device(self):
+        super().init_device()
+        self._spectrum = np.zeros(1)
+
+    @attribute(dtype=int)
+    def elements(self):
+        return len(self._spectrum)
+
+    @elements.write
+    def elements(self, elements):
+        self._spectrum = np.arange(elements, dtype=np.float64)
+
+    @attribute(dtype=(np.float64,), max_dim_x=MAX_ELEMENTS)
+    def spectrum(self):
+        return self._spectrum
+
+
+def measure(loop, reads):
+    """Run loop(reads) and return (ms per read, minor page faults per read,
+    peak RSS in MB)"""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    start = time.perf_counter()
+    loop(reads)
+    elapsed = time.perf_counter() - start
+    after = resource.getrusage(resource.RUSAGE_SELF)
+    faults = (after.ru_minflt - usage.ru_minflt) / reads
+    # ru_maxrss is in kB on linux
+    return elapsed * 1000.0 / reads, faults, after.ru_maxrss / 1e3
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reads", type=int, default=2000)
+    parser.add_argument("--elements", type=int, default=65536)
+    parser.add_argument("--history", type=int, default=100)
+    options = parser.parse_args(argv)
+    elements = options.elements
+
+    with DeviceTestContext(BenchDevice, process=True) as proxy:
+        proxy.elements = elements
+        buffer = np.empty(elements)
+        history = collections.deque(maxlen=options.history)
+        ring = AttributeRingBuffer(options.history, (elements,), np.float64)
+
+        def read(reads):
+            for _ in range(reads):
+                proxy.read_attribute("spectrum")
+
+        def read_into(reads):
+            for _ in range(reads):
+                proxy.read_attribute_into("spectrum", buffer)
+
+        def read_history(reads):
+            for _ in range(reads):
+                history.append(proxy.read_attribute("spectrum").value)
+
+        def read_ring(reads):
+            for _ in range(reads):
+                ring.read_attribute(proxy, "spectrum")
+
+        # warm up the connection
+        read(10)
+        # the peak RSS only grows: the loops keeping a history run last
+        print("%24s %12s %14s %10s" % ("", "read (ms)", "faults/read", "RSS (MB)"))
+        for name, loop in (
+            ("read_attribute", read),
+            ("read_attribute_into", read_into),
+            ("AttributeRingBuffer", read_ring),
+            ("deque of values", read_history),
+        ):
+            per_read, faults, rss = measure(loop, options.reads)
+            print("%24s %12.3f %14.1f %10.1f" % (name, per_read, faults, rss))
+
+
+if __name__ == "__main__":
+    main()
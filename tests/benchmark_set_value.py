@@ -0,0 +1,81 @@
+"""Cost of setting the value of an IMAGE attribute, with and without the
+zero copy mode, measured inside the device server (push_change_event
+calls) and from a client (read_attribute calls). Not collected by pytest,
+run it with::
+
+    python tests/benchmark_set_value.py --calls 50
+"""
+
+import time
+import argparse
+
+import numpy as np
+
+from tango import AttrWriteType
+from tango.server import Device, attribute, command
+from tango.test_context import DeviceTestContext
+
+SIZES = (256, 1024, 2048)
+
+
+class BenchDevice(Device):
+    def init_device(self):
+        super().init_device()
+        self._frame = np.zeros((1, 1), dtype=np.uint32)
+        self.set_change_event("frame", True, False)
+
+    @command(dtype_in=int)
+    def set_size(self, size):
+        self._frame = np.ones((size, size), dtype=np.uint32)
+
+    @command(dtype_in=int, dtype_out=float)
+    def time_push(self, calls):
+        """Return the time per push_change_event call in ms"""
+        start = time.perf_counter()
+        for _ in range(calls):
+            self.push_change_event("frame", self._frame)
+        return (time.perf_counter() - start) * 1000.0 / calls
+
+    @command(dtype_in=bool)
+    def set_zero_copy(self, zero_copy):
+        self.get_device_attr().get_attr_by_name("frame").set_zero_copy(zero_copy)
+
+    @attribute(
+        dtype=((np.uint32,),),
+        max_dim_x=4096,
+        max_dim_y=4096,
+        access=AttrWriteType.READ,
+    )
+    def frame(self):
+        return self._frame
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=50)
+    options = parser.parse_args(argv)
+    calls = options.calls
+
+    print(
+        "%6s %8s %10s %16s %16s" % ("size", "MB", "zero_copy", "push (ms)", "read (ms)")
+    )
+    with DeviceTestContext(BenchDevice, process=True) as proxy:
+        for size in SIZES:
+            proxy.set_size(size)
+            megabytes = size * size * 4 / 1e6
+            for zero_copy in (False, True):
+                proxy.set_zero_copy(zero_copy)
+                push = proxy.time_push(calls)
+                proxy.read_attribute("frame")
+                start = time.perf_counter()
+                for _ in range(calls):
+                    proxy.read_attribute("frame")
+                read = (time.perf_counter() - start) * 1000.0 / calls
+                print(
+                    "%6d %8.1f %10s %16.3f %16.3f"
+                    % (size, megabytes, zero_copy, push, read)
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,13 @@
 # Imports
+import asyncio
+import time
 from concurrent.futures import Future
 
 import pytest
 from numpy.testing import assert_array_equal
 
 import tango
+from tango.asyncio_executor import AsyncioExecutor
 from tango.server import Device, command
 from tango.test_utils import DeviceTestContext
 
@@ -58,3 +61,81 @@ def test_async_command_with_pushed_callback():
         proxy.command_inout_asynch("identity", 123, future.set_result)
         result = future.result(timeout=0.5)
         assert_array_equal(result.argout, 123)
+
+
+def test_asyncio_executor_bounded_pool_statistics():
+    loop = asyncio.new_event_loop()
+    executor = AsyncioExecutor(loop=loop, max_workers=2, max_queue=1)
+
+    async def run():
+        calls = [executor.delegate(time.sleep, 0.05) for _ in range(6)]
+        await asyncio.sleep(0.01)
+        pending = executor.get_statistics()
+        await asyncio.gather(*calls)
+        return pending, executor.get_statistics()
+
+    try:
+        pending, done = loop.run_until_complete(run())
+    finally:
+        loop.close()
+    assert pending["active"] == 2
+    assert pending["queued"] == 1
+    assert pending["waiting"] == 3
+    assert done["completed"] == 6
+    assert done["failed"] == 0
+
+
+def test_asyncio_executor_pool_is_resized():
+    loop = asyncio.new_event_loop()
+    executor = AsyncioExecutor(loop=loop, max_workers=2, max_queue=1)
+    previous = executor.subexecutor
+
+    async def run():
+        calls = [executor.delegate(time.sleep, 0.05) for _ in range(6)]
+        await asyncio.sleep(0.01)
+        pending = executor.get_statistics()
+        await asyncio.gather(*calls)
+        return pending
+
+    try:
+        executor.set_pool_size(max_workers=4, max_queue=2)
+        pending = loop.run_until_complete(run())
+    finally:
+        loop.close()
+    assert executor.subexecutor is not previous
+    assert pending["active"] == 4
+    assert pending["queued"] == 2
+    assert pending["waiting"] == 0
+
+
+def test_set_executor_pool_size(monkeypatch):
+    from tango import asyncio_executor
+
+    executor = AsyncioExecutor(loop=asyncio.new_event_loop())
+    monkeypatch.setattr(asyncio_executor, "_EXECUTOR", executor)
+    size = tango.get_executor_pool_size()
+    try:
+        tango.set_executor_pool_size(3, 5)
+        assert tango.get_executor_pool_size() == (3, 5)
+        assert executor.subexecutor._max_workers == 3
+        assert executor.max_pending == 8
+        with pytest.raises(ValueError):
+            tango.set_executor_pool_size(0)
+        with pytest.raises(ValueError):
+            tango.set_executor_pool_size(1, -1)
+    finally:
+        tango.set_executor_pool_size(*size)
+        executor.loop.close()
+
+
+def test_invalid_executor_pool_size_variables_are_ignored(monkeypatch):
+    from tango.green import _get_env_int
+
+    monkeypatch.setenv("PYTANGO_GREEN_MAX_WORKERS", "12")
+    assert _get_env_int("PYTANGO_GREEN_MAX_WORKERS", 1) == 12
+    monkeypatch.delenv("PYTANGO_GREEN_MAX_WORKERS")
+    assert _get_env_int("PYTANGO_GREEN_MAX_WORKERS", 1) is None
+    for value in ("twelve", "0"):
+        monkeypatch.setenv("PYTANGO_GREEN_MAX_WORKERS", value)
+        with pytest.warns(RuntimeWarning, match="PYTANGO_GREEN_MAX_WORKERS"):
+            assert _get_env_int("PYTANGO_GREEN_MAX_WORKERS", 1) is None
@@ -15,6 +15,9 @@ and is even likely to crash the device (!)
 
 import gc
 import weakref
+import threading
+
+from types import SimpleNamespace
 
 from distutils.spawn import find_executable
 from subprocess import Popen
@@ -22,7 +25,8 @@ from time import sleep
 
 import pytest
 from functools import partial
-from tango import DeviceProxy, DevFailed, GreenMode
+import tango.device_proxy
+from tango import Database, DeviceProxy, DevFailed, Except, GreenMode
 from tango import DeviceInfo, AttributeInfo, AttributeInfoEx, ExtractAs
 from tango.server import Device
 from tango.utils import is_str_type, is_int_type, is_float_type, is_bool_type
@@ -37,6 +41,7 @@ from tango.test_utils import (
 from tango.gevent import DeviceProxy as gevent_DeviceProxy
 from tango.futures import DeviceProxy as futures_DeviceProxy
 from tango.asyncio import DeviceProxy as asyncio_DeviceProxy
+from tango.green import get_object_executor
 
 # Asyncio imports
 try:
@@ -488,6 +493,299 @@ def test_dynamic_interface_unfreeze_generates_a_user_warning(tango_test):
         tango_test.unfreeze_dynamic_interface()
 
 
+def test_read_cache_serves_recent_values(tango_test):
+    assert tango_test.get_read_cache() is None
+    tango_test.set_read_cache(max_age=60)
+    assert tango_test.get_read_cache() == 60
+    tango_test.write_attribute("ampli", 1.5)
+    first = tango_test.read_attribute("ampli")
+    assert tango_test.read_attribute("ampli") is first
+    assert tango_test.ampli == 1.5
+    stats = tango_test.get_read_cache_stats(reset=True)
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+    tango_test.set_read_cache(None)
+
+
+def test_read_cache_is_invalidated_by_writes(tango_test):
+    tango_test.set_read_cache(max_age=60)
+    tango_test.write_attribute("ampli", 1.5)
+    assert tango_test.read_attribute("ampli").value == 1.5
+    tango_test.ampli = 2.5
+    assert tango_test.read_attribute("ampli").value == 2.5
+    tango_test.clear_read_cache()
+    assert tango_test.get_read_cache_stats()["size"] == 0
+    tango_test.set_read_cache(None)
+    assert tango_test.get_read_cache_stats() is None
+
+
+def test_read_batching_merges_asyncio_reads():
+    # the module level "attribute" name is a fixture
+    from tango.server import attribute
+
+    class TestDevice(Device):
+        hw_calls = 0
+
+        def read_attr_hardware(self, attr_list):
+            TestDevice.hw_calls += 1
+
+        @attribute(dtype=int)
+        def attr1(self):
+            return 1
+
+        @attribute(dtype=int)
+        def attr2(self):
+            return 2
+
+        @attribute(dtype=int)
+        def hw_calls_attr(self):
+            return TestDevice.hw_calls
+
+    context = DeviceTestContext(TestDevice, host="127.0.0.1")
+    with context:
+        proxy = asyncio_DeviceProxy(context.get_device_access(), wait=True)
+        loop = get_object_executor(proxy).loop
+        proxy.set_read_batching()
+        assert proxy.get_read_batching() == 0
+        before = context.device.hw_calls_attr
+
+        async def read(*names):
+            reads = [proxy.read_attribute(name) for name in names]
+            return await asyncio.gather(*reads, return_exceptions=True)
+
+        results = loop.run_until_complete(read("attr1", "attr2", "attr1"))
+        assert [result.value for result in results] == [1, 2, 1]
+        # one call for the three reads, one for reading hw_calls_attr
+        assert context.device.hw_calls_attr == before + 2
+
+        results = loop.run_until_complete(read("attr1", "no_such_attr"))
+        assert results[0].value == 1
+        assert isinstance(results[1], DevFailed)
+
+        # reads given a timeout are not batched
+        async def read_with_timeout(*names):
+            reads = [proxy.read_attribute(name, timeout=3) for name in names]
+            return await asyncio.gather(*reads)
+
+        before = context.device.hw_calls_attr
+        results = loop.run_until_complete(read_with_timeout("attr1", "attr2"))
+        assert [result.value for result in results] == [1, 2]
+        assert context.device.hw_calls_attr == before + 3
+
+
+def test_unknown_names_are_not_looked_up_again(simple_device_fqdn):
+    # forget the names looked up by the proxies of the previous tests
+    tango.device_proxy._INTERFACE_REGISTRY.clear()
+    proxy = DeviceProxy(simple_device_fqdn)
+    calls = []
+    command_list_query = proxy.command_list_query
+
+    def counting_command_list_query():
+        calls.append(None)
+        return command_list_query()
+
+    proxy.__dict__["command_list_query"] = counting_command_list_query
+    assert not hasattr(proxy, "no_such_name")
+    assert not hasattr(proxy, "No_Such_Name")
+    with pytest.raises(AttributeError, match="no_such_name"):
+        proxy.no_such_name = 1
+    assert len(calls) == 1
+
+
+def test_interface_is_shared_between_proxies(simple_device_fqdn):
+    proxy = DeviceProxy(simple_device_fqdn)
+    other_proxy = DeviceProxy(simple_device_fqdn)
+    assert proxy.State() == other_proxy.State()
+    calls = []
+    command_list_query = other_proxy.command_list_query
+
+    def counting_command_list_query():
+        calls.append(None)
+        return command_list_query()
+
+    other_proxy.__dict__["command_list_query"] = counting_command_list_query
+    assert other_proxy.State() == proxy.State()
+    assert callable(other_proxy.Status)
+    assert calls == []
+
+
+def wait_interface_change_subscriptions():
+    for thread in threading.enumerate():
+        if thread.name == "InterfaceChangeSubscriber":
+            thread.join()
+
+
+def test_interface_change_subscription_is_shared(simple_device_fqdn):
+    tango.device_proxy._INTERFACE_REGISTRY.clear()
+    proxy = DeviceProxy(simple_device_fqdn)
+    other_proxy = DeviceProxy(simple_device_fqdn)
+    assert not hasattr(proxy, "no_such_name")
+    wait_interface_change_subscriptions()
+    interface = proxy.__dict__["_interface"]
+    assert other_proxy.__dict__["_interface"] in (None, interface)
+    watcher = interface.watcher
+    if watcher is False:
+        pytest.skip("the device has no event support")
+    assert watcher() is proxy
+    assert not hasattr(other_proxy, "other_name")
+    assert interface.watcher is watcher
+    del proxy
+    gc.collect()
+    assert interface.watcher is None
+    assert not interface.unknown_names
+    assert not hasattr(other_proxy, "other_name")
+    assert interface.watcher() is other_proxy
+
+
+def test_interface_change_subscription_is_made_in_background(
+    simple_device_fqdn, monkeypatch
+):
+    tango.device_proxy._INTERFACE_REGISTRY.clear()
+    name = "__DeviceProxy__subscribe_event_global"
+    subscribing = threading.Event()
+    release = threading.Event()
+
+    def slow_subscribe(*args, **kwargs):
+        subscribing.set()
+        release.wait()
+        raise RuntimeError("no event support")
+
+    monkeypatch.setattr(tango.device_proxy, name, slow_subscribe)
+    proxy = DeviceProxy(simple_device_fqdn)
+    with pytest.raises(AttributeError):
+        proxy.no_such_name = 1
+    # the lookup did not wait for the subscription
+    assert subscribing.wait(5)
+    interface = proxy.__dict__["_interface"]
+    assert interface.watcher() is proxy
+    release.set()
+    wait_interface_change_subscriptions()
+    # the subscription failed: the unknown names expire instead
+    assert interface.watcher is False
+
+
+def test_asyncio_ami_requests():
+    # the module level "attribute" name is a fixture
+    from tango.server import attribute, command
+
+    class TestDevice(Device):
+        _value = 0.0
+
+        @attribute(dtype=float)
+        def value(self):
+            return self._value
+
+        @value.write
+        def value(self, value):
+            self._value = value
+
+        @command(dtype_in=float, dtype_out=float)
+        def identity(self, arg):
+            return arg
+
+    api_util = tango.ApiUtil.instance()
+    api_util.set_asynch_cb_sub_model(tango.cb_sub_model.PULL_CALLBACK)
+    context = DeviceTestContext(TestDevice, host="127.0.0.1")
+    with context:
+        loop = asyncio.get_event_loop()
+        proxy = asyncio_DeviceProxy(
+            context.get_device_access(), wait=True, asyncio_ami=True
+        )
+        assert proxy.is_asyncio_ami()
+        push_callback = tango.cb_sub_model.PUSH_CALLBACK
+        assert api_util.get_asynch_cb_sub_model() == push_callback
+
+        async def run():
+            await proxy.write_attribute("value", 1.5)
+            value, result = await asyncio.gather(
+                proxy.read_attribute("value"), proxy.command_inout("identity", 2.5)
+            )
+            with pytest.raises(DevFailed):
+                await proxy.read_attribute("no_such_attr")
+            return value.value, result
+
+        assert loop.run_until_complete(run()) == (1.5, 2.5)
+
+        other_proxy = asyncio_DeviceProxy(
+            context.get_device_access(), wait=True, asyncio_ami=True
+        )
+        proxy.set_asyncio_ami(False)
+        assert not proxy.is_asyncio_ami()
+        assert api_util.get_asynch_cb_sub_model() == push_callback
+        del other_proxy
+        gc.collect()
+        pull_callback = tango.cb_sub_model.PULL_CALLBACK
+        assert api_util.get_asynch_cb_sub_model() == pull_callback
+
+
+class DatabaseStub:
+    """Replies like a database server, with or without the
+    DbGetDevicePropertyBulk command"""
+
+    get_device_property_bulk = Database.get_device_property_bulk
+
+    def __init__(self, props, error_reason=None):
+        self.props = props
+        self.error_reason = error_reason
+        self.commands = []
+
+    def command_inout(self, name, argin):
+        self.commands.append(name)
+        if self.error_reason is not None:
+            Except.throw_exception(self.error_reason, "stub", "DatabaseStub")
+        nb_dev = int(argin[0])
+        dev_names, prop_names = argin[1 : nb_dev + 1], argin[nb_dev + 1 :]
+        reply = []
+        for dev_name in dev_names:
+            props = self._get_props(dev_name, prop_names)
+            reply += [dev_name, str(len(props))]
+            for name, values in props.items():
+                reply += [name, str(len(values))] + values
+        return reply
+
+    def get_device_property_list(self, dev_name, wildcard):
+        self.commands.append("DbGetDevicePropertyList")
+        return SimpleNamespace(value_string=list(self.props.get(dev_name, {})))
+
+    def get_device_property(self, dev_name, names):
+        self.commands.append("DbGetDeviceProperty")
+        return self._get_props(dev_name, names)
+
+    def _get_props(self, dev_name, names):
+        props = self.props.get(dev_name, {})
+        if not names:
+            return dict(props)
+        return {name: props.get(name, []) for name in names}
+
+
+@pytest.mark.parametrize("error_reason", [None, "API_CommandNotFound"])
+def test_get_device_property_bulk(error_reason):
+    props = {"a/b/c": {"p1": ["1", "2"], "p2": ["3"]}, "a/b/d": {"p2": ["4"]}}
+    db = DatabaseStub(props, error_reason)
+    assert db.get_device_property_bulk(["a/b/c", "a/b/d", "a/b/e"]) == {
+        "a/b/c": {"p1": ["1", "2"], "p2": ["3"]},
+        "a/b/d": {"p2": ["4"]},
+        "a/b/e": {},
+    }
+    assert db.get_device_property_bulk(["a/b/c", "a/b/d"], "p2") == {
+        "a/b/c": {"p2": ["3"]},
+        "a/b/d": {"p2": ["4"]},
+    }
+    if error_reason is None:
+        assert db.commands == ["DbGetDevicePropertyBulk"] * 2
+    else:
+        # one call per device without the bulk command
+        assert db.commands.count("DbGetDeviceProperty") == 5
+
+
+def test_get_device_property_bulk_raises_other_errors():
+    db = DatabaseStub({}, "DB_SQLError")
+    with pytest.raises(DevFailed):
+        db.get_device_property_bulk(["a/b/c"])
+    assert db.commands == ["DbGetDevicePropertyBulk"]
+
+
 def test_read_attribute_config(tango_test, attribute):
     tango_test.get_attribute_config(attribute)
 
@@ -0,0 +1,636 @@
+"""Tests of the sqlite3 backend of the Python DataBase device server"""
+
+import logging
+import sqlite3
+import threading
+import collections
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tango import GreenMode
+from tango.databaseds.database import (
+    DataBase,
+    DbCache,
+    LatencyHistogram,
+    TimeStructure,
+)
+from tango.databaseds.db_access import sqlite3 as sqlite3_backend
+from tango.databaseds.db_access.sqlite3 import SqlDatabase, get_create_db_statements
+
+
+DATE = "2024-01-01 00:00:00"
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = SqlDatabase(str(tmp_path / "tango_database.db"), fire_to_starter=False)
+    yield database
+    database.close_db()
+
+
+class StubDataBase:
+    """What the commands of the DataBase device need to run on a backend,
+    without a device server"""
+
+    def __init__(self, db):
+        self.db = db
+        self._log = logging.getLogger("DataBase")
+        self.warn_stream = self._log.warning
+        self.info_stream = self._log.info
+        self.timing_maps = collections.defaultdict(TimeStructure)
+        self.cache = DbCache()
+
+    def __getattr__(self, name):
+        return getattr(DataBase, name).__get__(self)
+
+
+@pytest.fixture
+def device(db):
+    return StubDataBase(db)
+
+
+def insert(db, table, **values):
+    """Insert a row in the database file of *db*, outside of the backend
+    (most of its put_* methods use MySQL only syntax)"""
+    if table != "device" and table != "event":
+        values.setdefault("updated", DATE)
+        values.setdefault("accessed", DATE)
+    columns = ",".join(values)
+    placeholders = ",".join("?" * len(values))
+    conn = sqlite3.connect(db.db_name)
+    try:
+        with conn:
+            conn.execute(
+                f"INSERT INTO {table} ({columns}) VALUES ({placeholders})",
+                tuple(values.values()),
+            )
+    finally:
+        conn.close()
+
+
+def insert_property(db, table, obj_column, obj_name, name, *values, **columns):
+    for count, value in enumerate(values, 1):
+        columns.update({obj_column: obj_name, "name": name})
+        insert(db, table, count=count, value=value, **columns)
+
+
+def parse_properties(data, idx):
+    """Parse a DbGet*Property reply block, return the object name, the
+    properties and the index of the next block"""
+    obj_name, nb_props = data[idx], int(data[idx + 1])
+    idx += 2
+    props = {}
+    for _ in range(nb_props):
+        name, nb_values = data[idx], int(data[idx + 1])
+        props[name] = data[idx + 2 : idx + 2 + nb_values]
+        idx += 2 + nb_values
+    return obj_name, props, idx
+
+
+def parse_attribute_properties(data, idx):
+    obj_name, nb_attrs = data[idx], int(data[idx + 1])
+    idx += 2
+    attrs = {}
+    for _ in range(nb_attrs):
+        attr_name, props, idx = parse_properties(data, idx)
+        attrs[attr_name] = props
+    return obj_name, attrs, idx
+
+
+def parse_import_info(data, idx):
+    if data[idx + 1] == "Not Found":
+        return data[idx : idx + 2], idx + 2
+    return data[idx : idx + 8], idx + 8
+
+
+def parse_server_cache(data):
+    """Parse a DbGetDataForServerCache reply in the order used by the
+    DbServerCache of cppTango"""
+    cache = {"admin": data[0:8]}
+    if data[9] == "Not Found":
+        cache["notifd"], idx = data[8:10], 10
+    else:
+        cache["notifd"], idx = data[8:14], 14
+    for block in ("DServer", "Default", "admin_props"):
+        obj_name, props, idx = parse_properties(data, idx)
+        cache[block] = (obj_name, props)
+    nb_classes = int(data[idx + 1])
+    cache["server"] = data[idx]
+    class_names = data[idx + 2 : idx + 2 + nb_classes]
+    idx += 2 + nb_classes
+    cache["classes"] = {}
+    for class_name in class_names:
+        klass = cache["classes"][class_name] = {}
+        name, klass["props"], idx = parse_properties(data, idx)
+        assert name == class_name
+        name, klass["attr_props"], idx = parse_attribute_properties(data, idx)
+        assert name == class_name
+        assert data[idx] == class_name
+        nb_devices = int(data[idx + 1])
+        dev_names = data[idx + 2 : idx + 2 + nb_devices]
+        idx += 2 + nb_devices
+        klass["devices"] = {}
+        for dev_name in dev_names:
+            device = klass["devices"][dev_name] = {}
+            name, device["props"], idx = parse_properties(data, idx)
+            assert name == dev_name
+            name, device["attr_props"], idx = parse_attribute_properties(data, idx)
+            assert name == dev_name
+    obj_name, props, idx = parse_properties(data, idx)
+    cache["CtrlSystem"] = (obj_name, props)
+    cache["tac"], idx = parse_import_info(data, idx)
+    assert idx == len(data)
+    return cache
+
+
+def test_get_data_for_server_cache(db):
+    insert(
+        db,
+        "device",
+        name="sys/tg_test/2",
+        domain="sys",
+        family="tg_test",
+        member="2",
+        server="TangoTest/test",
+        host="host",
+        **{"class": "TangoTest"},
+    )
+    insert_property(db, "property_class", "class", "DServer", "polling", "1")
+    insert_property(db, "property", "object", "Default", "timeout", "3000")
+    insert_property(db, "property", "object", "CtrlSystem", "Services", "a", "b")
+    insert_property(
+        db, "property_device", "device", "dserver/TangoTest/test", "logging", "on"
+    )
+    insert_property(db, "property_class", "class", "TangoTest", "cprop", "x", "y")
+    insert_property(
+        db,
+        "property_attribute_class",
+        "class",
+        "TangoTest",
+        "unit",
+        "mm",
+        attribute="ampli",
+    )
+    insert_property(db, "property_device", "device", "sys/tg_test/1", "dprop", "1")
+    insert_property(
+        db,
+        "property_attribute_device",
+        "device",
+        "sys/tg_test/2",
+        "format",
+        "%6.2f",
+        attribute="double_scalar",
+    )
+
+    data = db.get_data_for_server_cache("TangoTest/test", "host")
+    assert all(isinstance(value, str) for value in data)
+    assert "None" not in data
+    cache = parse_server_cache(data)
+
+    admin = cache["admin"]
+    assert admin[0] == "dserver/TangoTest/test"
+    assert admin[3] == "TangoTest/test"
+    assert admin[7] == "DServer"
+    assert cache["notifd"] == ["notifd/factory/host", "Not Found"]
+    assert cache["DServer"][0] == "DServer"
+    assert cache["DServer"][1]["polling"] == ["1"]
+    assert cache["Default"] == ("Default", {"timeout": ["3000"]})
+    assert cache["admin_props"] == ("dserver/TangoTest/test", {"logging": ["on"]})
+    assert cache["server"] == "TangoTest/test"
+    assert list(cache["classes"]) == ["TangoTest"]
+    klass = cache["classes"]["TangoTest"]
+    assert klass["props"] == {"cprop": ["x", "y"]}
+    assert klass["attr_props"] == {"ampli": {"unit": ["mm"]}}
+    assert klass["devices"] == {
+        "sys/tg_test/1": {"props": {"dprop": ["1"]}, "attr_props": {}},
+        "sys/tg_test/2": {
+            "props": {},
+            "attr_props": {"double_scalar": {"format": ["%6.2f"]}},
+        },
+    }
+    assert cache["CtrlSystem"] == ("CtrlSystem", {"Services": ["a", "b"]})
+    assert cache["tac"] == ["", "Not Found"]
+
+
+def test_get_data_for_server_cache_import_info(db):
+    insert(
+        db,
+        "event",
+        name="notifd/factory/host",
+        ior="IOR:01",
+        version="4",
+        host="host",
+        exported=None,
+        pid=12,
+    )
+    insert(
+        db,
+        "device",
+        name="dserver/Empty/1",
+        domain="dserver",
+        family="Empty",
+        member="1",
+        server="Empty/1",
+        host="host",
+        exported=1,
+        ior=None,
+        pid=None,
+        version="6",
+        **{"class": "DServer"},
+    )
+    insert_property(
+        db,
+        "property",
+        "object",
+        "CtrlSystem",
+        "Services",
+        "AccessControl/tango:sys/access_control/1",
+    )
+
+    cache = parse_server_cache(db.get_data_for_server_cache("Empty/1", "host"))
+    assert cache["admin"] == [
+        "dserver/Empty/1",
+        "",
+        "6",
+        "Empty/1",
+        "host",
+        "1",
+        "",
+        "DServer",
+    ]
+    assert cache["notifd"] == [
+        "notifd/factory/host",
+        "IOR:01",
+        "4",
+        "host",
+        "-1",
+        "12",
+    ]
+    assert cache["classes"] == {}
+    assert cache["tac"][0] == "sys/access_control/1"
+    assert cache["tac"][3] == "TangoAccessControl/1"
+    assert cache["tac"][7] == "TangoAccessControl"
+
+
+def test_get_data_for_server_cache_unknown_server(db):
+    from tango import DevFailed
+
+    with pytest.raises(DevFailed):
+        db.get_data_for_server_cache("Unknown/1", "host")
+
+
+def test_db_cache():
+    cache = DbCache()
+    calls = []
+
+    def get(namespace, obj, key):
+        return cache.get(namespace, obj, key, lambda: calls.append(key) or len(calls))
+
+    assert get("DbGetDeviceProperty", "a/b/c", "x") == 1
+    assert get("DbGetDeviceProperty", "A/B/C", "x") == 1
+    assert get("DbGetDeviceProperty", "a/b/c", "y") == 2
+    assert get("DbGetDeviceProperty", "d/e/f", "x") == 3
+    assert get("DbGetClassProperty", "a/b/c", "x") == 4
+    stats = cache.stats["DbGetDeviceProperty"]
+    assert (stats.hits, stats.misses) == (1, 3)
+    assert len(cache) == 4
+
+    # only the replies for that object in that namespace are dropped
+    cache.invalidate("DbGetDeviceProperty", "A/b/C")
+    assert len(cache) == 2
+    assert get("DbGetDeviceProperty", "d/e/f", "x") == 3
+    assert get("DbGetClassProperty", "a/b/c", "x") == 4
+    assert get("DbGetDeviceProperty", "a/b/c", "x") == 5
+
+    cache.invalidate("DbGetDeviceProperty")
+    assert len(cache) == 1
+    assert get("DbGetClassProperty", "a/b/c", "x") == 4
+
+    cache.reset_stats()
+    assert (stats.hits, stats.misses) == (0, 0)
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_db_cache_invalidate_device_drops_aliases():
+    cache = DbCache()
+    for obj in ("a/b/c", "alias", "d/e/f"):
+        cache.get("DbImportDevice", obj, obj, lambda: obj)
+    cache.invalidate_device("DbImportDevice", "a/b/c")
+    assert len(cache) == 1
+    assert cache.get("DbImportDevice", "d/e/f", "d/e/f", lambda: None) == "d/e/f"
+
+
+def test_db_cache_size_and_ttl():
+    cache = DbCache(max_size=2)
+    for obj in ("a", "b", "a", "c"):
+        cache.get("DbImportDevice", obj, obj, lambda: obj)
+    # "b" was the least recently used reply
+    assert len(cache) == 2
+    assert cache.get("DbImportDevice", "b", "b", lambda: None) is None
+    assert cache.get("DbImportDevice", "c", "c", lambda: None) == "c"
+
+    cache = DbCache(ttl=0)
+    cache.get("DbImportDevice", "a", "a", lambda: 1)
+    assert cache.get("DbImportDevice", "a", "a", lambda: 2) == 2
+
+    cache = DbCache(max_size=0)
+    cache.get("DbImportDevice", "a", "a", lambda: 1)
+    assert len(cache) == 0
+
+
+def test_db_cache_drops_replies_read_before_an_invalidation():
+    cache = DbCache()
+
+    def read():
+        # a write of another command invalidates the reply meanwhile
+        cache.invalidate("DbImportDevice", "a/b/c")
+        return "stale"
+
+    assert cache.get("DbImportDevice", "a/b/c", "a/b/c", read) == "stale"
+    assert len(cache) == 0
+    assert cache.get("DbImportDevice", "a/b/c", "a/b/c", lambda: "new") == "new"
+    assert len(cache) == 1
+
+
+def test_gevent_event_loop_calls_run_in_threads(db, monkeypatch):
+    threads = []
+
+    class GeventWorker:
+        green_mode = GreenMode.Gevent
+
+        def run(self, fn, args=(), kwargs={}, wait=None, timeout=None):
+            with ThreadPoolExecutor(1) as pool:
+                threads.append(pool.submit(threading.get_ident).result())
+                return pool.submit(fn, *args).result()
+
+    insert(
+        db,
+        "device",
+        name="test/gevent/1",
+        domain="test",
+        family="gevent",
+        member="1",
+        server="GeventTest/test",
+        **{"class": "GeventTest"},
+    )
+    monkeypatch.setattr(sqlite3_backend, "get_worker", GeventWorker)
+    db.export_device("test/gevent/1", "IOR:01", "host", "12", "6")
+    assert db.import_device("test/gevent/1")[0] == [1, 12]
+    # one thread for the write, one for the read
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
+
+
+def test_import_device_cache_invalidation(device):
+    insert(
+        device.db,
+        "device",
+        name="sys/tg_test/2",
+        alias="tg2",
+        domain="sys",
+        family="tg_test",
+        member="2",
+        server="TangoTest/test",
+        **{"class": "TangoTest"},
+    )
+    assert device.DbImportDevice("sys/tg_test/2")[0] == [0, 0]
+    assert device.DbImportDevice("tg2")[0] == [0, 0]
+
+    # the export drops the replies for the device and for the aliases
+    device.DbExportDevice(["sys/tg_test/2", "IOR:01", "host", "12", "6"])
+    assert device.DbImportDevice("sys/tg_test/2")[0] == [1, 12]
+    assert device.DbImportDevice("tg2")[0] == [1, 12]
+    stats = device.cache.stats["DbImportDevice"]
+    assert (stats.hits, stats.misses) == (0, 4)
+    device.DbImportDevice("sys/tg_test/2")
+    assert stats.hits == 1
+
+    # adding the device again (not exported) drops the replies for its alias
+    device.DbAddDevice(["TangoTest/test", "sys/tg_test/2", "TangoTest", "tg2"])
+    assert device.DbImportDevice("tg2")[0] == [0, 0]
+
+
+def test_device_property_cache_invalidation(device, monkeypatch):
+    db = device.db
+
+    def put_device_property(device_name, nb_properties, props):
+        # the put methods of the sqlite3 backend use MySQL only syntax
+        name, nb_values = props[0], int(props[1])
+        values = props[2 : 2 + nb_values]
+        insert_property(db, "property_device", "device", device_name, name, *values)
+
+    monkeypatch.setattr(db, "put_device_property", put_device_property)
+    insert_property(db, "property_device", "device", "sys/tg_test/1", "a", "1")
+    insert_property(db, "property_class", "class", "TangoTest", "a", "1")
+    get_device_property = ["sys/tg_test/1", "a", "b"]
+    get_class_property = ["TangoTest", "a"]
+    assert device.DbGetDeviceProperty(get_device_property)[-3:] == ["1", "b", "0"]
+    assert device.DbGetClassProperty(get_class_property)[-1] == "1"
+
+    # only the replies for that device are dropped
+    device.DbPutDeviceProperty(["sys/tg_test/1", "1", "b", "1", "2"])
+    assert device.DbGetDeviceProperty(get_device_property)[-1] == "2"
+    device.DbGetClassProperty(get_class_property)
+    assert device.cache.stats["DbGetClassProperty"].hits == 1
+
+    device.DbDeleteDevice("sys/tg_test/1")
+    assert device.DbGetDeviceProperty(get_device_property)[3] == "0"
+
+
+def test_reset_cache(device):
+    get_device_property = ["sys/tg_test/1", "a"]
+    assert device.DbGetDeviceProperty(get_device_property)[-1] == "0"
+    # written by another process: the cached reply is still served
+    insert_property(device.db, "property_device", "device", "sys/tg_test/1", "a", "1")
+    assert device.DbGetDeviceProperty(get_device_property)[-1] == "0"
+    device.ResetCache()
+    assert device.DbGetDeviceProperty(get_device_property)[-1] == "1"
+
+
+def test_latency_histogram_buckets():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) == 0
+    assert histogram.buckets() == []
+
+    # small values have their own bucket
+    for value in range(64):
+        histogram.record(value)
+    assert histogram.buckets() == [(value, 1) for value in range(64)]
+
+    # above, every value is in a bucket whose upper value is at most 1/32 more
+    previous = 63
+    for idx in range(64, 2000):
+        upper = histogram.bucket_upper_value(idx)
+        assert upper > previous
+        previous = upper
+    for value in (64, 65, 100, 1000, 12345, 10**6, 10**9 + 7, 2**40 - 1):
+        histogram.reset()
+        histogram.record(value)
+        ((upper, count),) = histogram.buckets()
+        assert count == 1
+        assert value <= upper <= value * (1 + 1 / 32)
+
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for value in range(1, 1001):
+        histogram.record(value * 1000)
+    for percent, expected in ((50, 500000), (90, 900000), (99, 990000)):
+        value = histogram.percentile(percent)
+        assert expected <= value <= expected * (1 + 1 / 32)
+    assert histogram.percentile(100) >= 1000000
+    assert histogram.percentile(0) <= 1000 * (1 + 1 / 32)
+
+    histogram.reset()
+    assert histogram.total == 0
+    assert histogram.percentile(99.9) == 0
+
+
+def test_timing_histograms(device):
+    for _ in range(10):
+        device.DbGetDeviceProperty(["sys/tg_test/1", "a"])
+    timing = device.timing_maps["DbGetDeviceProperty"]
+    assert timing.calls == 10
+    assert timing.histogram.total == 10
+    assert timing.histogram.percentile(50) / 1e6 <= timing.maximum * (1 + 1 / 32)
+
+    (line,) = device.DumpTimingHistograms()
+    name, buckets = line.split("\t")
+    assert name == "DbGetDeviceProperty"
+    assert sum(int(bucket.split(":")[1]) for bucket in buckets.split()) == 10
+
+    device.ResetTimingValues()
+    assert timing.calls == 0
+    assert timing.histogram.total == 0
+    assert device.DumpTimingHistograms() == []
+    assert device.cache.stats["DbGetDeviceProperty"].hits == 0
+
+
+@pytest.fixture
+def old_db(tmp_path):
+    """A database created with the schema of the versions which compared
+    the names with LIKE: case sensitive columns and no indexes"""
+    db_name = str(tmp_path / "old_tango_database.db")
+    conn = sqlite3.connect(db_name)
+    try:
+        with conn:
+            for statement in get_create_db_statements():
+                if not statement.strip().startswith("CREATE INDEX"):
+                    conn.execute(statement.replace(" COLLATE NOCASE", ""))
+            conn.execute(
+                "INSERT INTO device (name, domain, family, member, server, class) "
+                "VALUES ('Sys/TG_Test/2', 'Sys', 'TG_Test', '2', 'TangoTest/Test2', "
+                "'TangoTest')"
+            )
+    finally:
+        conn.close()
+    return db_name
+
+
+def test_names_are_case_insensitive(db):
+    db.export_device("SYS/TG_TEST/1", "IOR:01", "host", "12", "6")
+    assert db.import_device("sys/tg_test/1")[0] == [1, 12]
+    assert db.get_device_list("tangotest/TEST", "%") == [
+        "dserver/TangoTest/test",
+        "sys/tg_test/1",
+    ]
+    assert db.get_device_list("tangotest/test", "TANGOTEST") == ["sys/tg_test/1"]
+
+    insert_property(db, "property_device", "device", "SYS/TG_TEST/1", "a", "1")
+    cache = parse_server_cache(db.get_data_for_server_cache("TANGOTEST/test", "host"))
+    devices = cache["classes"]["TangoTest"]["devices"]
+    assert devices["sys/tg_test/1"]["props"] == {"a": ["1"]}
+
+
+def test_upgrade_old_database(old_db):
+    database = SqlDatabase(old_db, fire_to_starter=False)
+    try:
+        database.export_device("sys/tg_test/2", "IOR:01", "host", "12", "6")
+        assert database.import_device("SYS/tg_test/2")[0] == [1, 12]
+        assert database.get_device_list("tangotest/test", "%") == [
+            "dserver/TangoTest/test",
+            "sys/tg_test/1",
+        ]
+        assert database.get_device_list("tangotest/test2", "tangotest") == [
+            "Sys/TG_Test/2"
+        ]
+    finally:
+        database.close_db()
+
+    conn = sqlite3.connect(old_db)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM device").fetchone()[0] == 9
+        tables = [
+            row[0]
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        ]
+        assert not [table for table in tables if table.startswith("old_")]
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT server FROM device WHERE name = ?",
+            ("sys/tg_test/2",),
+        ).fetchall()
+        assert "device_name" in str(plan)
+    finally:
+        conn.close()
+
+
+def parse_device_properties(data):
+    """Parse a DbGetDevicePropertyBulk reply"""
+    result = {}
+    idx = 0
+    while idx < len(data):
+        dev_name, props, idx = parse_properties(data, idx)
+        result[dev_name] = props
+    return result
+
+
+def test_get_device_property_bulk(device, monkeypatch):
+    connect_reader = device.db._connect_reader
+
+    def connect_reader_with_old_limit():
+        conn = connect_reader()
+        if hasattr(conn, "setlimit"):
+            # the bound parameter limit of the sqlite versions before 3.32
+            conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+        return conn
+
+    monkeypatch.setattr(device.db, "_connect_reader", connect_reader_with_old_limit)
+    insert_property(
+        device.db, "property_device", "device", "sys/tg_test/1", "a", "1", "2"
+    )
+    insert_property(device.db, "property_device", "device", "sys/tg_test/1", "b", "3")
+    insert_property(device.db, "property_device", "device", "sys/tg_test/2", "B", "4")
+
+    dev_names = ["sys/tg_test/1", "SYS/TG_TEST/2", "sys/tg_test/3"]
+    reply = device.DbGetDevicePropertyBulk(["3"] + dev_names)
+    assert parse_device_properties(reply) == {
+        "sys/tg_test/1": {"a": ["1", "2"], "b": ["3"]},
+        "SYS/TG_TEST/2": {"B": ["4"]},
+        "sys/tg_test/3": {},
+    }
+    reply = device.DbGetDevicePropertyBulk(["2"] + dev_names[:2] + ["b", "c"])
+    assert parse_device_properties(reply) == {
+        "sys/tg_test/1": {"b": ["3"], "c": []},
+        "SYS/TG_TEST/2": {"b": ["4"], "c": []},
+    }
+
+    # more names than bound parameters allowed in a query
+    dev_names = [f"sys/tg_test/{idx}" for idx in range(1, 601)]
+    prop_names = ["a"] + [f"prop{idx}" for idx in range(600)]
+    argin = [str(len(dev_names))] + dev_names + prop_names
+    result = parse_device_properties(device.DbGetDevicePropertyBulk(argin))
+    assert list(result) == dev_names
+    assert result["sys/tg_test/1"]["a"] == ["1", "2"]
+    assert result["sys/tg_test/1"]["prop0"] == []
+    assert len(result["sys/tg_test/600"]) == len(prop_names)
+
+
+def test_get_device_property_bulk_wrong_arguments(device):
+    from tango import DevFailed
+
+    with pytest.raises(DevFailed):
+        device.DbGetDevicePropertyBulk(["3", "sys/tg_test/1"])
+    with pytest.raises(DevFailed):
+        device.DbGetDevicePropertyBulk([])
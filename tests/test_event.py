@@ -4,8 +4,10 @@ import time
 from functools import partial
 from threading import Thread
 
+import numpy as np
 import pytest
 from io import StringIO
+from numpy.testing import assert_array_equal
 
 from tango import (
     EventType,
@@ -18,7 +20,7 @@ from tango import (
 from tango.server import Device
 from tango.server import command, attribute
 from tango.test_utils import DeviceTestContext
-from tango.utils import EventCallback
+from tango.utils import EventCallback, AttributeRingBuffer
 
 from tango.gevent import DeviceProxy as gevent_DeviceProxy
 from tango.futures import DeviceProxy as futures_DeviceProxy
@@ -44,15 +46,30 @@ class EventDevice(Device):
     def init_device(self):
         self.set_change_event("attr", True, False)
         self.set_data_ready_event("attr", True)
+        self.set_change_event("spectrum", True, False)
 
     @attribute
     def attr(self):
         return 0.0
 
+    @attribute(dtype=(float,), max_dim_x=8)
+    def spectrum(self):
+        return np.zeros(8)
+
     @command
     def send_change_event(self):
         self.push_change_event("attr", 1.0)
 
+    @command
+    def send_change_events(self):
+        for value in (1.0, 2.0, 3.0):
+            self.push_change_event("attr", value)
+
+    @command
+    def send_spectrum_events(self):
+        for value in (1.0, 2.0, 3.0):
+            self.push_change_event("spectrum", np.full(8, value))
+
     @command
     def send_data_ready_event(self):
         self.push_data_ready_event("attr", 2)
@@ -127,6 +144,34 @@ def test_subscribe_change_event(event_device):
     event_device.unsubscribe_event(eid_change)
 
 
+def test_event_value_into(event_device):
+    buffer = np.empty(8)
+    results = []
+    ring = AttributeRingBuffer(2, (8,), np.float64)
+
+    def callback(evt):
+        if not evt.err:
+            results.append(evt.attr_value.value_into(buffer) is buffer)
+            ring.push_event(evt)
+
+    eid = event_device.subscribe_event(
+        "spectrum", EventType.CHANGE_EVENT, callback, wait=True
+    )
+    event_device.command_inout("send_spectrum_events", wait=True)
+    for retry_count in range(MAX_RETRIES):
+        if len(results) > 3:
+            break
+        time.sleep(DELAY_PER_RETRY)
+    else:
+        pytest.fail("Timeout, waiting for the spectrum events")
+    event_device.unsubscribe_event(eid)
+    # the initial value, then the pushed ones
+    assert results == [True] * 4
+    assert_array_equal(buffer, np.full(8, 3.0))
+    assert ring.count == 4
+    assert_array_equal(ring.values(), [np.full(8, 2.0), np.full(8, 3.0)])
+
+
 def test_subscribe_data_ready_event(event_device):
     results_data_ready_event = []
 
@@ -345,3 +390,138 @@ def test_subscribe_change_event_from_user_thread(event_device):
         )
     # Test the event values
     assert results == [0.0, 1.0]
+
+
+@pytest.mark.parametrize("coalesce", [False, True])
+def test_subscribe_event_batch(event_device, coalesce):
+    batches = []
+
+    def callback(events):
+        batches.append([evt.attr_value.value for evt in events])
+
+    eid = event_device.subscribe_event_batch(
+        "attr",
+        EventType.CHANGE_EVENT,
+        callback,
+        max_batch=2,
+        max_latency=0.2,
+        coalesce=coalesce,
+        wait=True,
+    )
+    event_device.command_inout("send_change_events", wait=True)
+    for retry_count in range(MAX_RETRIES):
+        event_device.read_attribute("state", wait=True)
+        values = [value for batch in batches for value in batch]
+        if values and values[-1] == 3.0:
+            break
+        time.sleep(DELAY_PER_RETRY)
+    if retry_count + 1 >= MAX_RETRIES:
+        timeout_seconds = retry_count * DELAY_PER_RETRY
+        pytest.fail(
+            f"Timeout, waiting for event, after {timeout_seconds}sec over {MAX_RETRIES} retries. Occasionally happens, probably due to CI test runtime environment"
+        )
+    stats = event_device.get_event_batch_statistics(eid)
+    event_device.unsubscribe_event(eid)
+    assert all(len(batch) <= 2 for batch in batches)
+    assert stats["received"] == 4
+    assert stats["dispatched"] == len(values)
+    assert stats["received"] == stats["dispatched"] + stats["coalesced"]
+    if coalesce:
+        assert values == sorted(set(values))
+    else:
+        assert values == [0.0, 1.0, 2.0, 3.0]
+
+
+def test_events_iterator(event_device):
+    with event_device.events("attr", EventType.CHANGE_EVENT) as events:
+        assert events.get(timeout=5).attr_value.value == 0.0
+        event_device.command_inout("send_change_event", wait=True)
+        assert next(events).attr_value.value == 1.0
+    assert events.closed
+    assert list(events) == []
+
+
+@pytest.mark.parametrize("policy", ["drop_oldest", "drop_newest"])
+def test_events_iterator_drop_policy(event_device, policy):
+    events = event_device.events(
+        "attr", EventType.CHANGE_EVENT, maxsize=1, policy=policy
+    )
+    with events:
+        event_device.command_inout("send_change_events", wait=True)
+        for retry_count in range(MAX_RETRIES):
+            if events.dropped == 3:
+                break
+            time.sleep(DELAY_PER_RETRY)
+        assert events.qsize() == 1
+        expected = 3.0 if policy == "drop_oldest" else 0.0
+        assert events.get(timeout=5).attr_value.value == expected
+
+
+def test_events_async_iterator():
+    import asyncio
+
+    context = DeviceTestContext(EventDevice, host="127.0.0.1", process=True)
+
+    async def run(proxy):
+        values = []
+        async with proxy.events("attr", EventType.CHANGE_EVENT) as events:
+            async for evt in events:
+                values.append(evt.attr_value.value)
+                if len(values) == 1:
+                    await proxy.command_inout("send_change_events")
+                elif len(values) == 4:
+                    break
+        return values
+
+    with context:
+        loop = asyncio.get_event_loop()
+        proxy = asyncio_DeviceProxy(context.get_device_access(), wait=True)
+        values = loop.run_until_complete(run(proxy))
+    assert values == [0.0, 1.0, 2.0, 3.0]
+
+
+def test_events_async_iterator_cancelled(event_device):
+    import asyncio
+
+    async def run(events):
+        assert (await events.__anext__()).attr_value.value == 0.0
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(events.__anext__(), 0.1)
+
+    with event_device.events("attr", EventType.CHANGE_EVENT) as events:
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(run(events))
+        finally:
+            loop.close()
+        assert events._waiters == []
+
+
+def test_events_async_iterator_subscribes_once():
+    import asyncio
+
+    context = DeviceTestContext(EventDevice, host="127.0.0.1", process=True)
+
+    async def first_event(events):
+        return (await events.__anext__()).attr_value.value
+
+    async def run(events):
+        # the consumers start together
+        return await asyncio.gather(*(first_event(events) for _ in range(4)))
+
+    with context:
+        proxy = DeviceProxy(context.get_device_access())
+        events = proxy.events("attr", EventType.CHANGE_EVENT)
+        loop = asyncio.new_event_loop()
+        try:
+            task = loop.create_task(run(events))
+            loop.run_until_complete(asyncio.sleep(0.5))
+            subscriptions = len(proxy._subscribed_events)
+            proxy.command_inout("send_change_events")
+            values = loop.run_until_complete(asyncio.wait_for(task, 5))
+        finally:
+            events.close()
+            loop.close()
+    assert subscriptions == 1
+    # a single initial event, then the pushed ones
+    assert sorted(values) == [0.0, 1.0, 2.0, 3.0]
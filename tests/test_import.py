@@ -0,0 +1,209 @@
+"""Tests of the import of the tango package, each one run in a new
+interpreter"""
+
+import os
+import sys
+import textwrap
+import subprocess
+
+
+def run_python(code, **env):
+    environ = dict(os.environ)
+    environ.update(env)
+    code = textwrap.dedent(code)
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        env=environ,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+    )
+    assert proc.returncode == 0, proc.stdout
+    return proc.stdout
+
+
+def test_docs_are_set_on_first_class_doc_access():
+    run_python(
+        """
+        import tango
+
+        assert "high level Tango object" in tango.Database.__doc__
+        method_doc = tango.Database.write_filedatabase.__doc__
+        assert "Force a write to the file" in method_doc
+        """
+    )
+
+
+def test_docs_are_set_on_first_method_access():
+    run_python(
+        """
+        import pydoc
+        import tango
+
+        method_doc = tango.Database.write_filedatabase.__doc__
+        assert "Force a write to the file" in method_doc
+        method_doc = pydoc.render_doc(tango.DeviceProxy.read_attribute)
+        assert "Read a single attribute" in method_doc
+        """
+    )
+
+
+def test_method_calls_do_not_load_docs():
+    run_python(
+        """
+        import inspect
+        import tango
+        from tango.utils import _LazyDoc
+
+        now = tango.TimeVal.now()
+        assert now.totime() > 0
+        assert isinstance(vars(tango.TimeVal)["__doc__"], _LazyDoc)
+
+        assert "float representing this time" in inspect.getdoc(now.totime)
+        assert not isinstance(vars(tango.TimeVal)["__doc__"], _LazyDoc)
+        """
+    )
+
+
+def test_docs_are_set_one_class_at_a_time():
+    run_python(
+        """
+        import tango
+        from tango.utils import _LazyDoc
+
+        assert "high level Tango object" in tango.Database.__doc__
+        assert isinstance(vars(tango.DeviceProxy)["__doc__"], _LazyDoc)
+        assert isinstance(vars(tango.DeviceData)["__doc__"], _LazyDoc)
+
+        assert "Read a single attribute" in tango.DeviceProxy.read_attribute.__doc__
+        assert isinstance(vars(tango.DeviceData)["__doc__"], _LazyDoc)
+        """
+    )
+
+
+def import_time(lazy_doc):
+    code = """
+        import time
+        start = time.perf_counter()
+        import tango
+        tango.DeviceData().is_empty()
+        print(time.perf_counter() - start)
+        """
+    return min(float(run_python(code, PYTANGO_LAZY_DOC=lazy_doc)) for _ in range(5))
+
+
+def test_lazy_docs_make_the_import_faster():
+    # see tests/benchmark_import.py for the detailed numbers
+    assert import_time("1") < import_time("0")
+
+
+def import_rss(lazy_doc, access):
+    code = f"""
+        import resource
+        import tango
+        {access}
+        print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+        """
+    return int(run_python(code, PYTANGO_LAZY_DOC=lazy_doc))
+
+
+def test_client_import_rss_target():
+    # RSS_TARGET of tests/benchmark_import.py: the baseline is the import
+    # of the server API with the docstrings set at import time
+    baseline = import_rss("0", "tango.server")
+    assert import_rss("1", "tango.DeviceProxy") <= 0.95 * baseline
+
+
+def test_load_docs():
+    run_python(
+        """
+        import tango
+        from tango.server import Device
+        from tango.utils import load_docs
+
+        load_docs()
+        assert "Force a write to the file" in tango.Database.write_filedatabase.__doc__
+        assert "documentation of DeviceProxy" in tango.AttributeProxy.read.__doc__
+        assert Device.delete_device.__doc__
+        """
+    )
+
+
+def test_docs_are_set_at_import_when_not_lazy():
+    run_python(
+        """
+        import tango
+
+        method_doc = tango.Database.write_filedatabase.__doc__
+        assert "Force a write to the file" in method_doc
+        """,
+        PYTANGO_LAZY_DOC="0",
+    )
+
+
+def test_client_import_does_not_load_the_server_api():
+    run_python(
+        """
+        import sys
+        import tango
+
+        lazy_modules = {
+            "tango.server",
+            "tango.device_server",
+            "tango.device_class",
+            "tango.pyutil",
+            "tango.group",
+            "tango.encoded_attribute",
+        }
+        assert not lazy_modules & set(sys.modules)
+        tango.DeviceProxy, tango.Database, tango.AttributeProxy
+        assert not lazy_modules & set(sys.modules)
+
+        assert "DeviceImpl" in dir(tango)
+        assert hasattr(tango.DeviceImpl, "get_device_properties")
+        assert "tango.device_server" in sys.modules
+        assert tango.Util.instance
+        assert tango.Group("test").get_name() == "test"
+        assert tango.EncodedAttribute().encode_gray8
+        """
+    )
+
+
+def test_server_import_initializes_the_server_api():
+    run_python(
+        """
+        from tango._tango import DeviceImpl
+        from tango.server import Device
+
+        assert hasattr(DeviceImpl, "get_device_properties")
+        """
+    )
+
+
+def test_direct_imports_initialize_the_server_api():
+    run_python(
+        """
+        from tango._tango import DeviceImpl
+        import tango.device_server
+
+        assert hasattr(DeviceImpl, "get_device_properties")
+        """
+    )
+    run_python(
+        """
+        from tango._tango import DeviceClass
+        import tango.device_class
+
+        assert hasattr(DeviceClass, "get_device_creation_times")
+        """
+    )
+    run_python(
+        """
+        from tango._tango import DeviceImpl
+
+        class TestDevice(DeviceImpl):
+            pass
+
+        assert hasattr(TestDevice, "get_device_properties")
+        """
+    )
@@ -1,11 +1,15 @@
 import os
 import sys
+import json
+import asyncio  # noqa: F401 used by the exec'd device code
 import textwrap
 import threading
 import time
 import enum
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
+from numpy.testing import assert_array_equal
 import pytest
 
 from tango import (
@@ -23,9 +27,12 @@ from tango import (
     DevEnum,
     DevState,
     DevVoid,
+    EncodedAttribute,
+    EventType,
     Device_4Impl,
     Device_5Impl,
     DeviceClass,
+    DeviceProxy,
     GreenMode,
     LatestDeviceImpl,
     ExtractAs,
@@ -33,6 +40,8 @@ from tango import (
     SCALAR,
     SPECTRUM,
     CmdArgType,
+    Database,
+    Except,
 )
 from tango.green import get_executor
 from tango.server import BaseDevice, Device
@@ -47,6 +56,7 @@ from tango.test_utils import (
 )
 from tango.test_utils import assert_close, general_decorator, DEVICE_SERVER_ARGUMENTS
 from tango.utils import (
+    AttributeRingBuffer,
     EnumTypeError,
     FROM_TANGO_TO_NUMPY_TYPE,
     TO_TANGO_TYPE,
@@ -990,6 +1000,453 @@ def test_wrong_attribute_read(server_green_mode):
             proxy.attr_str_list_err
 
 
+def test_read_attribute_chunks(server_green_mode):
+    spectrum = np.arange(1000, dtype=np.float64)
+    image = np.arange(600, dtype=np.uint16).reshape(20, 30)
+
+    class TestDevice(Device):
+        green_mode = server_green_mode
+
+        @attribute(dtype=(float,), max_dim_x=1000, chunked=True)
+        def spectrum(self):
+            return spectrum
+
+        @attribute(dtype=((np.uint16,),), max_dim_x=30, max_dim_y=20, chunked=True)
+        def image(self):
+            return image
+
+        @attribute(dtype=(float,), max_dim_x=10)
+        def not_chunked(self):
+            return [1.0]
+
+    with DeviceTestContext(TestDevice) as proxy:
+        assert_array_equal(proxy.spectrum, spectrum)
+        chunks = list(proxy.read_attribute_chunks("spectrum", chunk_elems=300))
+        assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+        assert_array_equal(np.concatenate(chunks), spectrum)
+
+        # images are read in whole rows
+        chunks = list(proxy.read_attribute_chunks("image", chunk_elems=100))
+        assert [chunk.shape for chunk in chunks] == [(3, 30)] * 6 + [(2, 30)]
+        assert_array_equal(np.concatenate(chunks), image)
+        chunks = list(proxy.read_attribute_chunks("image", chunk_elems=1))
+        assert len(chunks) == 20
+        assert_array_equal(np.concatenate(chunks), image)
+
+        with pytest.raises(DevFailed):
+            next(proxy.read_attribute_chunks("not_chunked"))
+        with pytest.raises(ValueError):
+            next(proxy.read_attribute_chunks("spectrum", chunk_elems=0))
+
+
+def test_read_attribute_chunks_of_concurrent_readers():
+    spectrum = np.arange(1000, dtype=np.float64)
+
+    class TestDevice(Device):
+        @attribute(dtype=(float,), max_dim_x=1000, chunked=True)
+        def spectrum(self):
+            return spectrum
+
+    context = DeviceTestContext(TestDevice)
+    with context as proxy:
+        # more readers than max_chunked_reads, each with its own proxy:
+        # the snapshots are kept per client
+        readers = [
+            DeviceProxy(context.get_device_access()).read_attribute_chunks(
+                "spectrum", chunk_elems=300
+            )
+            for _ in range(BaseDevice.max_chunked_reads + 2)
+        ]
+        firsts = [next(reader) for reader in readers]
+        for first, reader in zip(firsts, readers):
+            assert_array_equal(np.concatenate([first] + list(reader)), spectrum)
+
+        # a client starting too many reads loses its oldest one
+        readers = [
+            proxy.read_attribute_chunks("spectrum", chunk_elems=300)
+            for _ in range(BaseDevice.max_chunked_reads + 1)
+        ]
+        firsts = [next(reader) for reader in readers]
+        with pytest.raises(DevFailed):
+            list(readers[0])
+        for first, reader in zip(firsts[1:], readers[1:]):
+            assert_array_equal(np.concatenate([first] + list(reader)), spectrum)
+
+        # in threads
+        def read_chunks(_):
+            client = DeviceProxy(context.get_device_access())
+            return np.concatenate(list(client.read_attribute_chunks("spectrum", 100)))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for value in pool.map(read_chunks, range(16)):
+                assert_array_equal(value, spectrum)
+
+
+def test_read_attribute_chunks_asyncio():
+    from tango.asyncio import DeviceProxy as asyncio_DeviceProxy
+    from tango.green import get_object_executor
+
+    spectrum = np.arange(1000, dtype=np.float64)
+
+    class TestDevice(Device):
+        @attribute(dtype=(float,), max_dim_x=1000, chunked=True)
+        def spectrum(self):
+            return spectrum
+
+    context = DeviceTestContext(TestDevice, host="127.0.0.1")
+    with context:
+        proxy = asyncio_DeviceProxy(context.get_device_access(), wait=True)
+        loop = get_object_executor(proxy).loop
+
+        async def read_chunks():
+            chunks = proxy.read_attribute_chunks("spectrum", chunk_elems=300)
+            return [chunk async for chunk in chunks]
+
+        chunks = loop.run_until_complete(read_chunks())
+        assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+        assert_array_equal(np.concatenate(chunks), spectrum)
+
+
+def test_read_attribute_chunks_checks_read_method(server_green_mode):
+    spectrum = np.arange(10, dtype=np.float64)
+
+    class TestDevice(Device):
+        green_mode = server_green_mode
+        allowed = True
+
+        @attribute(dtype=(float,), max_dim_x=10, chunked=True)
+        def spectrum(self):
+            return spectrum
+
+        def is_spectrum_allowed(self, req_type):
+            return self.allowed
+
+        @attribute(dtype=(float,), max_dim_x=10, chunked=True)
+        def with_quality(self):
+            return spectrum, time.time(), AttrQuality.ATTR_VALID
+
+        @attribute(dtype=(float,), max_dim_x=10, chunked=True)
+        def no_value(self):
+            pass
+
+        @command
+        def forbid(self):
+            self.allowed = False
+
+    with DeviceTestContext(TestDevice) as proxy:
+        chunks = list(proxy.read_attribute_chunks("with_quality", chunk_elems=4))
+        assert_array_equal(np.concatenate(chunks), spectrum)
+        with pytest.raises(DevFailed, match="set_value"):
+            next(proxy.read_attribute_chunks("no_value"))
+        proxy.forbid()
+        with pytest.raises(DevFailed, match="API_AttrNotAllowed"):
+            next(proxy.read_attribute_chunks("spectrum"))
+
+
+def test_chunked_attribute_must_be_numerical_array():
+    with pytest.raises(TypeError):
+        attribute(dtype=float, chunked=True)
+    with pytest.raises(TypeError):
+        attribute(dtype=(str,), chunked=True)
+
+
+def test_read_attribute_into(server_green_mode):
+    class TestDevice(Device):
+        green_mode = server_green_mode
+
+        def init_device(self):
+            super().init_device()
+            self.count = 0
+
+        @attribute(dtype=(float,), max_dim_x=100)
+        def spectrum(self):
+            self.count += 1
+            return np.full(100, self.count, dtype=np.float64)
+
+        @attribute(dtype=((np.int32,),), max_dim_x=4, max_dim_y=3)
+        def image(self):
+            return np.arange(12, dtype=np.int32).reshape(3, 4)
+
+    with DeviceTestContext(TestDevice) as proxy:
+        out = np.empty(100, dtype=np.float64)
+        dev_attr = proxy.read_attribute_into("spectrum", out)
+        assert dev_attr.value is out
+        assert_array_equal(out, 1.0)
+        proxy.read_attribute_into("spectrum", out)
+        assert_array_equal(out, 2.0)
+
+        out = np.empty((3, 4), dtype=np.int32)
+        proxy.read_attribute_into("image", out)
+        assert_array_equal(out, np.arange(12).reshape(3, 4))
+
+        with pytest.raises(TypeError):
+            proxy.read_attribute_into("image", np.empty((3, 4), dtype=np.float64))
+        with pytest.raises(ValueError):
+            proxy.read_attribute_into("image", np.empty(12, dtype=np.int32))
+
+        ring = AttributeRingBuffer(2, (100,), np.float64)
+        for _ in range(3):
+            ring.read_attribute(proxy, "spectrum")
+        assert len(ring) == 2
+        assert ring.count == 3
+        assert_array_equal(ring.values()[:, 0], [4.0, 5.0])
+        assert_array_equal(ring.latest(), 5.0)
+
+
+def test_concurrent_attribute_reads(server_green_mode):
+    allowed_calls = []
+
+    class TestDevice(Device):
+        green_mode = server_green_mode
+        max_concurrent_reads = 4
+
+        def is_slow1_allowed(self, req_type):
+            allowed_calls.append(req_type)
+            return True
+
+        slow1 = attribute(fget="read_slow")
+        slow2 = attribute(fget="read_slow")
+        slow3 = attribute(fget="read_slow")
+        slow4 = attribute(fget="read_slow")
+        fail = attribute(fget="read_fail")
+
+        synchronous_code = textwrap.dedent(
+            """\
+            def read_slow(self):
+                time.sleep(0.3)
+                return 1.5
+
+            def read_fail(self):
+                time.sleep(0.3)
+                raise RuntimeError("hardware failure")
+            """
+        )
+
+        asynchronous_code = synchronous_code.replace("def ", "async def ").replace(
+            "time.sleep", "await asyncio.sleep"
+        )
+
+        if server_green_mode != GreenMode.Asyncio:
+            exec(synchronous_code)
+        else:
+            exec(asynchronous_code)
+
+    with DeviceTestContext(TestDevice) as proxy:
+        names = ["slow1", "slow2", "slow3", "slow4", "fail"]
+        start = time.time()
+        reply = proxy.read_attributes(names)
+        duration = time.time() - start
+        assert [attr.value for attr in reply[:4]] == [1.5] * 4
+        assert reply[4].has_failed
+        # not called again by Tango after the concurrent reads
+        assert len(allowed_calls) == 1
+        if server_green_mode != GreenMode.Gevent:
+            # 5 reads of 0.3 s with at most 4 at the same time
+            assert duration < 1.0
+        # in Gevent green mode the gevent event loop executes the read
+        # methods: the blocking time.sleep ones run one after the other
+        # a single attribute is read as usual
+        assert proxy.slow1 == 1.5
+
+
+def test_concurrent_attribute_reads_push_events():
+    threads = []
+
+    class TestDevice(Device):
+        max_concurrent_reads = 2
+
+        def init_device(self):
+            super().init_device()
+            self.lock = threading.Lock()
+            self.count = 0
+            self.set_change_event("counter", True, False)
+
+        @attribute(dtype=int)
+        def counter(self):
+            return self.count
+
+        @attribute(dtype=int)
+        def first(self):
+            return self.increment()
+
+        @attribute(dtype=int)
+        def second(self):
+            return self.increment()
+
+        def increment(self):
+            threads.append(threading.current_thread().name)
+            with self.lock:
+                self.count += 1
+                self.push_change_event("counter", self.count)
+                return self.count
+
+    with DeviceTestContext(TestDevice) as proxy:
+        values = []
+
+        def callback(evt):
+            if not evt.err:
+                values.append(evt.attr_value.value)
+
+        eid = proxy.subscribe_event("counter", EventType.CHANGE_EVENT, callback)
+        try:
+            reply = proxy.read_attributes(["first", "second"])
+            assert sorted(attr.value for attr in reply) == [1, 2]
+            for _ in range(100):
+                if len(values) == 3:
+                    break
+                time.sleep(0.05)
+            assert sorted(values) == [0, 1, 2]
+        finally:
+            proxy.unsubscribe_event(eid)
+        # pushed from the threads of the read pool
+        assert all(name.startswith("PyTangoRead") for name in threads)
+
+
+def test_concurrent_device_creation(server_green_mode):
+    class TestDevice(Device):
+        green_mode = server_green_mode
+        max_concurrent_inits = 4
+
+        synchronous_code = textwrap.dedent(
+            """\
+            def init_device(self):
+                self.init_start = time.time()
+                Device.init_device(self)
+                # the last devices of the list are created first
+                index = int(self.get_name().rsplit("/", 1)[-1])
+                time.sleep(0.3 + 0.1 * (3 - index))
+                self.init_end = time.time()
+            """
+        )
+
+        asynchronous_code = synchronous_code.replace("def ", "async def ").replace(
+            "time.sleep", "await asyncio.sleep"
+        )
+
+        if server_green_mode != GreenMode.Asyncio:
+            exec(synchronous_code)
+        else:
+            exec(asynchronous_code)
+
+        @attribute(dtype=(float,), max_dim_x=2)
+        def init_period(self):
+            return [self.init_start, self.init_end]
+
+        @command(dtype_out=str)
+        def get_creation_times(self):
+            return json.dumps(self.get_device_class().get_device_creation_times())
+
+        @command(dtype_out=(str,))
+        def get_class_devices(self):
+            return [dev.get_name() for dev in self.get_device_class().get_device_list()]
+
+    names = [f"test/init/{index}" for index in range(4)]
+    devices_info = ({"class": TestDevice, "devices": [{"name": n} for n in names]},)
+
+    with MultiDeviceTestContext(devices_info) as context:
+        periods = [context.get_device(name).init_period for name in names]
+        times = json.loads(context.get_device(names[0]).get_creation_times())
+        assert sorted(times) == names
+        assert all(duration >= 0.3 for duration in times.values())
+        # added to the class in the device list order
+        class_devices = context.get_device(names[0]).get_class_devices()
+        assert [name.lower() for name in class_devices] == names
+        if server_green_mode != GreenMode.Gevent:
+            # the 4 init_device ran at the same time
+            assert max(start for start, _ in periods) < min(end for _, end in periods)
+
+
+def test_concurrent_device_creation_failure():
+    deleted = []
+
+    class TestDevice(Device):
+        max_concurrent_inits = 4
+
+        def init_device(self):
+            Device.init_device(self)
+            if self.get_name().endswith("/0"):
+                raise RuntimeError("hardware failure")
+            time.sleep(0.1)
+
+        def delete_device(self):
+            deleted.append(self.get_name())
+
+    names = [f"test/init/{index}" for index in range(4)]
+    devices_info = ({"class": TestDevice, "devices": [{"name": n} for n in names]},)
+
+    with pytest.raises(Exception):
+        with MultiDeviceTestContext(devices_info):
+            pass
+    # the devices created concurrently with the failing one are deleted
+    assert sorted(deleted) == names[1:]
+
+
+def test_zero_copy_attribute(server_green_mode):
+    class TestDevice(Device):
+        green_mode = server_green_mode
+
+        def init_device(self):
+            super().init_device()
+            self.index = 0
+            self.set_change_event("image", True, False)
+
+        @attribute(dtype=((np.uint16,),), max_dim_x=64, max_dim_y=64, zero_copy=True)
+        def image(self):
+            self.index += 1
+            return np.full((32, 64), self.index, dtype=np.uint16)
+
+        @attribute(dtype=(np.float64,), max_dim_x=100, zero_copy=True)
+        def spectrum(self):
+            # not C contiguous: copied
+            return np.arange(200, dtype=np.float64)[::2]
+
+        @attribute(dtype=(np.int32,), max_dim_x=100, zero_copy=True)
+        def converted(self):
+            # not of the attribute type: copied
+            return np.arange(10, dtype=np.int64)
+
+        @command(dtype_out=(bool,))
+        def zero_copy_modes(self):
+            return [
+                self.get_device_attr().get_attr_by_name(name).is_zero_copy()
+                for name in ("image", "spectrum", "state")
+            ]
+
+        @command(dtype_out=int)
+        def pinned_arrays(self):
+            return len(self.__dict__.get("_zero_copy_arrays", {}))
+
+        @command(dtype_out=bool)
+        def push_image(self):
+            self.push_change_event("image", np.zeros((32, 64), dtype=np.uint16))
+            # the event has been sent: its array is released
+            key = ("image", threading.get_ident())
+            return key in self.__dict__.get("_zero_copy_arrays", {})
+
+    context = DeviceTestContext(TestDevice)
+    with context as proxy:
+        assert list(proxy.zero_copy_modes()) == [True, True, False]
+        for index in (1, 2, 3):
+            assert_array_equal(proxy.image, np.full((32, 64), index))
+        assert_array_equal(proxy.spectrum, np.arange(0, 200, 2))
+        assert_array_equal(proxy.converted, np.arange(10))
+        # only the image array is kept, at most once per thread which read
+        # it, until the thread starts its next request
+        assert proxy.pinned_arrays() <= 3
+        assert not proxy.push_image()
+
+        # concurrent replies do not release the array of one another
+        def read_images():
+            client = DeviceProxy(context.get_device_access())
+            for _ in range(20):
+                image = client.image
+                assert (image == image[0, 0]).all()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for future in [pool.submit(read_images) for _ in range(4)]:
+                future.result()
+
+
 def test_attribute_access_with_default_method_names(server_green_mode):
     class TestDevice(Device):
         green_mode = server_green_mode
@@ -2551,6 +3008,115 @@ def test_mandatory_device_property_without_db_value_fails(
     assert "Device property prop is mandatory" in str(context.value)
 
 
+def test_device_properties_of_several_devices(server_green_mode):
+    class TestDevice(Device):
+        green_mode = server_green_mode
+
+        prop = device_property(dtype=str, default_value="default")
+        values = device_property(dtype=(int,), default_value=[1, 2])
+
+        @command(dtype_out=str)
+        def get_prop(self):
+            return self.prop
+
+        @command(dtype_out=(int,))
+        def get_values(self):
+            self.values.append(0)
+            return self.values
+
+    devices_info = (
+        {
+            "class": TestDevice,
+            "devices": [
+                {"name": "test/prop/1", "properties": {"prop": "one"}},
+                {"name": "test/prop/2", "properties": {"values": [3]}},
+                {"name": "test/prop/3"},
+            ],
+        },
+    )
+
+    with MultiDeviceTestContext(devices_info) as context:
+        dev1 = context.get_device("test/prop/1")
+        dev2 = context.get_device("test/prop/2")
+        dev3 = context.get_device("test/prop/3")
+        assert dev1.get_prop() == "one"
+        assert dev2.get_prop() == "default"
+        assert dev3.get_prop() == "default"
+        assert list(dev1.get_values()) == [1, 2, 0]
+        assert list(dev2.get_values()) == [3, 0]
+        # default values are not shared between devices
+        assert list(dev3.get_values()) == [1, 2, 0]
+
+
+class PropertyDevice(Device):
+    prop = device_property(dtype=str, default_value="default")
+
+    @command(dtype_out=str)
+    def get_prop(self):
+        return self.prop
+
+
+PROPERTY_DEVICES_INFO = (
+    {
+        "class": PropertyDevice,
+        "devices": [
+            {"name": "test/prop/1", "properties": {"prop": "one"}},
+            {"name": "test/prop/2", "properties": {"prop": "two"}},
+            {"name": "test/prop/3"},
+        ],
+    },
+)
+
+
+def test_device_properties_are_fetched_in_one_database_call(monkeypatch):
+    bulk_calls = []
+    device_calls = []
+    get_device_property = Database.get_device_property
+
+    def get_device_property_bulk(self, dev_names, props=None):
+        bulk_calls.append(sorted(dev_names))
+        # not counted: the file database of the test context may not have
+        # the bulk command
+        return {name: get_device_property(self, name, props) for name in dev_names}
+
+    def counting_get_device_property(self, dev_name, *args, **kwargs):
+        device_calls.append(dev_name)
+        return get_device_property(self, dev_name, *args, **kwargs)
+
+    monkeypatch.setattr(Database, "get_device_property_bulk", get_device_property_bulk)
+    monkeypatch.setattr(Database, "get_device_property", counting_get_device_property)
+    with MultiDeviceTestContext(PROPERTY_DEVICES_INFO) as context:
+        values = [context.get_device(f"test/prop/{i}").get_prop() for i in (1, 2, 3)]
+    assert values == ["one", "two", "default"]
+    assert bulk_calls == [["test/prop/1", "test/prop/2", "test/prop/3"]]
+    assert device_calls == []
+
+
+def test_device_properties_without_the_bulk_database_command(monkeypatch):
+    device_calls = []
+    get_device_property = Database.get_device_property
+    command_inout = Database.command_inout
+
+    def old_command_inout(self, name, *args, **kwargs):
+        if name == "DbGetDevicePropertyBulk":
+            Except.throw_exception(
+                "API_CommandNotFound", f"Command {name} not found", "command_inout"
+            )
+        return command_inout(self, name, *args, **kwargs)
+
+    def counting_get_device_property(self, dev_name, *args, **kwargs):
+        device_calls.append(dev_name)
+        return get_device_property(self, dev_name, *args, **kwargs)
+
+    monkeypatch.setattr(Database, "command_inout", old_command_inout)
+    monkeypatch.setattr(Database, "get_device_property", counting_get_device_property)
+    with MultiDeviceTestContext(PROPERTY_DEVICES_INFO) as context:
+        values = [context.get_device(f"test/prop/{i}").get_prop() for i in (1, 2, 3)]
+    assert values == ["one", "two", "default"]
+    # one call per device, by Database.get_device_property_bulk
+    assert sorted(device_calls) == ["test/prop/1", "test/prop/2", "test/prop/3"]
+
+
 def test_logging(server_green_mode):
     log_received = threading.Event()
 
@@ -2791,6 +3357,125 @@ def test_read_write_dev_encoded(server_green_mode):
         assert proxy.attr == ("uint8", b"\xd6\xd7")
 
 
+def test_read_dev_encoded_as_buffer():
+    class TestDevice(Device):
+        @attribute(dtype=DevEncoded)
+        def attr(self):
+            return "uint8", b"\xd2\xd3\xd4"
+
+        @attribute(dtype=DevEncoded)
+        def image(self):
+            # width and height (big endian), then the pixels
+            return "GRAY8", b"\x00\x03\x00\x02" + bytes(range(6))
+
+    with DeviceTestContext(TestDevice) as proxy:
+        value = proxy.read_attribute("attr", extract_as=ExtractAs.Buffer).value
+        assert value[0] == "uint8"
+        assert isinstance(value[1], np.ndarray)
+        assert value[1].dtype == np.uint8
+        assert value[1].tobytes() == b"\xd2\xd3\xd4"
+
+        da = proxy.read_attribute("image", extract_as=ExtractAs.Buffer)
+        image = EncodedAttribute().decode_gray8(da, extract_as=ExtractAs.Buffer)
+        assert image.base is not None
+        assert image.tolist() == [[0, 1, 2], [3, 4, 5]]
+
+
+def test_encode_jpeg_in_threads():
+    values = (0, 64, 128, 255)
+
+    def encode(value):
+        enc = EncodedAttribute()
+        enc.encode_jpeg_gray8(np.full((32, 48), value, dtype=np.uint8))
+        return enc
+
+    class TestDevice(Device):
+        def init_device(self):
+            super().init_device()
+            # the encoders release the GIL: encode the frames in parallel
+            with ThreadPoolExecutor(len(values)) as pool:
+                self.frames = list(pool.map(encode, values))
+            self.index = 0
+
+        @command(dtype_in=int)
+        def select(self, index):
+            self.index = index
+
+        @attribute(dtype=DevEncoded)
+        def jpeg(self):
+            return self.frames[self.index]
+
+    with DeviceTestContext(TestDevice) as proxy:
+        for index, value in enumerate(values):
+            proxy.select(index)
+            da = proxy.read_attribute("jpeg", extract_as=ExtractAs.Nothing)
+            image = EncodedAttribute().decode_gray8(da)
+            assert image.shape == (32, 48)
+            assert np.allclose(image, value, atol=2)
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lz4", "zstd"])
+def test_lossless_encoded_images(codec):
+    pytest.importorskip({"zlib": "zlib", "lz4": "lz4", "zstd": "zstandard"}[codec])
+    frames = [np.arange(120, dtype=np.uint16).reshape(10, 12) for _ in range(5)]
+    for index, frame in enumerate(frames):
+        frame[index, index] = 1000
+
+    class TestDevice(Device):
+        def init_device(self):
+            super().init_device()
+            self.enc = EncodedAttribute()
+            self.index = 0
+
+        @attribute(dtype=DevEncoded)
+        def raw(self):
+            return self.enc.encode_compressed(frames[0], codec=codec)
+
+        @attribute(dtype=DevEncoded)
+        def delta(self):
+            frame = frames[self.index % len(frames)]
+            self.index += 1
+            return self.enc.encode_delta(frame, codec=codec, keyframe_interval=3)
+
+    with DeviceTestContext(TestDevice) as proxy:
+        dec = EncodedAttribute()
+        raw = proxy.read_attribute("raw")
+        assert raw.value[0] == "RAW_" + codec.upper()
+        assert_array_equal(dec.decode_compressed(raw), frames[0])
+
+        sizes = []
+        for frame in frames:
+            delta = proxy.read_attribute("delta", extract_as=ExtractAs.Buffer)
+            sizes.append(len(delta.value[1]))
+            image = dec.decode_delta(delta)
+            assert image.dtype == frame.dtype
+            assert_array_equal(image, frame)
+        # keyframes at 0 and 3, differences in between
+        assert sizes[1] < sizes[0] and sizes[4] < sizes[3]
+
+        # a difference cannot be decoded without the previous frame
+        dec = EncodedAttribute()
+        with pytest.raises(ValueError):
+            dec.decode_delta(proxy.read_attribute("delta"))
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.float32, np.complex128, ">i8"])
+def test_lossless_encoded_image_dtypes(dtype):
+    frames = [np.full((4, 6), index, dtype=dtype) for index in range(3)]
+    enc, dec = EncodedAttribute(), EncodedAttribute()
+    for frame in frames:
+        image = dec.decode_delta(enc.encode_delta(frame))
+        assert image.dtype == frame.dtype
+        assert_array_equal(image, frame)
+        # the decoded image is not the reference of the next frame
+        image[...] = 0
+
+
+def test_lossless_encoded_image_unsupported_dtype():
+    with pytest.raises(TypeError):
+        EncodedAttribute().encode_compressed(np.zeros((2, 2), dtype=object))
+
+
 # Test Exception propagation
 
 